@@ -6,7 +6,9 @@
 """Package initialization."""
 
 __all__ = [
+    'cache_compression_demo', 
     'camera_demo', 
+    'chat_context_demo', 
     'internet_demo', 
     'recorder_demo', 
     'scheduler_demo', 
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: demo.components
+      @file: cache_compression_demo.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.cache_codec import read_text, write_text
+from askai.core.component.reply_store import ReplyStore
+from hspylib.core.tools.commons import human_readable_bytes
+from pathlib import Path
+from time import perf_counter
+
+import os
+import subprocess
+import sysconfig
+import tempfile
+
+# Number of cached replies written and read per run.
+REPLIES: int = 500
+
+
+def sample_output() -> str:
+    """Return a realistic large command output to be cached (a recursive directory listing)."""
+    listing = subprocess.run(["ls", "-laR", sysconfig.get_paths()["stdlib"]], capture_output=True, text=True)
+    return listing.stdout[: 256 * 1024]
+
+
+def readable(size: int) -> str:
+    """Return the size in a human-readable format."""
+    return " ".join(human_readable_bytes(size))
+
+
+def bench_store(work_dir: str, threshold: int, reply: str) -> tuple[float, float, int]:
+    """Write and read REPLIES entries into a reply store.
+    :return: The write and read latencies per entry (ms) and the database size in bytes.
+    """
+    db_file: Path = Path(work_dir, f"replies-{threshold}.db")
+    store = ReplyStore(db_file, threshold)
+    started = perf_counter()
+    for i in range(REPLIES):
+        store.put(f"question-{i}", f"{i}: {reply}", 10)
+    write_ms = (perf_counter() - started) * 1000 / REPLIES
+    started = perf_counter()
+    for i in range(REPLIES):
+        assert store.get(f"question-{i}") == f"{i}: {reply}"
+    read_ms = (perf_counter() - started) * 1000 / REPLIES
+    store.close()
+    return write_ms, read_ms, sum(f.stat().st_size for f in Path(work_dir).glob(f"{db_file.name}*"))
+
+
+def bench_file(work_dir: str, threshold: int, text: str) -> tuple[float, float, int]:
+    """Write and read a context history file.
+    :return: The write and read latencies (ms) and the file size in bytes.
+    """
+    ctx_file: Path = Path(work_dir, f"askai-context-history-{threshold}.txt")
+    started = perf_counter()
+    write_text(ctx_file, text, threshold)
+    write_ms = (perf_counter() - started) * 1000
+    started = perf_counter()
+    assert read_text(ctx_file) == text
+    read_ms = (perf_counter() - started) * 1000
+    return write_ms, read_ms, ctx_file.stat().st_size
+
+
+if __name__ == "__main__":
+    output: str = sample_output()
+    context: str = os.linesep.join(f"assistant: {output}" for _ in range(16))
+    print(f"Reply size: {readable(len(output))}  Context size: {readable(len(context))}\n")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, bench, payload in [("Reply store", bench_store, output), ("Context file", bench_file, context)]:
+            for label, threshold in [("plain", 0), ("compressed", 4096)]:
+                w, r, size = bench(tmp_dir, threshold, payload)
+                print(f"{name:<14}{label:<12} write: {w:8.3f}ms  read: {r:8.3f}ms  disk: {readable(size)}")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: demo.components
+      @file: chat_context_demo.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.support.chat_context import ChatContext
+from time import perf_counter
+
+# Number of entries pushed per run.
+PUSHES: int = 10_000
+
+
+def bench_push(window: int) -> tuple[float, float]:
+    """Push PUSHES entries into a context of the given window size, reading its length after each push.
+    :return: The average push and length latencies in microseconds.
+    """
+    context = ChatContext(token_limit=1024 * 1024, max_context_size=window)
+    push_secs, length_secs = 0.0, 0.0
+    for i in range(PUSHES):
+        started = perf_counter()
+        context.push("HISTORY", f"Message number {i}: {'lorem ipsum ' * 20}", "human" if i % 2 else "assistant")
+        push_secs += perf_counter() - started
+        started = perf_counter()
+        context.length("HISTORY")
+        length_secs += perf_counter() - started
+    return push_secs * 1e6 / PUSHES, length_secs * 1e6 / PUSHES
+
+
+def bench_stringify(window: int, calls: int = 10) -> float:
+    """Stringify the HISTORY context the number of times a single query does, after each push.
+    :return: The average latency, per push, of the stringify calls in microseconds.
+    """
+    context = ChatContext(token_limit=1024 * 1024, max_context_size=window)
+    started = perf_counter()
+    for i in range(1_000):
+        context.push("HISTORY", f"Message number {i}: {'lorem ipsum ' * 20}")
+        for _ in range(calls):
+            context.stringify("HISTORY")
+    return (perf_counter() - started) * 1e6 / 1_000
+
+
+if __name__ == "__main__":
+    print(f"ChatContext: {PUSHES} pushes per window size\n")
+    for size in [10, 100, 1_000, 10_000]:
+        push_us, length_us = bench_push(size)
+        print(f"window: {size:>6}  push: {push_us:8.2f}us  length: {length_us:8.2f}us")
+    print(f"\nChatContext: 1000 pushes, each followed by 10 stringify calls\n")
+    for size in [10, 50, 100]:
+        print(f"window: {size:>6}  push + stringify: {bench_stringify(size):8.2f}us")
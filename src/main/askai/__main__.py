@@ -113,7 +113,7 @@ class Main(TUIApplication):
             .option(
                 "engine", "e", "engine",
                 "Set which AI engine to use (if not provided, the default engine wil be used).",
-                choices=["openai", "gemini", "llama"],
+                choices=["openai", "gemini", "llama", "replay"],
                 nargs="?")\
             .option(
                 "model", "m", "model",
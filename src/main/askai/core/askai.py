@@ -18,7 +18,11 @@ from askai.core.askai_events import events
 from askai.core.askai_messages import msg
 from askai.core.askai_settings import settings
 from askai.core.commander.commander import ask_commander, RE_ASKAI_CMD
-from askai.core.component.cache_service import cache, CACHE_DIR
+from askai.core.component.cache_service import CACHE_DIR, ensure_dir
+from askai.core.component.context_compactor import compactor
+from askai.core.component.context_journal import context_journal
+from askai.core.component.long_term_memory import long_term_memory
+from askai.core.component.semantic_cache import semantic_cache
 from askai.core.engine.ai_engine import AIEngine
 from askai.core.enums.router_mode import RouterMode
 from askai.core.model.ai_reply import AIReply
@@ -71,16 +75,19 @@ class AskAi:
         configs.engine = engine_name
 
         self._session_id = now("%Y%m%d")[:8]
+        context_journal.open(self._session_id)
+        long_term_memory.open(self._session_id)
         self._engine: AIEngine = shared.create_engine(engine_name, model_name, mode)
-        self._context: ChatContext = shared.create_context(self._engine.ai_token_limit())
+        self._context: ChatContext = shared.create_context(
+            self._engine.ai_token_limit(), self._engine.ai_model_name()
+        )
+        compactor.attach(self._context)
         self._mode: RouterMode = shared.mode
         self._console_path = Path(f"{CACHE_DIR}/askai-{self.session_id}.md")
         self._query_prompt: str | None = None
+        self._reply_scope: str | None = None
         self._abort_count: int = 0
 
-        if not self._console_path.exists():
-            self._console_path.touch()
-
     def __str__(self) -> str:
         return shared.app_info
 
@@ -106,8 +113,14 @@ class AskAi:
 
     @property
     def console_path(self) -> Path:
+        ensure_dir(self._console_path.parent)
         return self._console_path
 
+    @property
+    def reply_scope(self) -> Optional[str]:
+        """Return the cache scope of the question being answered, or None when replies are keyed by question only."""
+        return self._reply_scope
+
     @property
     def session_id(self) -> str:
         return self._session_id
@@ -156,8 +169,9 @@ class AskAi:
                 )
                 ask_commander(args, standalone_mode=False)
                 return True, None
+            self._reply_scope = self._cache_scope()
             shared.context.push("HISTORY", question)
-            if not (output := cache.read_reply(question)):
+            if not (output := semantic_cache.read_reply(question, self._reply_scope)):
                 log.debug('Response not found for "%s" in cache. Querying from %s.', question, self.engine.nickname())
                 events.reply.emit(reply=AIReply.detailed(msg.wait()))
                 if output := processor.process(question, context=read_stdin(), query_prompt=self._query_prompt):
@@ -183,9 +197,19 @@ class AskAi:
             if output:
                 shared.context.push("HISTORY", output, "assistant")
                 shared.context.set("LAST_REPLY", output, "assistant")
+                long_term_memory.remember(question, output)
 
         return status, output
 
+    def _cache_scope(self) -> Optional[str]:
+        """Compute the reply cache scope from the router mode and the most recent conversation entries. This must be
+        called before the question is pushed into the context, so that the scope is the same when the reply is saved.
+        :return: The cache scope, or None if context-aware cache keys are disabled.
+        """
+        if (window := configs.cache_context_window) > 0:
+            return f"{self.mode.name}:{shared.context.digest('HISTORY', window)}"
+        return None
+
     def _create_console_file(self, overwrite: bool = True) -> None:
         """Create a Markdown-formatted console file.
         :param overwrite: Whether to overwrite the existing file if it already exists (default is True).
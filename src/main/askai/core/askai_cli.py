@@ -20,12 +20,15 @@ from askai.core.askai_messages import msg
 from askai.core.askai_prompt import prompt
 from askai.core.commander.commander import commands
 from askai.core.component.cache_service import cache, CACHE_DIR
+from askai.core.component.cache_warmup import warmup
 from askai.core.component.multimedia.audio_player import player
 from askai.core.component.multimedia.recorder import recorder
 from askai.core.component.scheduler import scheduler
+from askai.core.component.semantic_cache import semantic_cache
 from askai.core.enums.router_mode import RouterMode
 from askai.core.model.ai_reply import AIReply
 from askai.core.support.shared_instances import shared
+from askai.core.support.text_formatter import text_formatter
 from askai.core.support.utilities import display_text
 from askai.tui.app_icons import AppIcons
 from clitt.core.term.cursor import cursor
@@ -36,6 +39,7 @@ from hspylib.core.tools.commons import console_out
 from hspylib.core.zoned_datetime import now, TIME_FORMAT
 from hspylib.modules.eventbus.event import Event
 from pathlib import Path
+from rich.live import Live
 from rich.progress import Progress
 from textwrap import indent
 from threading import Thread
@@ -67,6 +71,9 @@ class AskAiCli(AskAi):
         self._ready: bool = False
         self._query_prompt: str | None = query_prompt
         self._query_string: str | None = query_string
+        self._stream: Live | None = None
+        self._stream_text: str = ""
+        self._streamed: str | None = None
         self._startup()
 
     def run(self) -> None:
@@ -75,12 +82,14 @@ class AskAiCli(AskAi):
         signal.signal(signal.SIGTERM, self.abort)  # Handle termination requests
         signal.signal(signal.SIGHUP, self.abort)  # Handle terminal hangup
         while question := (self._query_string or self._input()):
+            warmup.cancel()
             status, output = self.ask_and_reply(question)
             if not status:
                 question = None
                 break
             elif output:
-                cache.save_reply(question, output)
+                semantic_cache.save_reply(question, output, self.reply_scope)
+                warmup.record(question)
                 cache.save_input_history()
                 # FIXME This is only writing the final answer to the markdown file.
                 with open(self.console_path, "a+", encoding=Charset.UTF_8.val) as f_console:
@@ -97,7 +106,9 @@ class AskAiCli(AskAi):
         """Reply to the user with the AI-generated response.
         :param reply: The reply message to send as a reply to the user.
         """
-        if reply and (text := msg.translate(reply.message)):
+        if reply and self._streamed and reply.message == self._streamed:
+            self._streamed = None  # The reply was already displayed, as it was streamed.
+        elif reply and (text := msg.translate(reply.message)):
             log.debug(reply.message)
             if configs.is_speak and reply.is_speakable:
                 self.engine.text_to_speech(text, f"{shared.nickname}")
@@ -135,6 +146,23 @@ class AskAiCli(AskAi):
                         cursor.erase_line()
                     self._reply(reply)
 
+    def _cb_stream_event(self, ev: Event) -> None:
+        """Callback to handle reply stream events, displaying the reply as it's generated.
+        :param ev: The event object representing the stream event.
+        """
+        if ev.args.done:
+            if self._stream:
+                self._stream.update(text_formatter.markdown(f"{shared.nickname}{ev.args.text}"), refresh=True)
+                self._stream.stop()
+                self._stream = None
+            self._stream_text, self._streamed = "", ev.args.text
+        else:
+            if self._stream is None:
+                self._stream = Live(console=text_formatter.console, refresh_per_second=8)
+                self._stream.start()
+            self._stream_text += ev.args.text
+            self._stream.update(text_formatter.markdown(f"{shared.nickname}{self._stream_text}"))
+
     def _cb_mode_changed_event(self, ev: Event) -> None:
         """Callback to handle mode change events.
         :param ev: The event object representing the mode change.
@@ -171,6 +199,12 @@ class AskAiCli(AskAi):
             pause.milliseconds(interval)
         screen.clear()
 
+    def _pin_greetings(self) -> None:
+        """Pin the welcome and goodbye speech audio files, so they are never evicted from the audio cache."""
+        voice, audio_format = self.engine.configs().tts_voice, self.engine.configs().tts_format
+        for greeting in filter(None, [self.mode.welcome(), msg.goodbye()]):
+            cache.pin_audio(msg.translate(greeting), voice, audio_format)
+
     def _startup(self) -> None:
         """Initialize the application components."""
         progress: Progress = Progress()
@@ -186,6 +220,7 @@ class AskAiCli(AskAi):
         # Start and manage the progress bar
         askai_bus = AskAiEvents.bus(ASKAI_BUS_NAME)
         askai_bus.subscribe(REPLY_EVENT, self._cb_reply_event)
+        askai_bus.subscribe(STREAM_EVENT, self._cb_stream_event)
         if configs.is_interactive:
             splash_thread: Thread = Thread(daemon=True, target=self._splash)
             splash_thread.start()
@@ -199,6 +234,7 @@ class AskAiCli(AskAi):
                 KeyboardInput.preload_history(cache.load_input_history(commands()))
                 progress.update(task, advance=1, description=f'[green] {msg.t("Starting scheduler")}')
                 scheduler.start()
+                warmup.schedule(self.mode.processor, self._cache_scope)
                 progress.update(task, advance=1, description=f'[green] {msg.t("Setting up recorder")}')
                 recorder.setup()
                 progress.update(task, advance=1, description=f'[green] {msg.t("Starting player delay")}')
@@ -216,6 +252,8 @@ class AskAiCli(AskAi):
             nltk.download("averaged_perceptron_tagger", quiet=True, download_dir=CACHE_DIR)
             recorder.setup()
             player.start_delay()
+        if configs.is_speak:
+            self._pin_greetings()
         # Register the startup
         with open(self.console_path, "a+", encoding=Charset.UTF_8.val) as f_console:
             f_console.write(f"\n\n## {AppIcons.STARTED} {now(TIME_FORMAT)}\n\n")
@@ -49,6 +49,34 @@ class AskAiConfigs(metaclass=Singleton):
     def model(self, value: str) -> None:
         settings.put("askai.default.engine.model", value)
 
+    @property
+    def replay_cassette(self) -> str:
+        return settings.get("askai.replay.cassette")
+
+    @replay_cassette.setter
+    def replay_cassette(self, value: str) -> None:
+        settings.put("askai.replay.cassette", value)
+
+    @property
+    def is_replay_record(self) -> bool:
+        return settings.get_bool("askai.replay.record.enabled")
+
+    @is_replay_record.setter
+    def is_replay_record(self, value: bool) -> None:
+        settings.put("askai.replay.record.enabled", value)
+
+    @property
+    def is_replay_fallback(self) -> bool:
+        return settings.get_bool("askai.replay.fallback.enabled")
+
+    @is_replay_fallback.setter
+    def is_replay_fallback(self, value: bool) -> None:
+        settings.put("askai.replay.fallback.enabled", value)
+
+    @property
+    def replay_latency(self) -> str:
+        return settings.get("askai.replay.latency")
+
     @property
     def is_interactive(self) -> bool:
         return settings.get_bool("askai.interactive.enabled")
@@ -65,6 +93,14 @@ class AskAiConfigs(metaclass=Singleton):
     def is_speak(self, value: bool) -> None:
         settings.put("askai.speak.enabled", which("ffplay") and value)
 
+    @property
+    def is_stream_reply(self) -> bool:
+        return settings.get_bool("askai.reply.stream.enabled")
+
+    @is_stream_reply.setter
+    def is_stream_reply(self, value: bool) -> None:
+        settings.put("askai.reply.stream.enabled", value)
+
     @property
     def is_debug(self) -> bool:
         return settings.get_bool("askai.debug.enabled")
@@ -89,6 +125,42 @@ class AskAiConfigs(metaclass=Singleton):
     def is_keep_context(self, value: bool) -> None:
         settings.put("askai.context.keep.conversation", value)
 
+    @property
+    def is_context_compaction(self) -> bool:
+        return settings.get_bool("askai.context.compaction.enabled")
+
+    @is_context_compaction.setter
+    def is_context_compaction(self, value: bool) -> None:
+        settings.put("askai.context.compaction.enabled", value)
+
+    @property
+    def context_compaction_high_water(self) -> float:
+        return settings.get_float("askai.context.compaction.high.water")
+
+    @property
+    def context_compaction_model(self) -> str:
+        return settings.get("askai.context.compaction.model")
+
+    @property
+    def is_long_term_memory(self) -> bool:
+        return settings.get_bool("askai.context.long.term.enabled")
+
+    @is_long_term_memory.setter
+    def is_long_term_memory(self, value: bool) -> None:
+        settings.put("askai.context.long.term.enabled", value)
+
+    @property
+    def long_term_memory_top_k(self) -> int:
+        return settings.get_int("askai.context.long.term.top.k")
+
+    @property
+    def long_term_memory_max_tokens(self) -> int:
+        return settings.get_int("askai.context.long.term.max.tokens")
+
+    @property
+    def long_term_memory_window(self) -> int:
+        return settings.get_int("askai.context.long.term.window")
+
     @property
     def tempo(self) -> int:
         return settings.get_int("askai.text.to.speech.tempo")
@@ -105,6 +177,70 @@ class AskAiConfigs(metaclass=Singleton):
     def ttl(self, value: int) -> None:
         settings.put("askai.cache.ttl.minutes", value)
 
+    @property
+    def is_semantic_cache(self) -> bool:
+        return settings.get_bool("askai.cache.semantic.enabled")
+
+    @is_semantic_cache.setter
+    def is_semantic_cache(self, value: bool) -> None:
+        settings.put("askai.cache.semantic.enabled", value)
+
+    @property
+    def semantic_cache_threshold(self) -> float:
+        return settings.get_float("askai.cache.semantic.threshold")
+
+    @semantic_cache_threshold.setter
+    def semantic_cache_threshold(self, value: float) -> None:
+        settings.put("askai.cache.semantic.threshold", value)
+
+    @property
+    def audio_cache_max_size_mb(self) -> int:
+        return settings.get_int("askai.cache.audio.max.size.mb")
+
+    @audio_cache_max_size_mb.setter
+    def audio_cache_max_size_mb(self, value: int) -> None:
+        settings.put("askai.cache.audio.max.size.mb", value)
+
+    @property
+    def is_stage_cache(self) -> bool:
+        return settings.get_bool("askai.cache.stages.enabled")
+
+    @is_stage_cache.setter
+    def is_stage_cache(self, value: bool) -> None:
+        settings.put("askai.cache.stages.enabled", value)
+
+    @property
+    def cache_context_window(self) -> int:
+        return settings.get_int("askai.cache.context.window")
+
+    @cache_context_window.setter
+    def cache_context_window(self, value: int) -> None:
+        settings.put("askai.cache.context.window", value)
+
+    @property
+    def cache_compression_threshold(self) -> int:
+        return settings.get_int("askai.cache.compression.threshold")
+
+    @cache_compression_threshold.setter
+    def cache_compression_threshold(self, value: int) -> None:
+        settings.put("askai.cache.compression.threshold", value)
+
+    @property
+    def is_cache_warmup(self) -> bool:
+        return settings.get_bool("askai.cache.warmup.enabled")
+
+    @is_cache_warmup.setter
+    def is_cache_warmup(self, value: bool) -> None:
+        settings.put("askai.cache.warmup.enabled", value)
+
+    @property
+    def cache_warmup_max_questions(self) -> int:
+        return settings.get_int("askai.cache.warmup.max.questions")
+
+    @property
+    def cache_warmup_interval_secs(self) -> int:
+        return settings.get_int("askai.cache.warmup.interval.secs")
+
     @property
     def verbosity(self) -> Verbosity:
         return Verbosity.of_value(settings.get_int("askai.verbosity.level"))
@@ -24,6 +24,8 @@ ABORT_EVENT: str = "askai-abort-event"
 
 REPLY_EVENT: str = "askai-reply-event"
 
+STREAM_EVENT: str = "askai-stream-event"
+
 MIC_LISTENING_EVENT: str = "askai-mic-listening-event"
 
 DEVICE_CHANGED_EVENT: str = "askai-input-device-changed-event"
@@ -39,6 +41,7 @@ class AskAiEvents(Enumeration):
         ASKAI_BUS_NAME,
         abort=FluidEvent(ABORT_EVENT, message=None),
         reply=FluidEvent(REPLY_EVENT, erase_last=False),
+        stream=FluidEvent(STREAM_EVENT, text=None, done=False),
         listening=FluidEvent(MIC_LISTENING_EVENT, listening=True),
         device_changed=FluidEvent(DEVICE_CHANGED_EVENT, device=None),
         mode_changed=FluidEvent(MODE_CHANGED_EVENT, mode=None, sum_path=None, glob=None),
@@ -18,6 +18,7 @@ from askai.core.support.os_utils import get_os, get_shell, get_user, SupportedPl
 from askai.core.support.utilities import read_resource
 from functools import lru_cache
 from hspylib.core.metaclass.singleton import Singleton
+from hspylib.core.tools.text_tools import hash_text
 
 
 class AskAiPrompt(metaclass=Singleton):
@@ -58,6 +59,15 @@ class AskAiPrompt(metaclass=Singleton):
         """
         return read_resource(prompt_dir or self.PROMPT_DIR, template_file)
 
+    @lru_cache
+    def version(self, template_file: str, prompt_dir: str = None) -> str:
+        """Return the version of a processor prompt template, which is the hash of its contents.
+        :param template_file: The name of the template file.
+        :param prompt_dir: Optional directory where the template file is located.
+        :return: The prompt template version.
+        """
+        return hash_text(self.read_prompt(template_file, prompt_dir))[:12]
+
     def append_path(self, path: str) -> str:
         """Return the PROMPT_DIR with the extra path appended.
         :param path: The path to append to PROMPT_DIR.
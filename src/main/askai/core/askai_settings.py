@@ -47,7 +47,7 @@ class AskAiSettings(metaclass=Singleton):
     INSTANCE: "AskAiSettings"
 
     # Current settings version. Updating this value will trigger a database recreation using the defaults.
-    __ACTUAL_VERSION: str = "0.4.3"
+    __ACTUAL_VERSION: str = "0.5.5"
 
     __RESOURCE_DIR = str(classpath.resource_path)
 
@@ -98,9 +98,26 @@ class AskAiSettings(metaclass=Singleton):
         self._settings.put("askai.settings.version.id", "askai", self.__ACTUAL_VERSION)
         self._settings.put("askai.debug.enabled", "askai", False)
         self._settings.put("askai.speak.enabled", "askai", False)
+        self._settings.put("askai.reply.stream.enabled", "askai", False)
         self._settings.put("askai.cache.enabled", "askai", False)
         self._settings.put("askai.cache.ttl.minutes", "askai", 25)
+        self._settings.put("askai.cache.semantic.enabled", "askai", False)
+        self._settings.put("askai.cache.semantic.threshold", "askai", 0.92)
+        self._settings.put("askai.cache.audio.max.size.mb", "askai", 256)
+        self._settings.put("askai.cache.stages.enabled", "askai", False)
+        self._settings.put("askai.cache.context.window", "askai", 0)
+        self._settings.put("askai.cache.compression.threshold", "askai", 4096)
+        self._settings.put("askai.cache.warmup.enabled", "askai", False)
+        self._settings.put("askai.cache.warmup.max.questions", "askai", 5)
+        self._settings.put("askai.cache.warmup.interval.secs", "askai", 15)
         self._settings.put("askai.context.keep.conversation", "askai", False)
+        self._settings.put("askai.context.compaction.enabled", "askai", False)
+        self._settings.put("askai.context.compaction.high.water", "askai", 0.75)
+        self._settings.put("askai.context.compaction.model", "askai", "gpt-4o-mini")
+        self._settings.put("askai.context.long.term.enabled", "askai", False)
+        self._settings.put("askai.context.long.term.top.k", "askai", 3)
+        self._settings.put("askai.context.long.term.max.tokens", "askai", 512)
+        self._settings.put("askai.context.long.term.window", "askai", 4)
         self._settings.put("askai.preferred.language", "askai", "")
         self._settings.put("askai.router.mode.default", "askai", "splitter")
         self._settings.put("askai.router.pass.threshold", "askai", "moderate")
@@ -137,6 +154,11 @@ class AskAiSettings(metaclass=Singleton):
         self._settings.put("askai.openai.text.to.speech.model", "askai", "tts-1")
         self._settings.put("askai.openai.text.to.speech.voice", "askai", "onyx")
         self._settings.put("askai.openai.text.to.speech.audio.format", "askai", "mp3")
+        # Replay
+        self._settings.put("askai.replay.cassette", "askai", "default")
+        self._settings.put("askai.replay.record.enabled", "askai", False)
+        self._settings.put("askai.replay.fallback.enabled", "askai", False)
+        self._settings.put("askai.replay.latency", "askai", "recorded")
         log.debug(f"Settings database created !")
 
     def get(self, key: str, default_value: str | None = "") -> str:
@@ -152,9 +152,8 @@ def color_bool(condition: bool, true_text: str = "ON", false_text: str = "OFF")
     return ("%GREEN%  " + true_text if condition else "%RED%  " + false_text) + "%NC%"
 
 
-def _init_context(context_size: int = 1000, engine_name: str = "openai", model_name: str = "gpt-4o-mini") -> None:
-    """Initialize the AskAI context and startup components.
-    :param context_size: The maximum size of the context window (default is 1000).
+def _init_context(engine_name: str = "openai", model_name: str = "gpt-4o-mini") -> None:
+    """Initialize the AskAI context and startup components. The context token limit is the one of the engine model.
     :param engine_name: The name of the engine to initialize (default is "openai").
     :param model_name: The model name of the engine to initialize (default is "gpt-3.5-turbo").
     """
@@ -174,7 +173,7 @@ def _init_context(context_size: int = 1000, engine_name: str = "openai", model_n
 
     if shared.engine is None and shared.context is None:
         shared.create_engine(engine_name=engine_name, model_name=model_name, mode=RouterMode.default())
-        shared.create_context(context_size)
+        shared.create_context(shared.engine.ai_token_limit(), shared.engine.ai_model_name())
         askai_bus = AskAiEvents.bus(ASKAI_BUS_NAME)
         askai_bus.subscribe(REPLY_EVENT, _reply_event)
 
@@ -253,6 +252,22 @@ def history(operation: str) -> None:
             text_formatter.commander_print(f"Error: {err}")
 
 
+@ask_commander.command()
+@click.argument("operation", default="status")
+def memory(operation: str) -> None:
+    """Manage the long-term (cross-session) memory.
+    :param operation: The operation to perform on the memory. Options: [status|forget].
+    """
+    match operation.casefold():
+        case "status":
+            HistoryCmd.memory_status()
+        case "forget":
+            HistoryCmd.memory_forget()
+        case _:
+            err = str(click.BadParameter(f"Invalid memory operation: '{operation}'"))
+            text_formatter.commander_print(f"Error: {err}")
+
+
 @ask_commander.command()
 @click.argument("name", default="LAST_REPLY")
 def copy(name: str) -> None:
@@ -309,7 +324,7 @@ def settings(operation: str, name: str, value: str) -> None:
 @click.argument("args", nargs=-1)
 def cache(operation: str, args: tuple[str, ...]) -> None:
     """Manages AskAI TTL-cache management and associated files.
-    :param operation: Specifies the cache operation. Options: [list|get|clear|files|enable|ttl]
+    :param operation: Specifies the cache operation. Options: [list|get|clear|files|enable|semantic|stats|ttl]
     :param args: Arguments relevant to the chosen operation.
     """
     match operation.casefold():
@@ -338,6 +353,22 @@ def cache(operation: str, args: tuple[str, ...]) -> None:
             else:
                 configs.is_cache = to_bool(args[0])
                 text_formatter.commander_print(f"Caching has been *{'en' if configs.is_cache else 'dis'}abled* !")
+        case "semantic":
+            if not args:
+                text_formatter.commander_print(
+                    f"`Semantic caching` is {color_bool(configs.is_semantic_cache)}, "
+                    f"threshold: *{configs.semantic_cache_threshold}*"
+                )
+            elif re.match(r"^\d*\.\d+$", args[0]):
+                configs.semantic_cache_threshold = float(args[0])
+                text_formatter.commander_print(f"Semantic cache threshold was set to *{args[0]}* !")
+            else:
+                configs.is_semantic_cache = to_bool(args[0])
+                text_formatter.commander_print(
+                    f"Semantic caching has been *{'en' if configs.is_semantic_cache else 'dis'}abled* !"
+                )
+        case "stats":
+            CacheCmd.stats("json" in args)
         case "ttl":
             if not args:
                 text_formatter.commander_print(f"Cache TTL is set to *{configs.ttl} minutes* !")
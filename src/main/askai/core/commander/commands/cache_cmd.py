@@ -14,15 +14,26 @@
 """
 from abc import ABC
 from askai.core.askai_configs import configs
-from askai.core.component.cache_service import cache, CACHE_DIR
+from askai.core.askai_messages import AskAiMessages
+from askai.core.askai_prompt import AskAiPrompt
+from askai.core.component.cache_metrics import lru_metrics
+from askai.core.component.cache_service import cache, CACHE_DIR, ensure_dir
+from askai.core.component.http_client import http_client
+from askai.core.component.semantic_cache import semantic_cache
+from askai.core.component.single_flight import single_flight
+from askai.core.component.stage_cache import stage_cache
+from askai.core.engine.replay.replay_engine import ReplayEngine
+from askai.core.support.langchain_support import lc_llm
+from askai.core.support.shared_instances import shared
 from askai.core.support.text_formatter import text_formatter
 from askai.core.support.utilities import display_text
 from functools import partial
 from hspylib.core.tools.commons import human_readable_bytes, sysout
 from hspylib.core.tools.text_tools import elide_text
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import json
 import os
 
 
@@ -46,7 +57,7 @@ class CacheCmd(ABC):
             display_text(entries)
         else:
             sysout(f"\n%RED%-=- Caching is empty! -=-%NC%")
-        display_text("\n> Hint: Type: '/cache [get|clear|files|enable|ttl] <args>'.")
+        display_text("\n> Hint: Type: '/cache [get|clear|files|enable|semantic|stats|ttl] <args>'.")
 
     @staticmethod
     def get(name: str) -> Optional[str]:
@@ -70,12 +81,13 @@ class CacheCmd(ABC):
         if entry:
             if isinstance(entry, int):
                 if name := sorted(cache.keys)[entry]:
-                    deleted = cache.del_reply(name)
+                    deleted = semantic_cache.del_reply(name)
             elif isinstance(entry, str):
                 if name := next((obj for obj in cache.keys if obj == entry), None):
-                    deleted = cache.del_reply(name)
+                    deleted = semantic_cache.del_reply(name)
         else:
-            deleted = str(cache.clear_replies())
+            deleted = str(semantic_cache.clear_replies())
+            stage_cache.clear()
         text_formatter.commander_print(f"*{deleted if deleted else 'No'}* cache(s) has been cleared!")
 
     @staticmethod
@@ -113,3 +125,53 @@ class CacheCmd(ABC):
                 display_text(f"\n> Hint: Type: '/cache files cleanup [globs ...]' to delete cached files.")
         else:
             sysout(f"\n%RED%-=- Cache dir {CACHE_DIR} does not exist! -=-%NC%\n")
+
+    @staticmethod
+    def metrics() -> dict[str, dict[str, Any]]:
+        """Collect the metrics of all caches and memoized components. Pooled models and HTTP connections are reported
+        as caches too: a hit is a reused model instance or a request sent over an already open connection. When the
+        replay engine is active, its cassette is reported too: a hit is an exactly matched request.
+        :return: A dictionary of metrics keyed by cache name.
+        """
+        metrics: dict[str, dict[str, Any]] = {
+            "replies": cache.reply_stats,
+            "semantic": semantic_cache.stats,
+            "stages": stage_cache.stats,
+            "audio": cache.audio_stats,
+            "prompts": lru_metrics(AskAiPrompt.read_prompt),
+            "translations": lru_metrics(AskAiMessages.translate),
+            "single_flight": {
+                "hits": single_flight.coalesced,
+                "misses": single_flight.calls - single_flight.coalesced,
+                "hit_rate": round(single_flight.ratio, 4),
+            },
+            "models": lc_llm.stats,
+            "connections": http_client.stats,
+        }
+        if isinstance(shared.engine, ReplayEngine):
+            metrics["replay"] = shared.engine.cassette.stats
+        return metrics
+
+    @staticmethod
+    def stats(as_json: bool = False) -> None:
+        """Display the cache metrics (hits, misses, evictions, bytes and lookup latency).
+        :param as_json: Whether to dump the metrics as JSON (also saved into the cache directory for dashboards).
+        """
+        metrics: dict[str, dict[str, Any]] = CacheCmd.metrics()
+        if as_json:
+            stats_file: Path = Path(ensure_dir(CACHE_DIR), "askai-cache-stats.json")
+            stats_file.write_text(json.dumps(metrics, indent=2))
+            display_text(f"```json\n{json.dumps(metrics, indent=2)}\n```\n\n> Saved into: `{stats_file}`")
+            return
+        table: str = "| Cache | Hits | Misses | Hit Rate | Evictions | Avg Lookup | Entries | Size |\n"
+        table += "|---|---|---|---|---|---|---|---|\n"
+        for name, m in metrics.items():
+            size: str = " ".join(human_readable_bytes(m["bytes"])) if "bytes" in m else "-"
+            avg_lookup: str = f"{m['avg_lookup_ms']:.3f}ms" if "avg_lookup_ms" in m else "-"
+            table += (
+                f"| {name} | {m['hits']} | {m['misses']} "
+                f"| {m['hit_rate']:.2%} | {m.get('evictions', '-')} | {avg_lookup} "
+                f"| {m.get('entries', '-')} | {size} |\n"
+            )
+        display_text(f"### Cache Statistics\n\n{table}")
+        display_text(f"\n> Hint: Type: '/cache stats json' to dump the metrics as JSON.")
@@ -13,6 +13,7 @@
    Copyright (c) 2024, AskAI
 """
 from abc import ABC
+from askai.core.component.long_term_memory import long_term_memory
 from askai.core.support.shared_instances import shared
 from askai.core.support.text_formatter import text_formatter
 from askai.core.support.utilities import display_text
@@ -39,7 +40,7 @@ class HistoryCmd(ABC):
                 ctx, ctx_val = c[0], c[1]
                 display_text(
                     f"- {ctx} ({len(ctx_val)}/{all_context.max_context_size} "
-                    f"tk [{all_context.length(ctx)}/{all_context.token_limit}]) \n"
+                    f"tk [{all_context.tokens(ctx)}/{all_context.token_limit}]) \n"
                     + indent(
                         ln.join(
                             [
@@ -70,6 +71,20 @@ class HistoryCmd(ABC):
             f"Context %GREEN%'{context.upper() if context else 'ALL'}'%NC% has been cleared!"
         )
 
+    @staticmethod
+    def memory_status() -> None:
+        """Display the long-term memory status."""
+        text_formatter.commander_print(
+            f"Long-term memory is %GREEN%'{'ON' if long_term_memory.is_enabled else 'OFF'}'%NC% "
+            f"and holds %GREEN%'{long_term_memory.count}'%NC% memories."
+        )
+
+    @staticmethod
+    def memory_forget() -> None:
+        """Forget all long-term memories."""
+        count: int = long_term_memory.forget()
+        text_formatter.commander_print(f"Long-term memory has been cleared (%GREEN%'{count}'%NC% memories)!")
+
     @staticmethod
     def context_copy(name: str | None = None) -> Optional[str]:
         """Copy a context entry to the clipboard.
@@ -77,7 +92,7 @@ class HistoryCmd(ABC):
         """
         copied_text: str | None = None
         if (name := name.upper()) in shared.context.keys:
-            if (ctx := str(shared.context.flat(name.upper()))) and (
+            if (ctx := shared.context.stringify(name.upper())) and (
                 copied_text := re.sub(
                     r"^((system|human|AI|assistant):\s*)", "", ctx, flags=re.MULTILINE | re.DOTALL | re.IGNORECASE
                 )
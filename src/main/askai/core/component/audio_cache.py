@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: audio_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.cache_metrics import CacheMetrics
+from hspylib.core.enums.charset import Charset
+from hspylib.core.metaclass.classpath import AnyPath
+from hspylib.core.tools.commons import file_is_not_empty
+from hspylib.core.tools.text_tools import hash_text
+from pathlib import Path
+from threading import RLock
+from time import perf_counter
+from typing import Any, Optional
+
+import logging as log
+import os
+
+
+class AudioCache:
+    """Provide a content-addressed, size-bounded cache for the generated speech audio files. Files are named after the
+    hash of the spoken text and voice, and the least recently used ones are evicted (by access time) whenever the cache
+    exceeds its byte budget. Pinned entries (e.g. welcome and goodbye messages) are never evicted.
+    """
+
+    # Sidecar file listing the pinned audio file names.
+    PINS_FILE: str = ".pinned"
+
+    @staticmethod
+    def key_of(text: str, voice: str) -> str:
+        """Return the content address of the audio generated for the text, using the given voice.
+        :param text: The text that the audio represents.
+        :param voice: The AI voice used for speech synthesis.
+        :return: The hash identifying the audio content.
+        """
+        return hash_text(f"{text.strip().lower()}-{hash_text(voice)}")
+
+    def __init__(self, audio_dir: AnyPath, max_size_mb: int):
+        self._lock = RLock()
+        self._audio_dir: Path = Path(str(audio_dir))
+        self._max_bytes: int = max_size_mb * 1024 * 1024
+        self._pins_file: Path = Path(self._audio_dir, self.PINS_FILE)
+        self._pinned: set[str] | None = None
+        self._size_bytes: int | None = None
+        self._metrics: CacheMetrics = CacheMetrics()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self._max_bytes = value
+        self.evict()
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = sum(f.stat().st_size for f in self._files())
+            return self._size_bytes
+
+    @property
+    def pinned(self) -> set[str]:
+        with self._lock:
+            if self._pinned is None:
+                self._pinned = (
+                    set(filter(None, map(str.strip, self._pins_file.read_text(Charset.UTF_8.val).splitlines())))
+                    if self._pins_file.exists()
+                    else set()
+                )
+            return self._pinned
+
+    @property
+    def hits(self) -> int:
+        return self._metrics.hits
+
+    @property
+    def misses(self) -> int:
+        return self._metrics.misses
+
+    @property
+    def evictions(self) -> int:
+        return self._metrics.evictions
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return self._metrics.as_dict(bytes=self.size_bytes, max_bytes=self.max_bytes, pinned=len(self.pinned))
+
+    def path_of(self, text: str, voice: str, audio_format: str) -> Path:
+        """Return the content-addressed path of the audio generated for the text.
+        :param text: The text that the audio represents.
+        :param voice: The AI voice used for speech synthesis.
+        :param audio_format: The audio file format.
+        :return: The audio file path.
+        """
+        return Path(self._audio_dir, f"askai-{self.key_of(text, voice)}.{audio_format}")
+
+    def lookup(self, text: str, voice: str, audio_format: str) -> tuple[str, bool]:
+        """Look up the audio generated for the text, counting hits and misses. A hit refreshes the access time of the
+        file, so it becomes the most recently used entry.
+        :param text: The text that the audio represents.
+        :param voice: The AI voice used for speech synthesis.
+        :param audio_format: The audio file format.
+        :return: A tuple containing the audio file path and a boolean indicating if the file exists.
+        """
+        started: float = perf_counter()
+        audio_path: Path = self.path_of(text, voice, audio_format)
+        with self._lock:
+            if exists := file_is_not_empty(str(audio_path)):
+                os.utime(audio_path)
+        self._metrics.record(exists, perf_counter() - started)
+        return str(audio_path), exists
+
+    def commit(self, audio_path: AnyPath) -> int:
+        """Account for a newly generated audio file and evict the least recently used entries if the cache exceeds its
+        byte budget.
+        :param audio_path: The path of the generated audio file.
+        :return: The number of evicted files.
+        """
+        audio_path = Path(str(audio_path))
+        with self._lock:
+            if self._size_bytes is not None and audio_path.exists():
+                self._size_bytes += audio_path.stat().st_size
+            return self.evict(keep=audio_path.name)
+
+    def pin(self, text: str, voice: str, audio_format: str) -> Path:
+        """Pin the audio generated for the text, so that it is never evicted.
+        :param text: The text that the audio represents.
+        :param voice: The AI voice used for speech synthesis.
+        :param audio_format: The audio file format.
+        :return: The pinned audio file path.
+        """
+        audio_path: Path = self.path_of(text, voice, audio_format)
+        with self._lock:
+            if audio_path.name not in self.pinned:
+                self.pinned.add(audio_path.name)
+                self._save_pins()
+        return audio_path
+
+    def unpin(self, text: str, voice: str, audio_format: str) -> None:
+        """Unpin the audio generated for the text, making it eligible for eviction again.
+        :param text: The text that the audio represents.
+        :param voice: The AI voice used for speech synthesis.
+        :param audio_format: The audio file format.
+        """
+        audio_path: Path = self.path_of(text, voice, audio_format)
+        with self._lock:
+            if audio_path.name in self.pinned:
+                self.pinned.remove(audio_path.name)
+                self._save_pins()
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """Evict the least recently used (unpinned) audio files until the cache fits its byte budget.
+        :param keep: An audio file name that must not be evicted (e.g. the one that was just generated).
+        :return: The number of evicted files.
+        """
+        count: int = 0
+        with self._lock:
+            if self.size_bytes <= self._max_bytes:
+                return count
+            candidates: list[tuple[float, int, Path]] = sorted(
+                (st.st_atime, st.st_size, f)
+                for f in self._files()
+                if f.name not in self.pinned and f.name != keep and (st := f.stat())
+            )
+            for _, size, audio_file in candidates:
+                if self._size_bytes <= self._max_bytes:
+                    break
+                try:
+                    audio_file.unlink()
+                    self._size_bytes -= size
+                    count += 1
+                except OSError as err:
+                    log.warning("Unable to evict audio file '%s' => %s", audio_file, err)
+            self._metrics.record_evictions(count)
+        if count:
+            log.debug("AudioCache::[EVICT] %d file(s) evicted. Cache size: %d bytes", count, self._size_bytes)
+        return count
+
+    def _files(self) -> list[Path]:
+        """Return all cached audio files."""
+        return [f for f in self._audio_dir.glob("askai-*.*") if f.is_file()]
+
+    def _save_pins(self) -> None:
+        """Persist the pinned audio file names into the sidecar file."""
+        self._pins_file.write_text(os.linesep.join(sorted(self.pinned)), Charset.UTF_8.val)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: cache_codec.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from hspylib.core.enums.charset import Charset
+from hspylib.core.metaclass.classpath import AnyPath
+from pathlib import Path
+
+import gzip
+
+# Header that prefixes compressed payloads. Anything without it is a legacy (plain text) value.
+HEADER: bytes = b"\x00AKZ\x01"
+
+
+def compress(text: str, threshold: int) -> str | bytes:
+    """Compress the text when its encoded size is above the threshold.
+    :param text: The text to compress.
+    :param threshold: The size in bytes above which the text is compressed (zero or less disables compression).
+    :return: The header-prefixed compressed bytes, or the original text when it is not worth compressing.
+    """
+    data: bytes = text.encode(Charset.UTF_8.val)
+    if 0 < threshold < len(data):
+        return HEADER + gzip.compress(data, compresslevel=3)
+    return text
+
+
+def decompress(value: str | bytes) -> str:
+    """Decompress a value created by compress. Values without the header are returned as text.
+    :param value: The stored value.
+    :return: The original text.
+    """
+    if isinstance(value, str):
+        return value
+    if value.startswith(HEADER):
+        value = gzip.decompress(value[len(HEADER) :])
+    return value.decode(Charset.UTF_8.val)
+
+
+def write_text(path: AnyPath, text: str, threshold: int) -> int:
+    """Write the text into the file, compressing it when it is above the threshold.
+    :param path: The file path.
+    :param text: The text to write.
+    :param threshold: The size in bytes above which the text is compressed.
+    :return: The number of bytes written.
+    """
+    value: str | bytes = compress(text, threshold)
+    return Path(str(path)).write_bytes(value if isinstance(value, bytes) else value.encode(Charset.UTF_8.val))
+
+
+def read_text(path: AnyPath) -> str:
+    """Read the text from a file written by write_text, or from a legacy plain text file.
+    :param path: The file path.
+    :return: The file contents as text.
+    """
+    return decompress(Path(str(path)).read_bytes())
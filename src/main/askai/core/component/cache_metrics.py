@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: cache_metrics.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from threading import Lock
+from typing import Any, Callable
+
+
+class CacheMetrics:
+    """Provide the hit, miss, eviction and lookup latency counters of a cache."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lookup_secs: float = 0.0
+        self._max_lookup_secs: float = 0.0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def lookups(self) -> int:
+        return self._hits + self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self._hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def avg_lookup_ms(self) -> float:
+        return self._lookup_secs * 1000 / self.lookups if self.lookups else 0.0
+
+    @property
+    def max_lookup_ms(self) -> float:
+        return self._max_lookup_secs * 1000
+
+    def record(self, hit: bool, elapsed_secs: float = 0.0) -> bool:
+        """Record a cache lookup.
+        :param hit: Whether the lookup was a hit.
+        :param elapsed_secs: The lookup latency in seconds.
+        :return: The hit flag, so the call can be used inline.
+        """
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+            self._lookup_secs += elapsed_secs
+            self._max_lookup_secs = max(self._max_lookup_secs, elapsed_secs)
+        return hit
+
+    def record_evictions(self, count: int) -> int:
+        """Record evicted (or expired and purged) cache entries.
+        :param count: The number of evicted entries.
+        :return: The number of evicted entries.
+        """
+        with self._lock:
+            self._evictions += count
+        return count
+
+    def as_dict(self, **extra: Any) -> dict[str, Any]:
+        """Return the metrics as a dictionary, suitable for a JSON dump.
+        :param extra: Additional cache-specific metrics (e.g. bytes, entries).
+        :return: The metrics dictionary.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "evictions": self.evictions,
+            "avg_lookup_ms": round(self.avg_lookup_ms, 3),
+            "max_lookup_ms": round(self.max_lookup_ms, 3),
+            **extra,
+        }
+
+
+def lru_metrics(fn: Callable) -> dict[str, Any]:
+    """Return the metrics of a function memoized with functools.lru_cache.
+    :param fn: The memoized function.
+    :return: The metrics dictionary.
+    """
+    info = fn.cache_info()
+    lookups: int = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+        "entries": info.currsize,
+        "max_entries": info.maxsize,
+    }
@@ -14,18 +14,28 @@
 """
 from askai.core.askai_configs import configs
 from askai.core.askai_settings import ASKAI_DIR, CONVERSATION_STARTERS
+from askai.core.component.audio_cache import AudioCache
+from askai.core.component.cache_codec import read_text
+from askai.core.component.cache_metrics import CacheMetrics
+from askai.core.component.reply_store import ReplyStore
 from clitt.core.tui.line_input.keyboard_input import KeyboardInput
 from collections import namedtuple
 from hspylib.core.enums.charset import Charset
+from hspylib.core.metaclass.classpath import AnyPath
 from hspylib.core.metaclass.singleton import Singleton
-from hspylib.core.tools.commons import file_is_not_empty, touch_file
-from hspylib.core.tools.text_tools import ensure_endswith, hash_text
+from hspylib.core.tools.commons import file_is_not_empty
+from hspylib.core.tools.text_tools import ensure_endswith
 from hspylib.modules.cache.ttl_cache import TTLCache
-from langchain_core.messages import BaseMessage
+from hspylib.modules.cache.ttl_keyring_be import TTLKeyringBE
+from hspylib.modules.security.security import b64_decode
 from pathlib import Path
 from shutil import copyfile
-from typing import Optional
+from time import perf_counter, time
+from typing import Any, Iterator, Optional
 
+import json
+import keyring
+import logging as log
 import os
 import re
 
@@ -34,68 +44,71 @@ CACHE_DIR: Path = Path(f"{ASKAI_DIR}/cache")
 
 # Settings directory.
 SETTINGS_DIR: Path = Path(str(ASKAI_DIR) + "/settings")
-if not SETTINGS_DIR.exists():
-    SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
 
 # Transcribed audio cache directory.
 AUDIO_DIR: Path = Path(str(CACHE_DIR) + "/audio")
-if not AUDIO_DIR.exists():
-    AUDIO_DIR.mkdir(parents=True, exist_ok=True)
 
 # Camera photo shots cache directory.
 PICTURE_DIR: Path = Path(str(CACHE_DIR) + "/pictures")
-if not PICTURE_DIR.exists():
-    PICTURE_DIR.mkdir(parents=True, exist_ok=True)
 
 # Desktop screenshots cache directory.
 SCREENSHOTS_DIR: Path = Path(str(CACHE_DIR) + "/screenshots")
-if not SCREENSHOTS_DIR.exists():
-    SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
 
 # Camera photo shots cache directory.
 PHOTO_DIR: Path = Path(str(PICTURE_DIR) + "/photos")
-if not PHOTO_DIR.exists():
-    PHOTO_DIR.mkdir(parents=True, exist_ok=True)
 
 # Detected faces cache directory.
 FACE_DIR: Path = Path(str(PICTURE_DIR) + "/faces")
-if not FACE_DIR.exists():
-    FACE_DIR.mkdir(parents=True, exist_ok=True)
 
 # Imported image files cache directory.
 IMG_IMPORTS_DIR: Path = Path(str(PICTURE_DIR) + "/imports")
-if not IMG_IMPORTS_DIR.exists():
-    IMG_IMPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
 # AI Generation cache directory.
 GEN_AI_DIR: Path = Path(str(CACHE_DIR) + "/generated")
-if not GEN_AI_DIR.exists():
-    GEN_AI_DIR.mkdir(parents=True, exist_ok=True)
 
 # Voice recordings cache directory.
 REC_DIR: Path = Path(str(CACHE_DIR) + "/recordings")
-if not REC_DIR.exists():
-    REC_DIR.mkdir(parents=True, exist_ok=True)
 
 # Transcribed audio cache directory.
 PERSIST_DIR: Path = Path(str(CACHE_DIR) + "/chroma")
-if not PERSIST_DIR.exists():
-    PERSIST_DIR.mkdir(parents=True, exist_ok=True)
+
+# Semantic reply cache (vector index) directory.
+SEMANTIC_DIR: Path = Path(str(CACHE_DIR) + "/semantic")
+
+# Long-term (cross-session) memory (vector index) directory.
+MEMORY_DIR: Path = Path(str(CACHE_DIR) + "/memory")
+
+# Recorded AI interactions (replay engine cassettes) directory.
+CASSETTE_DIR: Path = Path(str(CACHE_DIR) + "/cassettes")
 
 ASKAI_INPUT_HISTORY_FILE: Path = Path(CACHE_DIR / "askai-input-history.txt")
-if not file_is_not_empty(str(ASKAI_INPUT_HISTORY_FILE)):
-    copyfile(str(CONVERSATION_STARTERS), str(ASKAI_INPUT_HISTORY_FILE))
 
 ASKAI_CONTEXT_FILE: Path = Path(CACHE_DIR / "askai-context-history.txt")
-if not file_is_not_empty(str(ASKAI_CONTEXT_FILE)):
-    touch_file(str(ASKAI_CONTEXT_FILE))
 
-ASKAI_MEMORY_FILE: Path = Path(CACHE_DIR / "askai-memory-history.txt")
-if not file_is_not_empty(str(ASKAI_MEMORY_FILE)):
-    touch_file(str(ASKAI_MEMORY_FILE))
+# Role prefix of the legacy context and memory history file entries.
+RE_HISTORY_ROLE: re.Pattern = re.compile(r"^(human|assistant|system):\s?(.*)$", flags=re.IGNORECASE)
 
 GEO_LOC_CACHE_FILE: Path = Path(CACHE_DIR / "geo-location.json")
 
+ASKAI_REPLIES_DB_FILE: Path = Path(CACHE_DIR / "askai-replies.db")
+
+ASKAI_STAGES_DB_FILE: Path = Path(CACHE_DIR / "askai-stages.db")
+
+# Cache directories already created by ensure_dir. Nothing is created at import time.
+_CREATED_DIRS: set[str] = set()
+
+
+def ensure_dir(path: AnyPath) -> Path:
+    """Create the cache directory the first time it is used, so that the cache layout is only materialized on demand.
+    :param path: The cache directory path.
+    :return: The cache directory path.
+    """
+    dir_path: Path = Path(str(path))
+    if str(dir_path) not in _CREATED_DIRS:
+        dir_path.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(str(dir_path))
+    return dir_path
+
 
 CacheEntry = namedtuple("CacheEntry", ["key", "expires"])
 
@@ -108,79 +121,173 @@ class CacheService(metaclass=Singleton):
 
     INSTANCE: "CacheService"
 
+    # Legacy (TTLCache) comma-joined key set. Only used to migrate the old entries into the reply store.
     ASKAI_CACHE_KEYS: str = "askai-cache-keys"
 
     ASKAI_CONTEXT_KEY: str = "askai-context-key"
 
     _TTL_CACHE: TTLCache[str] = TTLCache(ttl_minutes=configs.ttl)
 
-    @staticmethod
-    def audio_file_path(text: str, voice: str = "onyx", audio_format: str = "mp3") -> tuple[str, bool]:
+    _AUDIO_CACHE: AudioCache = AudioCache(AUDIO_DIR, configs.audio_cache_max_size_mb)
+
+    @classmethod
+    def audio_file_path(cls, text: str, voice: str = "onyx", audio_format: str = "mp3") -> tuple[str, bool]:
         """Retrieve the hashed audio file path and determine whether the file already exists.
         :param text: The text that the audio represents.
         :param voice: The AI voice used for speech synthesis (default is "onyx").
         :param audio_format: The audio file format (default is "mp3").
         :return: A tuple containing the hashed file path as a string and a boolean indicating if the file exists.
         """
-        key = f"{text.strip().lower()}-{hash_text(voice)}"
-        audio_file_path = f"{str(AUDIO_DIR)}/askai-{hash_text(key)}.{audio_format}"
-        return audio_file_path, file_is_not_empty(audio_file_path)
+        ensure_dir(AUDIO_DIR)
+        return cls._AUDIO_CACHE.lookup(text, voice, audio_format)
+
+    @classmethod
+    def save_audio_file(cls, audio_file_path: str) -> int:
+        """Register a newly generated audio file, evicting the least recently used ones if the audio cache is full.
+        :param audio_file_path: The path of the generated audio file.
+        :return: The number of evicted audio files.
+        """
+        return cls._AUDIO_CACHE.commit(audio_file_path)
+
+    @classmethod
+    def pin_audio(cls, text: str, voice: str = "onyx", audio_format: str = "mp3") -> None:
+        """Pin the audio of a frequently spoken text (e.g. welcome and goodbye messages), so it's never evicted.
+        :param text: The text that the audio represents.
+        :param voice: The AI voice used for speech synthesis (default is "onyx").
+        :param audio_format: The audio file format (default is "mp3").
+        """
+        ensure_dir(AUDIO_DIR)
+        cls._AUDIO_CACHE.pin(text, voice, audio_format)
+
+    @property
+    def audio_stats(self) -> dict[str, Any]:
+        return self._AUDIO_CACHE.stats
 
     def __init__(self):
-        keys: str | None = self._TTL_CACHE.read(self.ASKAI_CACHE_KEYS)
-        self._cache_keys: set[str] = set(map(str.strip, keys.split(",") if keys else {}))
+        self._reply_store: ReplyStore | None = None
+        self._metrics: CacheMetrics = CacheMetrics()
+
+    @property
+    def _store(self) -> ReplyStore:
+        """Open the reply store (migrating the legacy TTLCache entries) the first time it is used."""
+        if self._reply_store is None:
+            ensure_dir(CACHE_DIR)
+            self._reply_store = ReplyStore(ASKAI_REPLIES_DB_FILE, configs.cache_compression_threshold)
+            self._metrics.record_evictions(self._reply_store.purge())
+            self.migrate_ttl_cache()
+        return self._reply_store
+
+    @property
+    def reply_stats(self) -> dict[str, Any]:
+        return self._metrics.as_dict(entries=self._store.count(), bytes=self._store.size_bytes)
 
     @property
-    def keys(self) -> set[str]:
-        return self._cache_keys
+    def keys(self) -> list[str]:
+        return self._store.keys()
+
+    def list_keys(self, prefix: str = "") -> list[str]:
+        """List the cached reply keys starting with the given prefix.
+        :param prefix: The key prefix to filter by (default is all keys).
+        :return: The sorted list of matching keys.
+        """
+        return self._store.keys(prefix.strip().lower())
+
+    def migrate_ttl_cache(self) -> int:
+        """Migrate the replies saved by the legacy TTLCache (comma-joined key set) into the reply store, keeping their
+        remaining time-to-live. Migrated entries are removed from the TTLCache, so this is a no-op once the migration
+        is complete.
+        :return: The number of migrated replies.
+        """
+        count: int = 0
+        if keys := self._TTL_CACHE.read(self.ASKAI_CACHE_KEYS):
+            for key in filter(None, map(str.strip, keys.split(","))):
+                if reply := self._TTL_CACHE.read(key):
+                    expires: Optional[float] = self._ttl_expires(key)
+                    self._store.put(key, reply, (expires - time()) / 60 if expires else configs.ttl)
+                    count += 1
+                self._TTL_CACHE.delete(key)
+            self._TTL_CACHE.delete(self.ASKAI_CACHE_KEYS)
+            log.info("Migrated %d replies from the TTL cache into: '%s'", count, self._store.db_path)
+        return count
+
+    @staticmethod
+    def _ttl_expires(key: str) -> Optional[float]:
+        """Return the expiration time of a legacy TTLCache entry, as kept by its keyring backend.
+        :param key: The TTLCache entry key.
+        :return: The expiration timestamp, in seconds; or None if it's not known.
+        """
+        backend = keyring.get_keyring()
+        if isinstance(backend, TTLKeyringBE):
+            if entry := super(TTLKeyringBE, backend).get_password(TTLCache.CACHE_SERVICE, key):
+                return json.loads(b64_decode(entry)).get("ttl")
+        return None
+
+    @staticmethod
+    def reply_key(text: str, scope: Optional[str] = None) -> str:
+        """Return the reply cache key for the text. When a scope is provided (e.g. the router mode and a digest of the
+        recent conversation), the key is bound to it, so the same question asked in a different context is a miss.
+        :param text: The text to be cached.
+        :param scope: The optional scope that the reply is bound to.
+        :return: The reply cache key.
+        """
+        key: str = text.strip().lower()
+        return f"{key}@{scope.lower()}" if scope else key
+
+    def has_reply(self, text: str, scope: Optional[str] = None) -> bool:
+        """Whether there is a cached reply for the text, without counting it as a cache lookup.
+        :param text: The text key to look up in the cache.
+        :param scope: The optional scope that the reply is bound to.
+        :return: True if a non-expired reply is cached for the text.
+        """
+        return configs.is_cache and self.reply_key(text, scope) in self._store
 
-    def save_reply(self, text: str, reply: str) -> Optional[str]:
-        """Save an AI reply into the TTL (Time-To-Live) cache.
+    def save_reply(self, text: str, reply: str, scope: Optional[str] = None) -> Optional[str]:
+        """Save an AI reply into the reply cache.
         :param text: The text to be cached.
         :param reply: The AI reply associated with this text.
+        :param scope: The optional scope that the reply is bound to.
         :return: The key under which the reply is saved, or None if the save operation fails.
         """
         if configs.is_cache:
-            key = text.strip().lower()
-            self._TTL_CACHE.save(key, reply)
-            self.keys.add(key)
-            self._TTL_CACHE.save(self.ASKAI_CACHE_KEYS, ",".join(self._cache_keys))
-            return key
+            return self._store.put(self.reply_key(text, scope), reply, configs.ttl)
         return None
 
-    def read_reply(self, text: str) -> Optional[str]:
-        """Retrieve AI replies from the TTL (Time-To-Live) cache.
+    def read_reply(self, text: str, scope: Optional[str] = None) -> Optional[str]:
+        """Retrieve AI replies from the reply cache.
         :param text: The text key to look up in the cache.
+        :param scope: The optional scope that the reply is bound to.
         :return: The cached reply associated with the text, or None if not found.
         """
         if configs.is_cache:
-            key = text.strip().lower()
-            return self._TTL_CACHE.read(key)
+            started: float = perf_counter()
+            reply: str | None = self._store.get(self.reply_key(text, scope))
+            self._metrics.record(reply is not None, perf_counter() - started)
+            return reply
         return None
 
-    def del_reply(self, text: str) -> Optional[str]:
-        """Delete an AI reply from the TTL (Time-To-Live) cache.
+    def del_reply(self, text: str, scope: Optional[str] = None) -> Optional[str]:
+        """Delete an AI reply from the reply cache.
         :param text: The text key whose associated reply is to be deleted from the cache.
+        :param scope: The optional scope that the reply is bound to.
         :return: The deleted reply if it existed, or None if no reply was found.
         """
         if configs.is_cache:
-            key = text.strip().lower()
-            self._TTL_CACHE.delete(key)
-            self.keys.remove(key)
-            self._TTL_CACHE.save(self.ASKAI_CACHE_KEYS, ",".join(self._cache_keys))
-            return text
+            return text if self._store.delete(self.reply_key(text, scope)) else None
         return None
 
     def clear_replies(self) -> list[str]:
         """Clear all cached replies.
         :return: A list of keys for the replies that were deleted from the cache.
         """
-        return list(map(self.del_reply, sorted(self.keys)))
+        return self._store.clear()
 
     def read_input_history(self) -> list[str]:
         """Retrieve line input queries from the history file.
         :return: A list of input queries stored in the cache.
         """
+        if not file_is_not_empty(str(ASKAI_INPUT_HISTORY_FILE)):
+            ensure_dir(CACHE_DIR)
+            copyfile(str(CONVERSATION_STARTERS), str(ASKAI_INPUT_HISTORY_FILE))
         history: str = ASKAI_INPUT_HISTORY_FILE.read_text()
         inputs = list(filter(str.__len__, map(str.strip, history.split(os.linesep))))
 
@@ -191,6 +298,7 @@ class CacheService(metaclass=Singleton):
         :param history: A list of input queries to be saved. If None, the current input history will be saved.
         """
         if history := (history or KeyboardInput.history()):
+            ensure_dir(CACHE_DIR)
             with open(str(ASKAI_INPUT_HISTORY_FILE), "w", encoding=Charset.UTF_8.val) as f_hist:
                 list(
                     map(
@@ -210,40 +318,33 @@ class CacheService(metaclass=Singleton):
         history.extend(self.read_input_history())
         return history
 
-    def save_context(self, context: list[str] = None) -> None:
-        """Save the context window entries into the context file.
-        :param context: A list of context entries to be saved.
+    def read_context(self) -> Iterator[tuple[str, str]]:
+        """Import the context window entries from the legacy (plain text) context file. The conversation is now
+        persisted by the context journal, this is only used when there is no journal yet.
+        :return: An iterator over the (role, content) entries of the file.
         """
-        if context := (context or list()):
-            with open(str(ASKAI_CONTEXT_FILE), "w", encoding=Charset.UTF_8.val) as f_hist:
-                list(map(lambda h: f_hist.write(ensure_endswith(os.linesep, h)), context))
-
-    def read_context(self) -> list[str]:
-        """Read the context window entries from the context file.
-        :return: A list of context entries retrieved from the cache."""
-        flags: int = re.MULTILINE | re.DOTALL | re.IGNORECASE
-        context: str = ASKAI_CONTEXT_FILE.read_text()
-        return list(filter(str.__len__, map(str.strip, re.split(r"(human|assistant|system):", context, flags=flags))))
+        return self._read_history(ASKAI_CONTEXT_FILE)
 
-    def save_memory(self, memory: list[BaseMessage] = None) -> None:
-        """Save the context window entries into the context file.
-        :param memory: A list of memory entries to be saved.
-        """
-
-        def _get_role_(msg: BaseMessage) -> str:
-            return type(msg).__name__.rstrip("Message").replace("AI", "Assistant").casefold()
-
-        if memory := (memory or list()):
-            with open(str(ASKAI_MEMORY_FILE), "w", encoding=Charset.UTF_8.val) as f_hist:
-                list(map(lambda m: f_hist.write(ensure_endswith(os.linesep, f"{_get_role_(m)}: {m.content}")), memory))
-
-    def read_memory(self) -> list[str]:
-        """Reads and parses the memory from the context file.
-        :return: A list of non-empty, stripped strings split by roles (human, assistant, system).
+    @staticmethod
+    def _read_history(history_file: Path) -> Iterator[tuple[str, str]]:
+        """Parse the legacy history file, where each entry starts a line with its role prefix ("role: content"). Lines
+        that don't start with a role prefix (including the ones quoting "system:" or "human:" in the middle of the
+        text) continue the previous entry.
+        :param history_file: The legacy history file.
+        :return: An iterator over the (role, content) entries of the file.
         """
-        flags: int = re.MULTILINE | re.DOTALL | re.IGNORECASE
-        memory: str = ASKAI_MEMORY_FILE.read_text()
-        return list(filter(str.__len__, map(str.strip, re.split(r"(human|assistant|system):", memory, flags=flags))))
+        if not file_is_not_empty(str(history_file)):
+            return
+        role, lines = None, []
+        for line in read_text(history_file).splitlines():
+            if mat := RE_HISTORY_ROLE.match(line):
+                if role and (content := os.linesep.join(lines).strip()):
+                    yield role, content
+                role, lines = mat.group(1).casefold(), [mat.group(2)]
+            elif role:
+                lines.append(line)
+        if role and (content := os.linesep.join(lines).strip()):
+            yield role, content
 
 
 assert (cache := CacheService().INSTANCE) is not None
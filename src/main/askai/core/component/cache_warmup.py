@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: cache_warmup.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.askai_configs import configs
+from askai.core.component.cache_service import cache, CACHE_DIR, ensure_dir
+from askai.core.component.scheduler import scheduler
+from askai.core.component.semantic_cache import semantic_cache
+from askai.core.processors.ai_processor import AIProcessor
+from askai.core.support.chat_session import ChatSession
+from askai.core.support.shared_instances import shared
+from askai.core.support.utilities import in_background
+from collections import Counter
+from hspylib.core.enums.charset import Charset
+from hspylib.core.metaclass.singleton import Singleton
+from hspylib.core.tools.commons import file_is_not_empty
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Optional
+
+import atexit
+import json
+import logging as log
+import pause
+import re
+
+# File holding how many times each question was asked.
+ASKAI_QUESTION_COUNTS_FILE: Path = Path(CACHE_DIR / "askai-question-counts.json")
+
+
+class CacheWarmup(metaclass=Singleton):
+    """Pre-compute, in background, the replies of the most frequently asked questions and of the conversation starters,
+    so their first ask is served from the reply cache. Replies are computed by the processor of the router mode, as if
+    the user asked the questions, but without streaming them and apart from the user's conversation; the warm-up is
+    cancelled by the user's first question.
+    Questions that depend on volatile data (date, time, location, news or the filesystem) are never warmed up, since a
+    cached reply for them would go stale.
+    """
+
+    INSTANCE: "CacheWarmup"
+
+    # Number of recorded questions, after which the question counts are saved.
+    FLUSH_EVERY: int = 10
+
+    # ID of the throwaway chat sessions the questions are warmed up in.
+    SESSION_ID: str = "cache-warmup"
+
+    # Maximum number of question counts that are kept (the most frequent ones).
+    MAX_COUNTS: int = 500
+
+    # fmt: off
+    RE_VOLATILE: str = (
+        r"\b(today|tonight|tomorrow|yesterday|now|current(ly)?|latest|recent|news|date|time|day|week|month|year|"
+        r"next|schedule(d)?|weekend|event(s)?|match(es)?|score(s)?|price(s)?|weather|forecast|where|location|near|"
+        r"here|local|file|files|folder|folders|dir|directory|directories|disk|path|download(s)?|document(s)?|desktop|"
+        r"home|i|me|my|mine|list|open|run|execute|install|create|save|play|check|change|adjust|search|delete|remove|"
+        r"move|copy|screenshot|photo|camera|picture|image|webcam|ip|battery|process(es)?)\b|[~/\\]"
+    )
+    # fmt: on
+
+    def __init__(self):
+        self._lock = Lock()
+        self._running = Lock()
+        self._counts: Counter | None = None
+        self._pending: int = 0
+        self._cancelled: bool = False
+        self._warmed: list[str] = []
+
+    @property
+    def counts(self) -> Counter:
+        with self._lock:
+            if self._counts is None:
+                self._counts = Counter(
+                    json.loads(ASKAI_QUESTION_COUNTS_FILE.read_text(Charset.UTF_8.val))
+                    if file_is_not_empty(str(ASKAI_QUESTION_COUNTS_FILE))
+                    else {}
+                )
+            return self._counts
+
+    @property
+    def warmed(self) -> list[str]:
+        return self._warmed
+
+    @classmethod
+    def is_volatile(cls, question: str) -> bool:
+        """Whether the question depends on volatile data, such as date, location or filesystem state.
+        :param question: The question to check.
+        :return: True if the reply to the question is likely to go stale.
+        """
+        return re.search(cls.RE_VOLATILE, question, flags=re.IGNORECASE) is not None
+
+    def record(self, question: str) -> None:
+        """Count an asked question, so the most frequent ones can be warmed up on the next startups. Counts are saved
+        in batches (and on exit).
+        :param question: The question that was asked.
+        """
+        if (key := question.strip().lower()) and not key.startswith("/"):
+            counts: Counter = self.counts
+            with self._lock:
+                if not self._pending:
+                    atexit.register(self.flush)
+                counts[key] += 1
+                self._pending += 1
+            if self._pending >= self.FLUSH_EVERY:
+                self.flush()
+
+    def flush(self) -> None:
+        """Save the pending question counts, keeping only the most frequent ones."""
+        with self._lock:
+            if self._pending and self._counts is not None:
+                if len(self._counts) > self.MAX_COUNTS:
+                    self._counts = Counter(dict(self._counts.most_common(self.MAX_COUNTS)))
+                ensure_dir(CACHE_DIR)
+                ASKAI_QUESTION_COUNTS_FILE.write_text(json.dumps(self._counts), Charset.UTF_8.val)
+                atexit.unregister(self.flush)
+                self._pending = 0
+
+    def candidates(self, max_questions: int, scope: Optional[str] = None) -> list[str]:
+        """Return the questions to warm up: the most frequent ones, followed by the input history (which is seeded
+        from the conversation starters), skipping commands, volatile and already cached questions.
+        :param max_questions: The maximum number of questions to return.
+        :param scope: The cache scope the replies are bound to.
+        :return: The list of questions to warm up.
+        """
+        frequent: list[str] = [q for q, _ in self.counts.most_common()]
+        history: list[str] = list(reversed(cache.read_input_history()))
+        selected: list[str] = []
+        for question in dict.fromkeys(map(str.lower, map(str.strip, frequent + history))):
+            if len(selected) >= max_questions:
+                break
+            if question and not question.startswith("/") and not self.is_volatile(question):
+                if not cache.has_reply(question, scope):
+                    selected.append(question)
+        return selected
+
+    def schedule(self, processor: AIProcessor, scope_fn: Callable[[], Optional[str]], delay_secs: int = 5) -> None:
+        """Schedule the warm-up job to run in background, after the given delay.
+        :param processor: The processor of the router mode, that computes the replies.
+        :param scope_fn: The function that computes the cache scope of the replies (see AskAi._cache_scope).
+        :param delay_secs: The delay before the warm-up starts.
+        """
+        if configs.is_cache and configs.is_cache_warmup:
+            scheduler.scheduler_after(0, 0, delay_secs, 0, self.warm_up, [processor, scope_fn])
+
+    def cancel(self) -> None:
+        """Cancel the warm-up, waiting for the reply being computed (if any), so it never runs along with the user's
+        questions (they share the AI engine and the router mode).
+        """
+        self._cancelled = True
+        with self._running:
+            pass
+
+    def warm_up(self, processor: AIProcessor, scope_fn: Callable[[], Optional[str]]) -> int:
+        """Pre-compute and cache the replies of the warm-up candidates, within the configured budget: at most the
+        configured number of questions, spaced by the configured interval. Each question is asked in a throwaway chat
+        session, forked from the conversation, so the warm-up never changes the user's conversation, and the replies
+        are bound to the scope the conversation has until the user asks the first question.
+        :param processor: The processor of the router mode, that computes the replies.
+        :param scope_fn: The function that computes the cache scope of the replies (see AskAi._cache_scope).
+        :return: The number of replies warmed up by this run.
+        """
+        with self._fork().activate():
+            scope: Optional[str] = scope_fn()
+        questions: list[str] = self.candidates(configs.cache_warmup_max_questions, scope)
+        log.info("CacheWarmup::[START] %d question(s) to warm up", len(questions))
+        count: int = 0
+        for question in questions:
+            with self._running:
+                if self._cancelled or not scheduler.alive:
+                    break
+                try:
+                    with self._fork().activate(), in_background():
+                        shared.context.push("HISTORY", question)
+                        output: Optional[str] = processor.process(question)
+                except Exception as err:
+                    log.warning("CacheWarmup::[FAILED] '%s' => %s", question, err)
+                    output = None
+                if output:
+                    semantic_cache.save_reply(question, output, scope)
+                    self._warmed.append(question)
+                    count += 1
+                    log.info("CacheWarmup::[WARMED] '%s'", question)
+            pause.seconds(configs.cache_warmup_interval_secs)
+        return count
+
+    def _fork(self) -> ChatSession:
+        """Fork the conversation into a throwaway (not journaled) chat session.
+        :return: A chat session holding a copy of the conversation context.
+        """
+        session = ChatSession(self.SESSION_ID, shared.engine, shared.mode, journaled=False)
+        session.context.replay(shared.context.records())
+        return session
+
+assert (warmup := CacheWarmup().INSTANCE) is not None
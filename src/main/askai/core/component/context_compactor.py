@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: context_compactor.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.askai_configs import configs
+from askai.core.askai_prompt import prompt
+from askai.core.engine.openai.temperature import Temperature
+from askai.core.support.chat_context import ChatContext, ContextEntry
+from askai.core.support.langchain_support import lc_llm
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from hspylib.core.metaclass.singleton import Singleton
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import PromptTemplate
+
+import logging as log
+import os
+
+
+class ContextCompactor(metaclass=Singleton):
+    """Keep long conversations within a bounded prompt size, by replacing the oldest chat context entries with a
+    running summary once the context reaches the configured high-water mark. Summaries are generated in background,
+    one at a time, by the (cheap) configured compaction model.
+    """
+
+    INSTANCE: "ContextCompactor"
+
+    # The maximum number of words of a summary.
+    MAX_WORDS: int = 250
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="context-compactor")
+        self._compactions: int = 0
+
+    @property
+    def compactions(self) -> int:
+        return self._compactions
+
+    def attach(self, context: ChatContext) -> None:
+        """Enable the compaction mode of the chat context, when configured.
+        :param context: The chat context to compact.
+        """
+        if configs.is_context_compaction:
+            high_water: float = configs.context_compaction_high_water
+            context.compact_with(partial(self._submit, context), high_water)
+            log.info("ContextCompactor::[ATTACHED] high-water=%d%% of %d tokens", high_water * 100, context.token_limit)
+
+    def summarize(self, entries: list[ContextEntry]) -> str | None:
+        """Summarize the chat context entries.
+        :param entries: The entries to summarize.
+        :return: The summary, or None if it could not be generated.
+        """
+        template = PromptTemplate(
+            input_variables=["conversation", "max_words"], template=prompt.read_prompt("context-summary")
+        )
+        conversation: str = os.linesep.join(f"{e.role}: {e.content}" for e in entries)
+        final_prompt: str = template.format(conversation=conversation, max_words=self.MAX_WORDS)
+        llm = lc_llm.create_chat_model(Temperature.COLDEST.temp, configs.context_compaction_model)
+        response: AIMessage = llm.invoke(final_prompt)
+        return response.content if response else None
+
+    def _submit(self, context: ChatContext, key: str, entries: list[ContextEntry]) -> None:
+        """Summarize the entries in background, then hand the summary back to the chat context.
+        :param context: The chat context being compacted.
+        :param key: The identifier for the context.
+        :param entries: The oldest entries of the context.
+        """
+        self._executor.submit(self._compact, context, key, entries)
+
+    def _compact(self, context: ChatContext, key: str, entries: list[ContextEntry]) -> None:
+        """Summarize the entries and hand the summary back to the chat context.
+        :param context: The chat context being compacted.
+        :param key: The identifier for the context.
+        :param entries: The oldest entries of the context.
+        """
+        summary: str | None = None
+        try:
+            log.info("ContextCompactor::[SUMMARIZING] '%s' %d entries", key, len(entries))
+            if summary := self.summarize(entries):
+                self._compactions += 1
+        except Exception as err:
+            log.error("ContextCompactor::[FAILED] '%s' %s", key, err)
+        finally:
+            context.compact(key, entries, summary)
+
+
+assert (compactor := ContextCompactor().INSTANCE) is not None
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: context_journal.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.cache_service import CACHE_DIR, ensure_dir
+from hspylib.core.enums.charset import Charset
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterable, Iterator, Optional
+
+import json
+import logging as log
+import os
+
+# Chat context journals directory.
+JOURNAL_DIR: Path = Path(str(CACHE_DIR) + "/journal")
+
+# Journal record type.
+JournalRecord = dict[str, Any]
+
+# Format name and version, written as the header (first record) of the journal and snapshot files.
+JOURNAL_FORMAT: str = "askai-journal"
+
+JOURNAL_VERSION: int = 1
+
+
+class ContextJournal:
+    """Provide an append-only JSONL journal, per session, for the conversation persistence. Records are buffered and
+    written in a single append per turn (see flush). Once enough records were appended, the journal is compacted: the
+    current state is written into a snapshot file and the journal is truncated. Loading is a replay of the snapshot
+    followed by the journal tail. Both files start with a header record holding the format version; files without
+    it are read as version 1.
+    """
+
+    def __init__(self, name: str, compact_every: int = 200):
+        self._name: str = name
+        self._compact_every: int = compact_every
+        self._session_id: Optional[str] = None
+        self._pending: list[str] = []
+        self._appended: int = 0
+        self._lock = Lock()
+
+    def __str__(self):
+        return f"ContextJournal(name={self._name}, session={self._session_id}, appended={self._appended})"
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def session_id(self) -> Optional[str]:
+        return self._session_id
+
+    @property
+    def is_open(self) -> bool:
+        return self._session_id is not None
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self._appended >= self._compact_every
+
+    def journal_file(self, session_id: Optional[str] = None) -> Path:
+        """Return the journal file of the session.
+        :param session_id: The session ID (defaults to the open session).
+        :return: The journal file path.
+        """
+        return Path(JOURNAL_DIR, f"askai-{self._name}-{session_id or self._session_id}.jsonl")
+
+    def snapshot_file(self, session_id: Optional[str] = None) -> Path:
+        """Return the snapshot file of the session.
+        :param session_id: The session ID (defaults to the open session).
+        :return: The snapshot file path.
+        """
+        return Path(JOURNAL_DIR, f"askai-{self._name}-{session_id or self._session_id}.snapshot.jsonl")
+
+    def open(self, session_id: str) -> None:
+        """Open the journal of the session. Records are only written while a journal is open.
+        :param session_id: The session ID.
+        """
+        self._session_id = session_id
+        journal_file: Path = self.journal_file()
+        self._appended = sum(1 for _ in self._read(journal_file))
+        log.debug("ContextJournal::[OPEN] '%s' records=%d", journal_file, self._appended)
+
+    def latest_session(self) -> Optional[str]:
+        """Return the most recent session that has journal or snapshot files.
+        :return: The session ID, or None if there is none.
+        """
+        files: list[Path] = list(JOURNAL_DIR.glob(f"askai-{self._name}-*.jsonl")) if JOURNAL_DIR.exists() else []
+        if not files:
+            return None
+        latest: str = max(files, key=lambda f: f.stat().st_mtime).name
+        return latest[len(f"askai-{self._name}-") :].split(".", 1)[0]
+
+    def append(self, record: JournalRecord) -> None:
+        """Buffer a record to be appended on the next flush.
+        :param record: The record to append.
+        """
+        if self.is_open:
+            with self._lock:
+                self._pending.append(json.dumps(record, ensure_ascii=False))
+
+    def flush(self) -> int:
+        """Append the buffered records to the journal, in a single write.
+        :return: The number of appended records.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if pending and self.is_open:
+                ensure_dir(JOURNAL_DIR)
+                with open(self.journal_file(), "a", encoding=Charset.UTF_8.val) as f_journal:
+                    lines: list[str] = pending if f_journal.tell() else [json.dumps(self._header()), *pending]
+                    f_journal.write(os.linesep.join(lines) + os.linesep)
+                self._appended += len(pending)
+        return len(pending)
+
+    def compact(self, records: Iterable[JournalRecord]) -> None:
+        """Replace the snapshot by the given records (the current state) and truncate the journal.
+        :param records: The records that rebuild the current state.
+        """
+        if not self.is_open:
+            return
+        with self._lock:
+            ensure_dir(JOURNAL_DIR)
+            snapshot: Path = self.snapshot_file()
+            tmp_file: Path = snapshot.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding=Charset.UTF_8.val) as f_snapshot:
+                f_snapshot.write(json.dumps(self._header()) + os.linesep)
+                f_snapshot.writelines(json.dumps(r, ensure_ascii=False) + os.linesep for r in records)
+            os.replace(tmp_file, snapshot)
+            self.journal_file().unlink(missing_ok=True)
+            self._appended = 0
+        log.info("ContextJournal::[COMPACTED] '%s'", snapshot)
+
+    def replay(self, session_id: Optional[str] = None) -> Iterator[JournalRecord]:
+        """Stream the records of the session: the snapshot ones, followed by the journal ones.
+        :param session_id: The session ID (defaults to the most recent session).
+        :return: An iterator over the session records.
+        """
+        if session_id := (session_id or self.latest_session()):
+            yield from self._read(self.snapshot_file(session_id))
+            yield from self._read(self.journal_file(session_id))
+
+    @staticmethod
+    def _header() -> JournalRecord:
+        """Return the header record of the journal and snapshot files."""
+        return {"format": JOURNAL_FORMAT, "version": JOURNAL_VERSION}
+
+    @staticmethod
+    def _read(path: Path) -> Iterator[JournalRecord]:
+        """Stream the records of a JSONL file, skipping its header and a torn (partially written) last line. Files
+        written by a newer format version are skipped altogether.
+        :param path: The file path.
+        :return: An iterator over the file records.
+        """
+        if path.exists():
+            with open(path, encoding=Charset.UTF_8.val) as f_records:
+                for line in filter(str.strip, f_records):
+                    try:
+                        record: JournalRecord = json.loads(line)
+                    except json.JSONDecodeError:
+                        log.warning("ContextJournal::[SKIPPED] Invalid record in '%s': '%s'", path, line[:64])
+                        continue
+                    if record.get("format") == JOURNAL_FORMAT:
+                        if (version := record.get("version", JOURNAL_VERSION)) > JOURNAL_VERSION:
+                            log.warning("ContextJournal::[SKIPPED] '%s' has unsupported version %d", path, version)
+                            return
+                        continue
+                    yield record
+
+
+# Journal of the chat context entries.
+context_journal: ContextJournal = ContextJournal("context")
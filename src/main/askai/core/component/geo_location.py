@@ -13,7 +13,7 @@
    Copyright (c) 2024, AskAI
 """
 from askai.core.askai_configs import configs
-from askai.core.component.cache_service import GEO_LOC_CACHE_FILE
+from askai.core.component.cache_service import ensure_dir, GEO_LOC_CACHE_FILE
 from hspylib.core.enums.charset import Charset
 from hspylib.core.metaclass.singleton import Singleton
 from hspylib.core.namespace import Namespace
@@ -65,6 +65,7 @@ class GeoLocation(metaclass=Singleton):
                 url = f"{cls.GEO_LOC_URL}{'/' + ip if ip else ''}"
                 log.debug("Fetching the Geo Position from: %s", url)
                 geo_req = Namespace(body=fetch.get(url).body)
+                ensure_dir(GEO_LOC_CACHE_FILE.parent)
                 with open(str(GEO_LOC_CACHE_FILE), "w") as f_geo_loc:
                     f_geo_loc.write(geo_req.body + os.linesep)
         except (JSONDecodeError, ConnectionError, ReadTimeout) as err:
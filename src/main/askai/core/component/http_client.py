@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: http_client.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.cache_metrics import CacheMetrics
+from hspylib.core.metaclass.singleton import Singleton
+from threading import Lock
+from typing import Any, Optional
+from weakref import WeakKeyDictionary
+
+import asyncio
+import httpx
+
+
+class ConnectionTrace:
+    """Record whether a request had to open a new connection (httpcore 'trace' request extension)."""
+
+    def __init__(self):
+        self.connected: bool = False
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.connected = True
+
+
+class AsyncConnectionTrace(ConnectionTrace):
+    """The ConnectionTrace of the async requests (httpcore awaits the trace extension of those)."""
+
+    async def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        super().__call__(event_name, info)
+
+
+class SharedHttpClient(metaclass=Singleton):
+    """Provide a single keep-alive HTTP client, shared by all AI clients (the engine client and the LangChain chat,
+    LLM and embeddings models), so their requests reuse the pooled connections instead of each opening (and TLS
+    handshaking) its own. Every request is traced: a request that reuses a pooled connection counts as a hit.
+    Async clients have one client per event loop, as the pooled connections are bound to the loop that opened them.
+    """
+
+    INSTANCE: "SharedHttpClient"
+
+    # Same limits as the OpenAI client defaults.
+    LIMITS: httpx.Limits = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=60)
+
+    # Requests are sent with the timeout of the AI client; this is the fallback one.
+    TIMEOUT: httpx.Timeout = httpx.Timeout(600, connect=5)
+
+    def __init__(self):
+        self._client: httpx.Client | None = None
+        self._async_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = WeakKeyDictionary()
+        self._lock = Lock()
+        self._metrics: CacheMetrics = CacheMetrics()
+
+    @property
+    def client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    limits=self.LIMITS,
+                    timeout=self.TIMEOUT,
+                    follow_redirects=True,
+                    event_hooks={"request": [self._on_request], "response": [self._on_response]},
+                )
+        return self._client
+
+    @property
+    def async_client(self) -> Optional[httpx.AsyncClient]:
+        """Return the async client of the running event loop, or None when there is no running loop."""
+        try:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        with self._lock:
+            if (client := self._async_clients.get(loop)) is None:
+                self._async_clients[loop] = client = httpx.AsyncClient(
+                    limits=self.LIMITS,
+                    timeout=self.TIMEOUT,
+                    follow_redirects=True,
+                    event_hooks={"request": [self._on_async_request], "response": [self._on_async_response]},
+                )
+        return client
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        m: CacheMetrics = self._metrics
+        return {"hits": m.hits, "misses": m.misses, "hit_rate": round(m.hit_rate, 4), "requests": m.lookups}
+
+    @staticmethod
+    def _on_request(request: httpx.Request) -> None:
+        """Trace the connection of the request.
+        :param request: The request about to be sent.
+        """
+        request.extensions["trace"] = ConnectionTrace()
+
+    def _on_response(self, response: httpx.Response) -> None:
+        """Record whether the request reused a pooled connection.
+        :param response: The response received (before its body is read).
+        """
+        trace: ConnectionTrace | None = response.request.extensions.get("trace")
+        self._metrics.record(trace is not None and not trace.connected)
+
+    @staticmethod
+    async def _on_async_request(request: httpx.Request) -> None:
+        """Trace the connection of the async request.
+        :param request: The request about to be sent.
+        """
+        request.extensions["trace"] = AsyncConnectionTrace()
+
+    async def _on_async_response(self, response: httpx.Response) -> None:
+        """Record whether the async request reused a pooled connection.
+        :param response: The response received (before its body is read).
+        """
+        self._on_response(response)
+
+    def close(self) -> None:
+        """Close the client and its pooled connections."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        """Close the async client of the running event loop and its pooled connections."""
+        with self._lock:
+            client: httpx.AsyncClient | None = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+assert (http_client := SharedHttpClient().INSTANCE) is not None
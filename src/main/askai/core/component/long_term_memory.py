@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: long_term_memory.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.askai_configs import configs
+from askai.core.askai_prompt import prompt
+from askai.core.component.cache_service import MEMORY_DIR
+from askai.core.support.chat_context import ChatContext
+from askai.core.support.chat_session import ChatSession, current_session
+from askai.core.support.langchain_support import lc_llm
+from askai.core.support.tokenizer import count_tokens
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from hspylib.core.metaclass.singleton import Singleton
+from hspylib.core.tools.text_tools import hash_text
+from hspylib.core.zoned_datetime import now
+from langchain_community.chat_message_histories.in_memory import ChatMessageHistory
+from threading import Lock
+from time import time
+from typing import Iterable, Optional
+from weakref import WeakKeyDictionary
+
+import chromadb
+import logging as log
+import os
+
+
+class LongTermMemory(metaclass=Singleton):
+    """Provide an (opt-in) long-term memory, across sessions. Every conversation turn is embedded, in background, into
+    a local vector index. Prompts then get only a window of the most recent turns of the conversation, instead of the
+    whole chat history; the older turns (of this or of previous sessions) that are most relevant to a question are
+    recalled and injected into the prompts, within a token budget. Turns still in the window are not recalled. The
+    turns of a chat session (see ChatSession) are remembered under its ID, and only recalled by that session.
+    """
+
+    INSTANCE: "LongTermMemory"
+
+    COLLECTION_NAME: str = "long_term_memory"
+
+    def __init__(self):
+        self._db_client = None
+        self._collection = None
+        self._session_id: str = ""
+        self._lock = Lock()
+        self._window: deque[float] = deque(maxlen=max(1, configs.long_term_memory_window))
+        self._session_windows: WeakKeyDictionary[ChatSession, deque[float]] = WeakKeyDictionary()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="long-term-memory")
+
+    @property
+    def collection(self) -> chromadb.Collection:
+        if self._collection is None:
+            self._db_client = chromadb.PersistentClient(path=str(MEMORY_DIR))
+            self._collection = self._db_client.get_or_create_collection(
+                self.COLLECTION_NAME, metadata={"hnsw:space": "cosine"}
+            )
+        return self._collection
+
+    @property
+    def is_enabled(self) -> bool:
+        return configs.is_long_term_memory
+
+    @property
+    def session_id(self) -> str:
+        return session.session_id if (session := current_session.get()) else self._session_id
+
+    @property
+    def owner(self) -> str:
+        """Return the owner of the turns being remembered and recalled: the active chat session; or none (the CLI)."""
+        return session.session_id if (session := current_session.get()) else ""
+
+    @property
+    def count(self) -> int:
+        return self.collection.count()
+
+    def open(self, session_id: str) -> None:
+        """Open the memory for the CLI session. Turns are remembered under this session, unless a chat session is
+        active.
+        :param session_id: The session ID.
+        """
+        self._session_id = session_id
+
+    def remember(self, question: str, answer: str) -> None:
+        """Remember a conversation turn. The turn is embedded and indexed in background.
+        :param question: The user question.
+        :param answer: The AI answer to the question.
+        """
+        if self.is_enabled and question and answer:
+            with self._lock:
+                self._recent_turns().append(timestamp := time())
+            self._executor.submit(self._index, question.strip(), answer.strip(), self.session_id, self.owner, timestamp)
+
+    def window(self, context: ChatContext, session_id: str) -> ChatMessageHistory:
+        """Return the chat history to be sent along with the prompts. When the long-term memory is enabled, it's only
+        the window of the most recent turns (the same turns that are not recalled), plus the pending question, as the
+        older ones are recalled instead. A turn starts at a user question and holds every entry up to the next one
+        (such as the task agent entries and the final answer).
+        :param context: The chat context.
+        :param session_id: The chat context key (the session ID of the runnable message history).
+        :return: The chat history.
+        """
+        history: ChatMessageHistory = context.flat(session_id)
+        if self.is_enabled:
+            questions: list[int] = [i for i, m in enumerate(history.messages) if m.type == "human"]
+            if len(questions) > (turns := self._window.maxlen + 1):
+                history.messages = history.messages[questions[-turns] :]
+        return history
+
+    def recall(self, query: str, max_tokens: int, model_name: str) -> Optional[str]:
+        """Recall the memories most relevant to the query, as a prompt section that fits the token budget.
+        :param query: The query (usually the user question).
+        :param max_tokens: The maximum number of tokens the memories can take (capped by the configured budget).
+        :param model_name: The model used to count the tokens.
+        :return: The prompt section with the recalled memories, or None if nothing was recalled.
+        """
+        if not self.is_enabled or not query:
+            return None
+        where: dict = {"owner": self.owner}
+        with self._lock:
+            # Turns remembered since the oldest one still in the window are part of the chat history already.
+            if recent_turns := self._recent_turns():
+                where = {"$and": [where, {"timestamp": {"$lt": recent_turns[0]}}]}
+        try:
+            if self.collection.count() > 0:
+                result = self.collection.query(
+                    query_embeddings=[lc_llm.create_embeddings().embed_query(query)],
+                    n_results=max(1, configs.long_term_memory_top_k),
+                    where=where,
+                )
+                budget: int = min(max_tokens, configs.long_term_memory_max_tokens)
+                if memories := self.fit(result["documents"][0] if result["documents"] else [], budget, model_name):
+                    log.info("LongTermMemory::[RECALL] '%s' memories=%d", query, len(memories))
+                    memories_str: str = os.linesep.join(f"---{os.linesep}{m}" for m in memories)
+                    return prompt.read_prompt("long-term-memory").format(memories=memories_str)
+        except Exception as err:
+            log.error("LongTermMemory::[RECALL] Failed => %s", err)
+
+        return None
+
+    @staticmethod
+    def fit(memories: Iterable[str], max_tokens: int, model_name: str) -> list[str]:
+        """Select, in order, the memories that fit the token budget. Memories that do not fit are skipped, so a large
+        memory does not prevent the smaller (less relevant) ones from being recalled.
+        :param memories: The memories, from the most to the least relevant.
+        :param max_tokens: The token budget.
+        :param model_name: The model used to count the tokens.
+        :return: The memories that fit the budget.
+        """
+        selected: list[str] = []
+        for memory in memories:
+            if (tokens := count_tokens(memory, model_name)) <= max_tokens:
+                selected.append(memory)
+                max_tokens -= tokens
+        return selected
+
+    def forget(self) -> int:
+        """Wipe all memories.
+        :return: The number of forgotten memories.
+        """
+        if (count := self.collection.count()) > 0:
+            self._db_client.delete_collection(self.COLLECTION_NAME)
+            self._collection = None
+        return count
+
+    def _recent_turns(self) -> deque[float]:
+        """Return the times the turns in the window of the active chat session (or of the CLI) were remembered.
+        :return: The remembered times of the turns, from the oldest to the newest.
+        """
+        if (session := current_session.get()) is None:
+            return self._window
+        if (recent_turns := self._session_windows.get(session)) is None:
+            recent_turns = self._session_windows[session] = deque(maxlen=self._window.maxlen)
+        return recent_turns
+
+    def _index(self, question: str, answer: str, session_id: str, owner: str, timestamp: float) -> None:
+        """Embed and index a conversation turn.
+        :param question: The user question.
+        :param answer: The AI answer to the question.
+        :param session_id: The session the turn belongs to.
+        :param owner: The chat session that owns the turn; or none (the CLI).
+        :param timestamp: The time the turn was remembered.
+        """
+        document: str = f"human: {question}{os.linesep}assistant: {answer}"
+        try:
+            self.collection.upsert(
+                ids=[hash_text(document)],
+                embeddings=[lc_llm.create_embeddings().embed_query(document)],
+                documents=[document],
+                metadatas=[{"session": session_id, "owner": owner, "created": now(), "timestamp": timestamp}],
+            )
+            log.debug("LongTermMemory::[REMEMBERED] '%s'", question)
+        except Exception as err:
+            log.error("LongTermMemory::[FAILED] '%s' %s", question, err)
+
+
+assert (long_term_memory := LongTermMemory().INSTANCE) is not None
@@ -17,7 +17,7 @@ from askai.__classpath__ import classpath
 from askai.core.askai_configs import configs
 from askai.core.askai_events import events
 from askai.core.askai_messages import msg
-from askai.core.component.cache_service import FACE_DIR, IMG_IMPORTS_DIR, PHOTO_DIR
+from askai.core.component.cache_service import ensure_dir, FACE_DIR, IMG_IMPORTS_DIR, PHOTO_DIR
 from askai.core.component.image_store import ImageData, ImageFile, ImageMetadata, store
 from askai.core.component.multimedia.audio_player import player
 from askai.core.model.ai_reply import AIReply
@@ -121,7 +121,7 @@ class Camera(metaclass=Singleton):
             raise CameraAccessFailure("Failed to take a photo from WebCam!")
 
         filename: str = filename or str(now_ms())
-        final_path: str = build_img_path(PHOTO_DIR, str(filename), "-PHOTO.jpg")
+        final_path: str = build_img_path(ensure_dir(PHOTO_DIR), str(filename), "-PHOTO.jpg")
         if final_path and cv2.imwrite(final_path, photo):
             log.debug("WebCam photo taken: %s", final_path)
             photo_file = ImageFile(
@@ -162,7 +162,7 @@ class Camera(metaclass=Singleton):
         filename: str = filename or str(now_ms())
         for x, y, w, h in faces:
             cropped_face: ImageData = photo[y : y + h, x : x + w]
-            final_path: str = build_img_path(FACE_DIR, str(filename), f"-FACE-{len(face_files)}.jpg")
+            final_path: str = build_img_path(ensure_dir(FACE_DIR), str(filename), f"-FACE-{len(face_files)}.jpg")
             if final_path and cv2.imwrite(final_path, cropped_face):
                 result: ImageResult = ImageResult.of(image_captioner(final_path))
                 face_file = ImageFile(
@@ -214,7 +214,7 @@ class Camera(metaclass=Singleton):
         faces: list[ImageFile] = []
 
         def _import_file(src_path: str) -> str:
-            dest_path: str = os.path.join(IMG_IMPORTS_DIR, basename(src_path))
+            dest_path: str = os.path.join(ensure_dir(IMG_IMPORTS_DIR), basename(src_path))
             shutil.copyfile(src_path, dest_path)
             return dest_path
 
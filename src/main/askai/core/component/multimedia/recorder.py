@@ -15,7 +15,7 @@ Copyright (c) 2024, AskAI
 from askai.core.askai_configs import configs
 from askai.core.askai_events import events
 from askai.core.askai_messages import msg
-from askai.core.component.cache_service import REC_DIR
+from askai.core.component.cache_service import ensure_dir, REC_DIR
 from askai.core.component.scheduler import scheduler
 from askai.core.model.ai_reply import AIReply
 from askai.core.support.utilities import display_text, seconds
@@ -181,7 +181,7 @@ class Recorder(metaclass=Singleton):
             try:
                 stop_event.clear()
                 counter_thread = threading.Thread(target=self.countdown, args=(limit, stop_event, counter_msg))
-                audio_path = audio_path or Path(f"{REC_DIR}/askai-stt-{now_ms()}.wav")
+                audio_path = audio_path or Path(f"{ensure_dir(REC_DIR)}/askai-stt-{now_ms()}.wav")
                 self._detect_noise()
                 counter_thread.start()
                 events.listening.emit()
@@ -223,7 +223,7 @@ class Recorder(metaclass=Singleton):
         :return: A string containing the dictated text. If transcription fails, None will be returned.
         """
         dictated_text: str = ""
-        audio_path: Path = Path(f"{REC_DIR}/askai-dictate-{now_ms()}.wav")
+        audio_path: Path = Path(f"{ensure_dir(REC_DIR)}/askai-dictate-{now_ms()}.wav")
 
         while True:
             _, phrase = self.listen(recognition_api, language, audio_path, False, False, msg.dictating())
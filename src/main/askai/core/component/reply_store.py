@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: reply_store.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.cache_codec import compress, decompress
+from hspylib.core.metaclass.classpath import AnyPath
+from hspylib.core.preconditions import check_not_none
+from threading import Lock
+from time import time
+from typing import Optional
+
+import sqlite3
+
+
+class ReplyStore:
+    """Provide an indexed, persistent key/value store for the AI replies. The store is backed by a single SQLite table
+    (WAL journal) holding the key, reply, creation and expiration timestamps, so inserts and deletes are indexed by the
+    primary key, and listing or clearing does not require rewriting a key set. Replies above the compression threshold
+    are stored compressed.
+    """
+
+    # fmt: off
+    _DDL: str = (
+        "CREATE TABLE IF NOT EXISTS replies ("
+        "  key      TEXT PRIMARY KEY,"
+        "  reply    TEXT NOT NULL,"
+        "  created  REAL NOT NULL,"
+        "  expires  REAL NOT NULL"
+        ")"
+    )
+    # fmt: on
+
+    def __init__(self, db_path: AnyPath, compress_threshold: int = 0):
+        self._lock = Lock()
+        self._db_path: str = str(db_path)
+        self._compress_threshold: int = compress_threshold
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(self._DDL)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS replies_expires ON replies (expires)")
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
+    @property
+    def size_bytes(self) -> int:
+        """Return the size of the database (allocated pages) in bytes."""
+        with self._lock:
+            page_count: int = self._conn.execute("PRAGMA page_count").fetchone()[0]
+            return page_count * self._conn.execute("PRAGMA page_size").fetchone()[0]
+
+    def put(self, key: str, reply: str, ttl_minutes: float) -> str:
+        """Insert or replace the reply identified by key.
+        :param key: The reply key.
+        :param reply: The reply to store.
+        :param ttl_minutes: The time-to-live of the entry in minutes.
+        :return: The key under which the reply was stored.
+        """
+        check_not_none((key, reply))
+        created: float = time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO replies (key, reply, created, expires) VALUES (?, ?, ?, ?)",
+                (key, compress(reply, self._compress_threshold), created, created + ttl_minutes * 60),
+            )
+        return key
+
+    def get(self, key: str) -> Optional[str]:
+        """Retrieve the non-expired reply identified by key.
+        :param key: The reply key.
+        :return: The stored reply, or None if not found or expired.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT reply FROM replies WHERE key = ? AND expires > ?", (key, time())
+            ).fetchone()
+        return decompress(row[0]) if row else None
+
+    def delete(self, key: str) -> bool:
+        """Delete the reply identified by key.
+        :param key: The reply key.
+        :return: True if an entry was deleted, False otherwise.
+        """
+        with self._lock:
+            return self._conn.execute("DELETE FROM replies WHERE key = ?", (key,)).rowcount > 0
+
+    def keys(self, prefix: str = "") -> list[str]:
+        """List the non-expired keys, optionally restricted to the ones starting with prefix. The prefix lookup is
+        resolved as a range scan over the primary key index.
+        :param prefix: The key prefix to filter by (default is all keys).
+        :return: The sorted list of matching keys.
+        """
+        sql: str = "SELECT key FROM replies WHERE expires > ?"
+        args: list = [time()]
+        if prefix:
+            sql += " AND key >= ? AND key < ?"
+            args += [prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)]
+        with self._lock:
+            return [row[0] for row in self._conn.execute(f"{sql} ORDER BY key", args)]
+
+    def count(self) -> int:
+        """Return the number of non-expired entries.
+        :return: The number of entries in the store.
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM replies WHERE expires > ?", (time(),)).fetchone()[0]
+
+    def clear(self) -> list[str]:
+        """Delete all entries in a single transaction.
+        :return: The list of keys that were deleted.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                deleted: list[str] = [row[0] for row in self._conn.execute("SELECT key FROM replies ORDER BY key")]
+                self._conn.execute("DELETE FROM replies")
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        return deleted
+
+    def purge(self) -> int:
+        """Delete all expired entries.
+        :return: The number of purged entries.
+        """
+        with self._lock:
+            return self._conn.execute("DELETE FROM replies WHERE expires <= ?", (time(),)).rowcount
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: semantic_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.askai_configs import configs
+from askai.core.component.cache_metrics import CacheMetrics
+from askai.core.component.cache_service import cache, SEMANTIC_DIR
+from askai.core.support.langchain_support import lc_llm
+from functools import lru_cache
+from hspylib.core.metaclass.singleton import Singleton
+from hspylib.core.tools.text_tools import hash_text
+from openai import APIError
+from time import perf_counter
+from typing import Any, Optional
+
+import chromadb
+import logging as log
+
+
+class SemanticCache(metaclass=Singleton):
+    """Provide a semantic (embedding based) layer on top of the reply cache. Questions are embedded and kept in a local
+    vector index next to the reply store, so paraphrased questions can be answered from previously cached replies. The
+    reply store remains the source of truth for the replies; the index only maps similar questions to cached keys.
+    """
+
+    INSTANCE: "SemanticCache"
+
+    COLLECTION_NAME: str = "semantic_replies"
+
+    def __init__(self):
+        self._db_client = None
+        self._collection = None
+        self._metrics: CacheMetrics = CacheMetrics()
+
+    @property
+    def collection(self) -> chromadb.Collection:
+        if self._collection is None:
+            self._db_client = chromadb.PersistentClient(path=str(SEMANTIC_DIR))
+            self._collection = self._db_client.get_or_create_collection(
+                self.COLLECTION_NAME, metadata={"hnsw:space": "cosine"}
+            )
+        return self._collection
+
+    @property
+    def is_enabled(self) -> bool:
+        return configs.is_cache and configs.is_semantic_cache
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return self._metrics.as_dict(
+            entries=self.collection.count() if self.is_enabled else 0, embeddings=self._embed.cache_info().currsize
+        )
+
+    @lru_cache(maxsize=64)
+    def _embed(self, key: str) -> list[float]:
+        """Embed the provided cache key. Memoized so that a miss followed by a save only embeds the question once.
+        :param key: The normalized cache key to embed.
+        :return: The embedding vector.
+        """
+        return lc_llm.create_embeddings().embed_query(key)
+
+    def read_reply(self, text: str, scope: Optional[str] = None) -> Optional[str]:
+        """Retrieve an AI reply for the text, falling back to the most similar cached question when there is no exact
+        match and the semantic cache is enabled. Similar questions are only matched within the same scope.
+        :param text: The text key to look up in the cache.
+        :param scope: The optional scope that the reply is bound to.
+        :return: The cached reply associated with the text (or a similar one), or None if not found.
+        """
+        if (reply := cache.read_reply(text, scope)) or not self.is_enabled:
+            return reply
+        started: float = perf_counter()
+        reply = self._query(text.strip().lower(), scope)
+        self._metrics.record(reply is not None, perf_counter() - started)
+        return reply
+
+    def _query(self, key: str, scope: Optional[str]) -> Optional[str]:
+        """Look up the reply of the most similar cached question within the scope.
+        :param key: The normalized question.
+        :param scope: The optional scope that the reply is bound to.
+        :return: The cached reply of the most similar question, or None if none is similar enough.
+        """
+        try:
+            if self.collection.count() > 0:
+                result = self.collection.query(
+                    query_embeddings=[self._embed(key)], n_results=1, where={"scope": (scope or "").lower()}
+                )
+                if result["ids"] and result["ids"][0]:
+                    doc_id, meta = result["ids"][0][0], result["metadatas"][0][0]
+                    similarity: float = 1.0 - float(result["distances"][0][0])
+                    if similarity >= configs.semantic_cache_threshold:
+                        if reply := cache.read_reply(meta["key"]):
+                            log.info("SemanticCache::[HIT] '%s' ~ '%s'  score=%.4f", key, meta["key"], similarity)
+                            return reply
+                        log.debug("SemanticCache::[STALE] '%s' expired. Removing from index.", meta["key"])
+                        self.collection.delete(ids=[doc_id])
+                        self._metrics.record_evictions(1)
+                    log.info("SemanticCache::[MISS] '%s' ~ '%s'  score=%.4f", key, meta["key"], similarity)
+                    return None
+            log.info("SemanticCache::[MISS] '%s'  (empty index)", key)
+        except APIError as err:
+            log.error("Semantic cache lookup failed => %s", err)
+
+        return None
+
+    def save_reply(self, text: str, reply: str, scope: Optional[str] = None) -> Optional[str]:
+        """Save an AI reply into the reply cache and index the question for semantic lookups.
+        :param text: The text to be cached.
+        :param reply: The AI reply associated with this text.
+        :param scope: The optional scope that the reply is bound to.
+        :return: The key under which the reply is saved, or None if the save operation fails.
+        """
+        if (key := cache.save_reply(text, reply, scope)) and self.is_enabled:
+            question: str = text.strip().lower()
+            try:
+                self.collection.upsert(
+                    ids=[hash_text(key)],
+                    embeddings=[self._embed(question)],
+                    documents=[question],
+                    metadatas=[{"key": key, "scope": (scope or "").lower()}],
+                )
+            except APIError as err:
+                log.error("Semantic cache indexing failed => %s", err)
+        return key
+
+    def del_reply(self, text: str, scope: Optional[str] = None) -> Optional[str]:
+        """Delete an AI reply from the reply cache and from the semantic index.
+        :param text: The text key whose associated reply is to be deleted from the cache.
+        :param scope: The optional scope that the reply is bound to.
+        :return: The deleted reply key if it existed, or None if no reply was found.
+        """
+        if (deleted := cache.del_reply(text, scope)) and self.is_enabled:
+            self.collection.delete(ids=[hash_text(cache.reply_key(text, scope))])
+        return deleted
+
+    def clear_replies(self) -> list[str]:
+        """Clear all cached replies and wipe the semantic index.
+        :return: A list of keys for the replies that were deleted from the cache.
+        """
+        deleted: list[str] = cache.clear_replies()
+        if self.is_enabled and self.collection.count() > 0:
+            self._db_client.delete_collection(self.COLLECTION_NAME)
+            self._collection = None
+        return deleted
+
+
+assert (semantic_cache := SemanticCache().INSTANCE) is not None
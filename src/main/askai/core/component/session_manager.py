@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: session_manager.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.context_compactor import compactor
+from askai.core.engine.engine_factory import EngineFactory
+from askai.core.support.chat_session import ChatSession
+from hspylib.core.metaclass.singleton import Singleton
+from threading import Lock
+from typing import Any, Optional
+
+import logging as log
+
+
+class SessionManager(metaclass=Singleton):
+    """Create and keep the chat sessions served by this process. Each session gets its own engine (the active engine
+    of the process is left unchanged), chat context and memory, and its context is compacted as the CLI one is.
+    """
+
+    INSTANCE: "SessionManager"
+
+    def __init__(self):
+        self._lock = Lock()
+        self._sessions: dict[str, ChatSession] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self, session_id: str, engine_name: str, model_name: str, mode: Any) -> ChatSession:
+        """Create a chat session, replacing the one with the same ID, if any. Use ChatSession.activate to serve the
+        session conversation.
+        :param session_id: The session ID, also used to journal (and restore) the session context.
+        :param engine_name: The name of the AI engine of the session.
+        :param model_name: The name of the model to use with the AI engine.
+        :param mode: The session routing mode.
+        :return: A new ChatSession instance.
+        """
+        session = ChatSession(session_id, EngineFactory.new_engine(engine_name, model_name), mode)
+        compactor.attach(session.context)
+        with self._lock:
+            self._sessions[session_id] = session
+        log.info("SessionManager::[CREATED] %s", session)
+        return session
+
+    def get(self, session_id: str) -> Optional[ChatSession]:
+        """Return the chat session.
+        :param session_id: The session ID.
+        :return: The chat session, or None if there is none with the ID.
+        """
+        return self._sessions.get(session_id)
+
+    def close(self, session_id: str) -> Optional[ChatSession]:
+        """Close the chat session, saving its context.
+        :param session_id: The session ID.
+        :return: The closed chat session, or None if there is none with the ID.
+        """
+        with self._lock:
+            session: ChatSession | None = self._sessions.pop(session_id, None)
+        if session is not None:
+            session.context.save()
+            log.info("SessionManager::[CLOSED] %s", session)
+        return session
+
+
+assert (sessions := SessionManager().INSTANCE) is not None
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: single_flight.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from concurrent.futures import Future
+from copy import deepcopy
+from hspylib.core.metaclass.singleton import Singleton
+from hspylib.core.tools.text_tools import hash_text
+from threading import Lock
+from typing import Any, Callable, TypeVar
+
+import json
+import logging as log
+
+T = TypeVar("T")
+
+
+class SingleFlight(metaclass=Singleton):
+    """Provide request coalescing for the LLM calls. Concurrent calls sharing the same fingerprint (model, temperature
+    and messages) wait on the future of the call that is already in flight, instead of issuing their own round trip.
+    Each coalesced caller gets its own copy of the result, so callers never mutate a shared response. Nothing is kept
+    once the call completes; this is not a cache.
+    """
+
+    INSTANCE: "SingleFlight"
+
+    @staticmethod
+    def fingerprint(*parts: Any) -> str:
+        """Return the fingerprint of a request made of the given parts.
+        :param parts: The request parts (model, temperature, messages, etc.).
+        :return: The request fingerprint.
+        """
+        return hash_text(json.dumps(parts, sort_keys=True, default=str))
+
+    def __init__(self):
+        self._lock = Lock()
+        self._in_flight: dict[str, Future] = {}
+        self._calls: int = 0
+        self._coalesced: int = 0
+
+    @property
+    def calls(self) -> int:
+        return self._calls
+
+    @property
+    def coalesced(self) -> int:
+        return self._coalesced
+
+    @property
+    def ratio(self) -> float:
+        """Return the coalescing ratio, i.e., the fraction of calls that were served by another in-flight call."""
+        return self._coalesced / self._calls if self._calls else 0.0
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        return {"calls": self.calls, "coalesced": self.coalesced, "ratio": round(self.ratio, 4)}
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Execute fn, unless a call with the same key is already in flight, in which case wait for its result.
+        :param key: The request fingerprint.
+        :param fn: The function that performs the request.
+        :return: The result of the request (a copy of it, for the coalesced callers).
+        """
+        with self._lock:
+            self._calls += 1
+            if leader := (future := self._in_flight.get(key)) is None:
+                future = self._in_flight[key] = Future()
+            else:
+                self._coalesced += 1
+        if not leader:
+            log.info("SingleFlight::[COALESCED] key='%s'  ratio=%.2f", key, self.ratio)
+            return deepcopy(future.result())
+        try:
+            result: T = fn()
+            future.set_result(result)
+            return result
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+assert (single_flight := SingleFlight().INSTANCE) is not None
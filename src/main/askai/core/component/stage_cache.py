@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.component
+      @file: stage_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.askai_configs import configs
+from askai.core.component.cache_metrics import CacheMetrics
+from askai.core.component.cache_service import ASKAI_STAGES_DB_FILE, CACHE_DIR, ensure_dir
+from askai.core.component.reply_store import ReplyStore
+from hspylib.core.metaclass.singleton import Singleton
+from hspylib.core.tools.text_tools import hash_text
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Optional
+
+import logging as log
+
+
+class StageCache(metaclass=Singleton):
+    """Provide a cache for the intermediate artifacts of the splitter pipeline (action plans, accuracy evaluations and
+    wrapped answers), so that a re-asked or retried query skips the stages it has already paid for. Artifacts are the
+    raw LLM outputs, keyed by the stage, the prompt version, and a hash of the question, relevant context and model.
+    Entries created with a previous version of the stage prompt are dropped the first time the new version is seen.
+    """
+
+    INSTANCE: "StageCache"
+
+    def __init__(self):
+        self._stage_store: ReplyStore | None = None
+        self._versions: dict[str, str] = {}
+        self._metrics: CacheMetrics = CacheMetrics()
+
+    @property
+    def _store(self) -> ReplyStore:
+        """Open the artifact store (purging the expired artifacts) the first time it is used."""
+        if self._stage_store is None:
+            ensure_dir(CACHE_DIR)
+            self._stage_store = ReplyStore(ASKAI_STAGES_DB_FILE, configs.cache_compression_threshold)
+            self._metrics.record_evictions(self._stage_store.purge())
+        return self._stage_store
+
+    @property
+    def hits(self) -> int:
+        return self._metrics.hits
+
+    @property
+    def misses(self) -> int:
+        return self._metrics.misses
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return self._metrics.as_dict(entries=self._store.count(), bytes=self._store.size_bytes)
+
+    @property
+    def is_enabled(self) -> bool:
+        return configs.is_stage_cache
+
+    @staticmethod
+    def key(stage: str, prompt_version: str, *parts: str) -> str:
+        """Return the artifact key for the given stage, prompt version and stage inputs.
+        :param stage: The pipeline stage name.
+        :param prompt_version: The version of the prompt used by the stage.
+        :param parts: The stage inputs (question, relevant context, model, etc.).
+        :return: The artifact key.
+        """
+        return f"{stage}:{prompt_version}:{hash_text(chr(31).join(map(str, parts)))}"
+
+    def memoize(
+        self, stage: str, prompt_version: str, parts: list[str], fn: Callable[[], Optional[str]]
+    ) -> Optional[str]:
+        """Return the cached artifact for the stage inputs, or compute and cache it.
+        :param stage: The pipeline stage name.
+        :param prompt_version: The version of the prompt used by the stage.
+        :param parts: The stage inputs (question, relevant context, model, etc.).
+        :param fn: The function that computes the artifact when it is not cached.
+        :return: The stage artifact.
+        """
+        if not self.is_enabled:
+            return fn()
+        key, artifact = self._lookup(stage, prompt_version, parts)
+        return artifact if artifact is not None else self._store_artifact(key, fn())
+
+    async def amemoize(
+        self, stage: str, prompt_version: str, parts: list[str], fn: Callable[[], Awaitable[Optional[str]]]
+    ) -> Optional[str]:
+        """Return the cached artifact for the stage inputs, or await its computation and cache it.
+        :param stage: The pipeline stage name.
+        :param prompt_version: The version of the prompt used by the stage.
+        :param parts: The stage inputs (question, relevant context, model, etc.).
+        :param fn: The coroutine function that computes the artifact when it is not cached.
+        :return: The stage artifact.
+        """
+        if not self.is_enabled:
+            return await fn()
+        key, artifact = self._lookup(stage, prompt_version, parts)
+        return artifact if artifact is not None else self._store_artifact(key, await fn())
+
+    def _lookup(self, stage: str, prompt_version: str, parts: list[str]) -> tuple[str, Optional[str]]:
+        """Look up the cached artifact for the stage inputs.
+        :param stage: The pipeline stage name.
+        :param prompt_version: The version of the prompt used by the stage.
+        :param parts: The stage inputs (question, relevant context, model, etc.).
+        :return: A tuple containing the artifact key and the cached artifact (None on a miss).
+        """
+        self._invalidate(stage, prompt_version)
+        key: str = self.key(stage, prompt_version, *parts)
+        started: float = perf_counter()
+        if self._metrics.record((artifact := self._store.get(key)) is not None, perf_counter() - started):
+            log.info("StageCache::[HIT] stage='%s'  key='%s'", stage, key)
+        else:
+            log.debug("StageCache::[MISS] stage='%s'  key='%s'", stage, key)
+        return key, artifact
+
+    def _store_artifact(self, key: str, artifact: Optional[str]) -> Optional[str]:
+        """Cache the computed artifact, unless it is None.
+        :param key: The artifact key.
+        :param artifact: The computed artifact.
+        :return: The artifact.
+        """
+        if artifact is not None:
+            self._store.put(key, artifact, configs.ttl)
+        return artifact
+
+    def clear(self) -> list[str]:
+        """Clear all cached stage artifacts.
+        :return: The list of deleted artifact keys.
+        """
+        return self._store.clear()
+
+    def _invalidate(self, stage: str, prompt_version: str) -> None:
+        """Drop the artifacts of the stage that were created with a different prompt version.
+        :param stage: The pipeline stage name.
+        :param prompt_version: The current version of the prompt used by the stage.
+        """
+        if self._versions.get(stage) != prompt_version:
+            self._versions[stage] = prompt_version
+            current: str = f"{stage}:{prompt_version}:"
+            if stale := [k for k in self._store.keys(f"{stage}:") if not k.startswith(current)]:
+                self._metrics.record_evictions(sum(map(self._store.delete, stale)))
+                log.info("StageCache::[INVALIDATE] stage='%s'  %d stale artifact(s) removed", stage, len(stale))
+
+
+assert (stage_cache := StageCache().INSTANCE) is not None
@@ -10,6 +10,7 @@ __all__ = [
     'ai_model', 
     'ai_vision', 
     'engine_factory', 
-    'openai'
+    'openai', 
+    'replay'
 ]
 __version__ = '1.2.15'
@@ -19,7 +19,7 @@ from askai.core.model.ai_reply import AIReply
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import BaseChatModel, BaseLLM
 from pathlib import Path
-from typing import Optional, Protocol
+from typing import Iterator, Optional, Protocol
 
 
 class AIEngine(Protocol):
@@ -60,9 +60,10 @@ class AIEngine(Protocol):
         """
         ...
 
-    def lc_chat_model(self, temperature: float = 0.0) -> BaseChatModel:
+    def lc_chat_model(self, temperature: float = 0.0, model_name: Optional[str] = None) -> BaseChatModel:
         """Create a LangChain LLM chat model instance using the current AI engine.
         :param temperature: The LLM chat model temperature.
+        :param model_name: The model to use instead of the engine's one (optional).
         :return: An instance of BaseChatModel.
         """
         ...
@@ -101,6 +102,24 @@ class AIEngine(Protocol):
         """
         ...
 
+    async def ask_async(self, chat_context: list[dict], temperature: float = 0.8, top_p: float = 0.0) -> AIReply:
+        """Ask AI assistance for the given question, without blocking the event loop.
+        :param chat_context: The chat history or context.
+        :param temperature: The model engine temperature.
+        :param top_p: The model engine top_p.
+        :return: The AI's reply.
+        """
+        ...
+
+    def ask_stream(self, chat_context: list[dict], temperature: float = 0.8, top_p: float = 0.0) -> Iterator[str]:
+        """Ask AI assistance for the given question and stream the response, as it's generated.
+        :param chat_context: The chat history or context.
+        :param temperature: The model engine temperature.
+        :param top_p: The model engine top_p.
+        :return: An iterator over the response text chunks.
+        """
+        ...
+
     def text_to_speech(self, text: str, prefix: str = "", stream: bool = True, playback: bool = True) -> Optional[Path]:
         """Convert the provided text to speech.
         :param text: The text to convert to speech.
@@ -123,3 +142,10 @@ class AIEngine(Protocol):
         :return: The number of tokens in the text.
         """
         ...
+
+    def calculate_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Calculate the number of tokens for each of the given texts.
+        :param texts: The texts for which to calculate tokens.
+        :return: The number of tokens in each text.
+        """
+        ...
@@ -13,10 +13,14 @@
    Copyright (c) 2024, AskAI
 """
 
+from askai.core.askai_configs import configs
 from askai.core.engine.ai_engine import AIEngine
 from askai.core.engine.ai_model import AIModel
 from askai.core.engine.openai.openai_engine import OpenAIEngine
 from askai.core.engine.openai.openai_model import OpenAIModel
+from askai.core.engine.replay.cassette import Cassette
+from askai.core.engine.replay.latency import Latency
+from askai.core.engine.replay.replay_engine import ReplayEngine
 from askai.exception.exceptions import NoSuchEngineError
 from hspylib.core.metaclass.singleton import Singleton
 from hspylib.core.preconditions import check_not_none
@@ -31,7 +35,18 @@ class EngineFactory(metaclass=Singleton):
 
     @classmethod
     def create_engine(cls, engine_name: str | list[str], engine_model: str | list[str]) -> AIEngine:
-        """Create the suitable AI engine according to the provided engine name.
+        """Create the suitable AI engine according to the provided engine name, and make it the active one.
+        :param engine_name: The AI engine name(s).
+        :param engine_model: The AI engine model(s).
+        :return: An instance of AIEngine.
+        """
+        cls._ACTIVE_AI_ENGINE = cls.new_engine(engine_name, engine_model)
+        return cls._ACTIVE_AI_ENGINE
+
+    @classmethod
+    def new_engine(cls, engine_name: str | list[str], engine_model: str | list[str]) -> AIEngine:
+        """Create the suitable AI engine according to the provided engine name, leaving the active one unchanged
+        (e.g. for the chat sessions).
         :param engine_name: The AI engine name(s).
         :param engine_model: The AI engine model(s).
         :return: An instance of AIEngine.
@@ -41,14 +56,20 @@ class EngineFactory(metaclass=Singleton):
         match engine_name:
             case "openai":
                 model: AIModel = OpenAIModel.of_name(model_name) if model_name else None
-                cls._ACTIVE_AI_ENGINE = OpenAIEngine(model or OpenAIModel.GPT_4_O_MINI)
+                return OpenAIEngine(model or OpenAIModel.GPT_4_O_MINI)
+            case "replay":
+                model: AIModel = OpenAIModel.of_name(model_name) if model_name else OpenAIModel.GPT_4_O_MINI
+                return ReplayEngine(
+                    model,
+                    Cassette(configs.replay_cassette, fallback=configs.is_replay_fallback),
+                    Latency(configs.replay_latency),
+                    OpenAIEngine(model) if configs.is_replay_record else None,
+                )
             case "gemini":
                 raise NoSuchEngineError("Google 'gemini' is not yet implemented!")
             case _:
                 raise NoSuchEngineError(f"Engine name: {engine_name}  model: {engine_model}")
 
-        return cls._ACTIVE_AI_ENGINE
-
     @classmethod
     def active_ai(cls) -> AIEngine:
         """Get the currently active AI engine.
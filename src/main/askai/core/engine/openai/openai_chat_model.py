@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.engine.openai
+      @file: openai_chat_model.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.single_flight import single_flight
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+from typing import Any, Optional
+
+import langchain_openai
+
+
+class OpenAIChatModel(langchain_openai.ChatOpenAI):
+    """Provide a LangChain OpenAI chat model whose identical concurrent generations share a single round trip."""
+
+    def fingerprint(self, messages: list[BaseMessage], stop: Optional[list[str]] = None, **kwargs: Any) -> str:
+        """Return the single-flight fingerprint of a generation request. Messages are fingerprinted by everything that
+        is sent to the model (content, name, tool calls, etc.), except their ids and response metadata.
+        :param messages: The request messages.
+        :param stop: The stop words.
+        :param kwargs: The remaining request arguments (e.g. the bound tools).
+        :return: The request fingerprint.
+        """
+        parts: list[dict] = [m.model_dump(exclude={"id", "response_metadata", "usage_metadata"}) for m in messages]
+        return single_flight.fingerprint(self.model_name, self.temperature, parts, stop, kwargs)
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        key: str = self.fingerprint(messages, stop, **kwargs)
+        generate = super()._generate
+        return single_flight.do(key, lambda: generate(messages, stop, run_manager, **kwargs))
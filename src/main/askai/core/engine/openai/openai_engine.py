@@ -13,28 +13,31 @@
    Copyright (c) 2024, AskAI
 """
 from askai.core.component.cache_service import cache
+from askai.core.component.http_client import http_client
 from askai.core.component.multimedia.audio_player import player
 from askai.core.component.multimedia.recorder import Recorder
+from askai.core.component.single_flight import single_flight
 from askai.core.component.text_streamer import streamer
 from askai.core.engine.ai_model import AIModel
 from askai.core.engine.ai_vision import AIVision
+from askai.core.engine.openai.openai_chat_model import OpenAIChatModel
 from askai.core.engine.openai.openai_configs import OpenAiConfigs
 from askai.core.engine.openai.openai_model import OpenAIModel
 from askai.core.engine.openai.openai_vision import OpenAIVision
 from askai.core.model.ai_reply import AIReply
+from askai.core.support.tokenizer import count_tokens, count_tokens_batch
 from hspylib.core.preconditions import check_not_none
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import BaseChatModel, BaseLLM
-from openai import APIError, OpenAI
+from openai import APIError, AsyncOpenAI, OpenAI
 from pathlib import Path
 from threading import Thread
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import langchain_openai
 import logging as log
 import os
 import pause
-import tiktoken
 
 
 class OpenAIEngine:
@@ -45,7 +48,7 @@ class OpenAIEngine:
         self._model: AIModel = model
         self._configs: OpenAiConfigs = OpenAiConfigs.INSTANCE
         self._api_key: str = os.environ.get("OPENAI_API_KEY")
-        self._client = OpenAI(api_key=self._api_key)
+        self._client = OpenAI(api_key=self._api_key, http_client=http_client.client)
         self._vision = OpenAIVision()
 
     def __str__(self):
@@ -59,6 +62,11 @@ class OpenAIEngine:
     def client(self) -> OpenAI:
         return self._client
 
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Return an async client over the pooled connections of the running event loop."""
+        return AsyncOpenAI(api_key=self._api_key, http_client=http_client.async_client)
+
     @property
     def whisper_voices(self) -> list[str]:
         return [
@@ -102,16 +110,24 @@ class OpenAIEngine:
         :return: An instance of BaseLLM.
         """
         return langchain_openai.OpenAI(
-            model=self._model.model_name(), temperature=temperature, top_p=top_p
+            model=self._model.model_name(),
+            temperature=temperature,
+            top_p=top_p,
+            http_client=http_client.client,
+            http_async_client=http_client.async_client,
         )
 
-    def lc_chat_model(self, temperature: float) -> BaseChatModel:
+    def lc_chat_model(self, temperature: float, model_name: Optional[str] = None) -> BaseChatModel:
         """Create a LangChain LLM chat model instance using the current AI engine.
         :param temperature: The LLM chat model temperature.
+        :param model_name: The model to use instead of the engine's one (optional).
         :return: An instance of BaseChatModel.
         """
-        return langchain_openai.ChatOpenAI(
-            model=self._model.model_name(), temperature=temperature
+        return OpenAIChatModel(
+            model=model_name or self._model.model_name(),
+            temperature=temperature,
+            http_client=http_client.client,
+            http_async_client=http_client.async_client,
         )
 
     def lc_embeddings(self, model: str) -> Embeddings:
@@ -119,7 +135,9 @@ class OpenAIEngine:
         :param model: The LLM embeddings model string.
         :return: An instance of Embeddings.
         """
-        return langchain_openai.OpenAIEmbeddings(model=model)
+        return langchain_openai.OpenAIEmbeddings(
+            model=model, http_client=http_client.client, http_async_client=http_client.async_client
+        )
 
     def ai_name(self) -> str:
         """Get the AI engine name.
@@ -149,17 +167,65 @@ class OpenAIEngine:
         try:
             check_not_none(chat_context)
             log.debug(f"Generating AI answer")
-            response = self.client.chat.completions.create(
+            key: str = single_flight.fingerprint(self.ai_model_name(), temperature, top_p, chat_context)
+            response = single_flight.do(
+                key,
+                lambda: self.client.chat.completions.create(
+                    model=self.ai_model_name(), messages=chat_context, temperature=temperature, top_p=top_p
+                ),
+            )
+            reply = AIReply.info(response.choices[0].message.content)
+            log.debug("Response received from LLM: %s", str(reply))
+        except APIError as error:
+            reply = self._error_reply(error)
+
+        return reply
+
+    async def ask_async(self, chat_context: List[dict], temperature: float = 0.8, top_p: float = 0.0) -> AIReply:
+        """Ask AI assistance for the given question, without blocking the event loop.
+        :param chat_context: The chat history or context.
+        :param temperature: The model engine temperature.
+        :param top_p: The model engine top_p.
+        :return: The AI's reply.
+        """
+        try:
+            check_not_none(chat_context)
+            log.debug(f"Generating AI answer (async)")
+            response = await self.async_client.chat.completions.create(
                 model=self.ai_model_name(), messages=chat_context, temperature=temperature, top_p=top_p
             )
-            reply = AIReply(response.choices[0].message.content, True)
+            reply = AIReply.info(response.choices[0].message.content)
             log.debug("Response received from LLM: %s", str(reply))
         except APIError as error:
-            body: dict = error.body or {"message": "Message not provided"}
-            reply = AIReply(f"%RED%{error.__class__.__name__} => {body['message']}%NC%", False)
+            reply = self._error_reply(error)
 
         return reply
 
+    @staticmethod
+    def _error_reply(error: APIError) -> AIReply:
+        """Create the AI reply of a failed API request.
+        :param error: The API error.
+        :return: The error reply.
+        """
+        body: dict = error.body or {"message": "Message not provided"}
+        return AIReply.error(f"%RED%{error.__class__.__name__} => {body['message']}%NC%")
+
+    def ask_stream(self, chat_context: List[dict], temperature: float = 0.8, top_p: float = 0.0) -> Iterator[str]:
+        """Ask AI assistance for the given question and stream the response, as it's generated.
+        :param chat_context: The chat history or context.
+        :param temperature: The model engine temperature.
+        :param top_p: The model engine top_p.
+        :return: An iterator over the response text chunks.
+        """
+        check_not_none(chat_context)
+        log.debug(f"Streaming AI answer")
+        response = self.client.chat.completions.create(
+            model=self.ai_model_name(), messages=chat_context, temperature=temperature, top_p=top_p, stream=True
+        )
+        for chunk in response:
+            if chunk.choices and (content := chunk.choices[0].delta.content):
+                yield content
+
     def text_to_speech(self, text: str, prefix: str = "", stream: bool = True, playback: bool = True) -> Optional[Path]:
         """Convert the provided text to speech.
         :param text: The text to convert to speech.
@@ -182,6 +248,7 @@ class OpenAIEngine:
                 ) as response:
                     response.stream_to_file(speech_file_path)
                     log.debug(f"Audio file created: '%s' at %s", text, speech_file_path)
+                cache.save_audio_file(speech_file_path)
             else:
                 log.debug(f"Audio file found in cache: '%s' at %s", text, speech_file_path)
             if playback:
@@ -209,7 +276,15 @@ class OpenAIEngine:
         :param text: The text for which to calculate tokens.
         :return: The number of tokens in the text.
         """
-        encoding: tiktoken.Encoding = tiktoken.encoding_for_model(self._model.model_name())
-        tokens: list[int] = encoding.encode(text)
-        log.debug(f"Tokens calculated. Text: '{text}'  Tokens: '{tokens}'")
-        return len(tokens)
+        tokens: int = count_tokens(text, self._model.model_name())
+        log.debug("Tokens calculated. Chars: %d  Tokens: %d", len(text), tokens)
+        return tokens
+
+    def calculate_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Calculate the number of tokens for each of the given texts, encoding them in parallel.
+        :param texts: The texts for which to calculate tokens.
+        :return: The number of tokens in each text.
+        """
+        tokens: list[int] = count_tokens_batch(texts, self._model.model_name())
+        log.debug("Tokens calculated. Texts: %d  Tokens: %d", len(texts), sum(tokens))
+        return tokens
@@ -15,6 +15,7 @@ Copyright (c) 2024, AskAI
 from langchain.chains.transform import TransformChain
 
 from askai.core.askai_prompt import prompt
+from askai.core.component.http_client import http_client
 from askai.core.model.image_result import ImageResult
 from askai.core.model.screenshot_result import ScreenshotResult
 from askai.core.support.utilities import encode_image, find_file
@@ -57,7 +58,7 @@ class OpenAIVision:
         :param inputs: Dictionary containing the image and prompt information.
         :return: MessageContent object with the generated caption.
         """
-        model: BaseChatModel = ChatOpenAI(model="gpt-4o-mini")
+        model: BaseChatModel = ChatOpenAI(model="gpt-4o-mini", http_client=http_client.client)
         msg: BaseMessage = model.invoke(
             [
                 HumanMessage(
@@ -0,0 +1,15 @@
+# _*_ coding: utf-8 _*_
+#
+# hspylib-askai v1.2.15
+#
+# Package: main.askai.core.engine.replay
+"""Package initialization."""
+
+__all__ = [
+    'cassette', 
+    'latency', 
+    'replay_engine', 
+    'replay_models', 
+    'replay_vision'
+]
+__version__ = '1.2.15'
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.engine.replay
+      @file: cassette.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.cache_metrics import CacheMetrics
+from askai.core.component.cache_service import CASSETTE_DIR, ensure_dir
+from askai.core.engine.replay.latency import Latency
+from askai.exception.exceptions import CassetteMissError
+from hspylib.core.enums.charset import Charset
+from hspylib.core.tools.text_tools import hash_text
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Optional
+
+import json
+import logging as log
+import os
+
+# Cassette record type.
+Interaction = dict[str, Any]
+
+# Format name and version, written as the header (first record) of the cassette files.
+CASSETTE_FORMAT: str = "askai-cassette"
+
+CASSETTE_VERSION: int = 1
+
+
+class Cassette:
+    """Provide an append-only JSONL file of recorded AI interactions, used by the replay engine. Each interaction is
+    keyed by the hash of its request (kind, model, settings and prompt) and holds the response and the time it took.
+    Matching is strict: a request whose key was not recorded is a miss. With the (opt-in) fallback, such a request
+    (e.g. a prompt that embeds the current date) is served the next unplayed interaction of the same kind, in the
+    recorded order, instead; fallbacks are counted in the stats, as they may hide prompt drifts.
+    """
+
+    @staticmethod
+    def fingerprint(*parts: Any) -> str:
+        """Return the key of a request made of the given parts.
+        :param parts: The request parts (kind, model, temperature, messages, etc.).
+        :return: The request key.
+        """
+        return hash_text(json.dumps(parts, sort_keys=True, default=str))
+
+    def __init__(self, name: str, path: Optional[Path] = None, fallback: bool = False):
+        self._name: str = name
+        self._path: Path = path or Path(CASSETTE_DIR, f"askai-{name}.cassette.jsonl")
+        self._fallback: bool = fallback
+        self._metrics: CacheMetrics = CacheMetrics()
+        self._fallbacks: int = 0
+        self._lock = Lock()
+        self._interactions: list[Interaction] = []
+        self._index: dict[str, int] = {}
+        self._played: set[int] = set()
+        self._cursors: dict[str, int] = {}
+        self._load()
+
+    def __str__(self):
+        return f"Cassette(name={self._name}, interactions={len(self)}, played={len(self._played)})"
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def is_fallback(self) -> bool:
+        return self._fallback
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the replay metrics: a hit is an exactly matched request; fallbacks are also counted as misses."""
+        return self._metrics.as_dict(entries=len(self), played=len(self._played), fallbacks=self._fallbacks)
+
+    def play(self, kind: str, key: str, fallback: Optional[bool] = None) -> Optional[Interaction]:
+        """Return the recorded interaction of the request.
+        :param kind: The interaction kind (e.g. 'chat', 'ask', 'embed').
+        :param key: The request key.
+        :param fallback: Whether to serve the next unplayed interaction of the kind when the key was not recorded
+                         (defaults to the cassette setting).
+        :return: The recorded interaction, or None if there is none to serve.
+        """
+        fallback = self._fallback if fallback is None else fallback
+        with self._lock:
+            if (pos := self._index.get(key)) is not None and self._interactions[pos]["kind"] != kind:
+                pos = None
+            if not self._metrics.record(pos is not None) and fallback:
+                pos = next(
+                    (
+                        i
+                        for i in range(self._cursors.get(kind, 0), len(self._interactions))
+                        if i not in self._played and self._interactions[i]["kind"] == kind
+                    ),
+                    None,
+                )
+                if pos is not None:
+                    self._cursors[kind] = pos + 1
+                    self._fallbacks += 1
+                    log.warning("Cassette::[FALLBACK] kind='%s'  key='%s' served in recorded order", kind, key)
+            if pos is None:
+                return None
+            self._played.add(pos)
+            return self._interactions[pos]
+
+    def record(self, kind: str, key: str, response: Any, elapsed: float) -> None:
+        """Record an interaction, replacing the one previously recorded for the key.
+        :param kind: The interaction kind (e.g. 'chat', 'ask', 'embed').
+        :param key: The request key.
+        :param response: The response (must be JSON serializable).
+        :param elapsed: The time the request took, in seconds.
+        """
+        interaction: Interaction = {"kind": kind, "key": key, "response": response, "elapsed": round(elapsed, 4)}
+        with self._lock:
+            self._add(interaction)
+            ensure_dir(self._path.parent)
+            with open(self._path, "a", encoding=Charset.UTF_8.val) as f_cassette:
+                if not f_cassette.tell():
+                    f_cassette.write(json.dumps({"format": CASSETTE_FORMAT, "version": CASSETTE_VERSION}) + os.linesep)
+                f_cassette.write(json.dumps(interaction, ensure_ascii=False) + os.linesep)
+        log.debug("Cassette::[RECORDED] kind='%s'  key='%s'", kind, key)
+
+    def serve(self, kind: str, key: str, latency: Latency, record_fn: Optional[Callable[[], Any]] = None) -> Any:
+        """Record the response of record_fn, when provided (record mode); otherwise replay the recorded response,
+        after the simulated latency.
+        :param kind: The interaction kind (e.g. 'chat', 'ask', 'embed').
+        :param key: The request key.
+        :param latency: The simulated latency.
+        :param record_fn: The function that performs the actual request (record mode only).
+        :return: The response.
+        :raises CassetteMissError: If no interaction was recorded for the request.
+        """
+        if record_fn is not None:
+            started: float = perf_counter()
+            response: Any = record_fn()
+            self.record(kind, key, response, perf_counter() - started)
+            return response
+        interaction: Interaction = self._replay(kind, key)
+        latency.sleep(interaction["elapsed"])
+        return interaction["response"]
+
+    async def aserve(
+        self, kind: str, key: str, latency: Latency, record_fn: Optional[Callable[[], Awaitable[Any]]] = None
+    ) -> Any:
+        """Record the response of record_fn, when provided (record mode); otherwise replay the recorded response,
+        after the simulated latency, without blocking the event loop.
+        :param kind: The interaction kind (e.g. 'chat', 'ask', 'embed').
+        :param key: The request key.
+        :param latency: The simulated latency.
+        :param record_fn: The coroutine function that performs the actual request (record mode only).
+        :return: The response.
+        :raises CassetteMissError: If no interaction was recorded for the request.
+        """
+        if record_fn is not None:
+            started: float = perf_counter()
+            response: Any = await record_fn()
+            self.record(kind, key, response, perf_counter() - started)
+            return response
+        interaction: Interaction = self._replay(kind, key)
+        await latency.asleep(interaction["elapsed"])
+        return interaction["response"]
+
+    def _replay(self, kind: str, key: str) -> Interaction:
+        """Return the recorded interaction of the request, or raise if there is none.
+        :param kind: The interaction kind.
+        :param key: The request key.
+        :return: The recorded interaction.
+        """
+        if (interaction := self.play(kind, key)) is None:
+            raise CassetteMissError(f"No '{kind}' interaction recorded in cassette '{self._name}' for key: {key}")
+        log.info("Cassette::[REPLAY] kind='%s'  key='%s'", kind, key)
+        return interaction
+
+    def _add(self, interaction: Interaction) -> None:
+        """Add (or replace) an interaction in memory.
+        :param interaction: The interaction to add.
+        """
+        if (pos := self._index.get(interaction["key"])) is not None:
+            self._interactions[pos] = interaction
+        else:
+            self._index[interaction["key"]] = len(self._interactions)
+            self._interactions.append(interaction)
+
+    def _load(self) -> None:
+        """Load the recorded interactions, skipping the header and invalid (e.g. torn) lines. Files written by a newer
+        format version are skipped altogether.
+        """
+        if self._path.exists():
+            with open(self._path, encoding=Charset.UTF_8.val) as f_cassette:
+                for line in filter(str.strip, f_cassette):
+                    try:
+                        record: dict[str, Any] = json.loads(line)
+                    except json.JSONDecodeError:
+                        log.warning("Cassette::[SKIPPED] Invalid record in '%s': '%s'", self._path, line[:64])
+                        continue
+                    if record.get("format") == CASSETTE_FORMAT:
+                        if (version := record.get("version", CASSETTE_VERSION)) > CASSETTE_VERSION:
+                            log.warning("Cassette::[SKIPPED] '%s' has unsupported version %d", self._path, version)
+                            return
+                        continue
+                    self._add(record)
+            log.debug("Cassette::[LOADED] '%s' interactions=%d", self._path, len(self._interactions))
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.engine.replay
+      @file: latency.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from random import Random
+from threading import Lock
+
+import asyncio
+import time
+
+
+class Latency:
+    """Provide the simulated latency of the replayed AI responses. The distribution is given by a spec string:
+        - 'none'                       : no latency;
+        - 'recorded'                   : the time the recorded request took;
+        - 'fixed:<ms>'                 : a constant latency;
+        - 'uniform:<min_ms>:<max_ms>'  : a latency uniformly distributed within the range;
+        - 'normal:<mean_ms>:<std_ms>'  : a normally distributed latency (never negative).
+    Samples are drawn from a seeded generator, so a replay takes the same time on every run.
+    """
+
+    DISTRIBUTIONS: dict[str, int] = {"none": 0, "recorded": 0, "fixed": 1, "uniform": 2, "normal": 2}
+
+    def __init__(self, spec: str = "none", seed: int = 0):
+        name, *args = (spec or "none").strip().lower().split(":")
+        if self.DISTRIBUTIONS.get(name) != len(args):
+            raise ValueError(f"Invalid latency spec: '{spec}'. Expected one of: {', '.join(self.DISTRIBUTIONS)}")
+        self._spec: str = spec
+        self._name: str = name
+        self._args: list[float] = [float(a) / 1000 for a in args]
+        self._random = Random(seed)
+        self._lock = Lock()
+
+    def __str__(self):
+        return f"Latency(spec={self._spec})"
+
+    def delay(self, recorded: float = 0.0) -> float:
+        """Return the latency of the next replayed response.
+        :param recorded: The time the recorded request took, in seconds.
+        :return: The latency, in seconds.
+        """
+        with self._lock:
+            match self._name:
+                case "recorded":
+                    return max(0.0, recorded)
+                case "fixed":
+                    return self._args[0]
+                case "uniform":
+                    return self._random.uniform(*self._args)
+                case "normal":
+                    return max(0.0, self._random.gauss(*self._args))
+        return 0.0
+
+    def sleep(self, recorded: float = 0.0) -> None:
+        """Wait for the latency of the next replayed response.
+        :param recorded: The time the recorded request took, in seconds.
+        """
+        if (secs := self.delay(recorded)) > 0:
+            time.sleep(secs)
+
+    async def asleep(self, recorded: float = 0.0) -> None:
+        """Wait for the latency of the next replayed response, without blocking the event loop.
+        :param recorded: The time the recorded request took, in seconds.
+        """
+        if (secs := self.delay(recorded)) > 0:
+            await asyncio.sleep(secs)
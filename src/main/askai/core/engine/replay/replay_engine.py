@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.engine.replay
+      @file: replay_engine.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.cache_service import cache
+from askai.core.component.multimedia.audio_player import player
+from askai.core.component.multimedia.recorder import Recorder
+from askai.core.component.text_streamer import streamer
+from askai.core.engine.ai_engine import AIEngine
+from askai.core.engine.ai_model import AIModel
+from askai.core.engine.ai_vision import AIVision
+from askai.core.engine.openai.openai_configs import OpenAiConfigs
+from askai.core.engine.openai.openai_model import OpenAIModel
+from askai.core.engine.replay.cassette import Cassette
+from askai.core.engine.replay.latency import Latency
+from askai.core.engine.replay.replay_models import ReplayChatModel, ReplayEmbeddings, ReplayLLM
+from askai.core.engine.replay.replay_vision import ReplayVision
+from askai.core.model.ai_reply import AIReply
+from askai.core.support.tokenizer import count_tokens, count_tokens_batch
+from hspylib.core.preconditions import check_not_none
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import BaseChatModel, BaseLLM
+from pathlib import Path
+from threading import Thread
+from time import perf_counter
+from typing import Iterator, List, Optional
+
+import logging as log
+import pause
+import re
+
+
+class ReplayEngine:
+    """Provide an offline AI engine, that serves the responses recorded in a cassette, so the pipeline can run (and be
+    benchmarked) deterministically, without access to the AI provider. When a delegate engine is set (record mode),
+    every request goes to it, and its responses are recorded into the cassette. This class implements the AIEngine
+    protocol.
+    """
+
+    def __init__(
+        self,
+        model: AIModel = OpenAIModel.GPT_4_O_MINI,
+        cassette: Optional[Cassette] = None,
+        latency: Optional[Latency] = None,
+        delegate: Optional[AIEngine] = None,
+    ):
+        self._model: AIModel = model
+        self._configs: OpenAiConfigs = OpenAiConfigs.INSTANCE
+        self._cassette: Cassette = cassette or Cassette("default")
+        self._latency: Latency = latency or Latency()
+        self._delegate: Optional[AIEngine] = delegate
+        self._vision = ReplayVision(self._cassette, self._latency, delegate.vision() if delegate else None)
+
+    def __str__(self):
+        return f"{self.ai_name()} '{self.nickname()}' '{self._model}' {self._cassette}"
+
+    @property
+    def cassette(self) -> Cassette:
+        return self._cassette
+
+    @property
+    def is_recording(self) -> bool:
+        return self._delegate is not None
+
+    def configs(self) -> OpenAiConfigs:
+        """Return the engine-specific configurations."""
+        return self._configs
+
+    def nickname(self) -> str:
+        """Get the AI engine nickname.
+        :return: The nickname of the AI engine.
+        """
+        return "Recorder" if self.is_recording else "Replay"
+
+    def models(self) -> List[AIModel]:
+        """Get the list of available models for the engine.
+        :return: A list of available AI models.
+        """
+        return OpenAIModel.models()
+
+    def voices(self) -> list[str]:
+        """Return the available model voices for speech to text.
+        :return: A list of available voices.
+        """
+        return self._delegate.voices() if self._delegate else [self._configs.tts_voice]
+
+    def vision(self) -> AIVision:
+        """Return the engine's vision component.
+        :return: The vision component of the engine.
+        """
+        return self._vision
+
+    def lc_model(self, temperature: float, top_p: float) -> BaseLLM:
+        """Create a LangChain LLM model instance using the current AI engine.
+        :param temperature: The LLM model temperature.
+        :param top_p: The model engine top_p.
+        :return: An instance of BaseLLM.
+        """
+        return ReplayLLM(
+            cassette=self._cassette,
+            latency=self._latency,
+            model_name=self._model.model_name(),
+            temperature=temperature,
+            top_p=top_p,
+            delegate=self._delegate.lc_model(temperature, top_p) if self._delegate else None,
+        )
+
+    def lc_chat_model(self, temperature: float, model_name: Optional[str] = None) -> BaseChatModel:
+        """Create a LangChain LLM chat model instance using the current AI engine.
+        :param temperature: The LLM chat model temperature.
+        :param model_name: The model to use instead of the engine's one (optional).
+        :return: An instance of BaseChatModel.
+        """
+        return ReplayChatModel(
+            cassette=self._cassette,
+            latency=self._latency,
+            model_name=model_name or self._model.model_name(),
+            temperature=temperature,
+            delegate=self._delegate.lc_chat_model(temperature, model_name) if self._delegate else None,
+        )
+
+    def lc_embeddings(self, model: str) -> Embeddings:
+        """Create a LangChain LLM embeddings model instance.
+        :param model: The LLM embeddings model string.
+        :return: An instance of Embeddings.
+        """
+        return ReplayEmbeddings(
+            self._cassette, self._latency, model, self._delegate.lc_embeddings(model) if self._delegate else None
+        )
+
+    def ai_name(self) -> str:
+        """Get the AI engine name.
+        :return: The name of the AI engine.
+        """
+        return self.__class__.__name__
+
+    def ai_model_name(self) -> str:
+        """Get the AI model name.
+        :return: The name of the AI model.
+        """
+        return self._model.model_name()
+
+    def ai_token_limit(self) -> int:
+        """Get the AI model token limit.
+        :return: The token limit of the AI model.
+        """
+        return self._model.token_limit()
+
+    def ask(self, chat_context: List[dict], temperature: float = 0.8, top_p: float = 0.0) -> AIReply:
+        """Ask AI assistance for the given question and expect a response.
+        :param chat_context: The chat history or context.
+        :param temperature: The model engine temperature.
+        :param top_p: The model engine top_p.
+        :return: The AI's reply.
+        """
+        check_not_none(chat_context)
+        key: str = self._ask_key(chat_context, temperature, top_p)
+        record_fn = (
+            (lambda: self._as_record(self._delegate.ask(chat_context, temperature, top_p))) if self._delegate else None
+        )
+        message, is_success = self._cassette.serve("ask", key, self._latency, record_fn)
+        return AIReply.info(message) if is_success else AIReply.error(message)
+
+    async def ask_async(self, chat_context: List[dict], temperature: float = 0.8, top_p: float = 0.0) -> AIReply:
+        """Ask AI assistance for the given question, without blocking the event loop.
+        :param chat_context: The chat history or context.
+        :param temperature: The model engine temperature.
+        :param top_p: The model engine top_p.
+        :return: The AI's reply.
+        """
+
+        async def _record() -> list:
+            return self._as_record(await self._delegate.ask_async(chat_context, temperature, top_p))
+
+        check_not_none(chat_context)
+        key: str = self._ask_key(chat_context, temperature, top_p)
+        message, is_success = await self._cassette.aserve(
+            "ask", key, self._latency, _record if self._delegate else None
+        )
+        return AIReply.info(message) if is_success else AIReply.error(message)
+
+    def ask_stream(self, chat_context: List[dict], temperature: float = 0.8, top_p: float = 0.0) -> Iterator[str]:
+        """Ask AI assistance for the given question and stream the response, as it's generated. Replayed responses
+        are streamed word by word.
+        :param chat_context: The chat history or context.
+        :param temperature: The model engine temperature.
+        :param top_p: The model engine top_p.
+        :return: An iterator over the response text chunks.
+        """
+        check_not_none(chat_context)
+        key: str = self._ask_key(chat_context, temperature, top_p)
+        if self._delegate is None:
+            message, _ = self._cassette.serve("ask", key, self._latency)
+            yield from filter(None, re.split(r"(?<=\s)(?=\S)", message))
+            return
+        chunks: list[str] = []
+        started: float = perf_counter()
+        for chunk in self._delegate.ask_stream(chat_context, temperature, top_p):
+            chunks.append(chunk)
+            yield chunk
+        self._cassette.record("ask", key, ["".join(chunks), True], perf_counter() - started)
+
+    def text_to_speech(self, text: str, prefix: str = "", stream: bool = True, playback: bool = True) -> Optional[Path]:
+        """Convert the provided text to speech. Speech is not generated offline: the audio cached by a recording
+        session is played back, if there is one; otherwise, the text is only streamed.
+        :param text: The text to convert to speech.
+        :param prefix: The prefix of the streamed text.
+        :param stream: Whether to stream the text into stdout.
+        :param playback: Whether to play back the generated audio file.
+        :return: The path to the generated audio file; or None if no file was generated.
+        """
+        if self._delegate is not None:
+            return self._delegate.text_to_speech(text, prefix, stream, playback)
+        if text:
+            speech_file_path, file_exists = cache.audio_file_path(
+                text, self._configs.tts_voice, self._configs.tts_format
+            )
+            if not file_exists:
+                log.debug(f"Audio file not found in cache: '%s'. Speech is not available offline.", text)
+                if playback and stream:
+                    streamer.stream_text(text, prefix)
+                return None
+            if playback:
+                speak_thread = Thread(
+                    daemon=True, target=player.play_audio_file, args=(speech_file_path, self._configs.tempo)
+                )
+                speak_thread.start()
+                if stream:
+                    pause.seconds(player.start_delay())
+                    streamer.stream_text(text, prefix)
+                speak_thread.join()  # Block until the speech has finished.
+            return Path(speech_file_path)
+        return None
+
+    def speech_to_text(self) -> Optional[str]:
+        """Transcribe audio input from the microphone into text.
+        :return: The transcribed text or None if transcription fails.
+        """
+        if self._delegate is not None:
+            return self._delegate.speech_to_text()
+        _, text = Recorder.INSTANCE.listen(language=self._configs.language)
+        log.debug(f"Audio transcribed to: {text}")
+        return text.strip() if text else None
+
+    def calculate_tokens(self, text: str) -> int:
+        """Calculate the number of tokens for the given text.
+        :param text: The text for which to calculate tokens.
+        :return: The number of tokens in the text.
+        """
+        return count_tokens(text, self._model.model_name())
+
+    def calculate_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Calculate the number of tokens for each of the given texts, encoding them in parallel.
+        :param texts: The texts for which to calculate tokens.
+        :return: The number of tokens in each text.
+        """
+        return count_tokens_batch(texts, self._model.model_name())
+
+    def _ask_key(self, chat_context: List[dict], temperature: float, top_p: float) -> str:
+        """Return the cassette key of an ask request.
+        :param chat_context: The chat history or context.
+        :param temperature: The model engine temperature.
+        :param top_p: The model engine top_p.
+        :return: The request key.
+        """
+        return Cassette.fingerprint("ask", self.ai_model_name(), temperature, top_p, chat_context)
+
+    @staticmethod
+    def _as_record(reply: AIReply) -> list:
+        """Return the cassette response of an AI reply.
+        :param reply: The AI reply.
+        :return: The reply message and success flag.
+        """
+        return [reply.message, reply.is_success]
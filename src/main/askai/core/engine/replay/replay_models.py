@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.engine.replay
+      @file: replay_models.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.engine.replay.cassette import Cassette
+from askai.core.engine.replay.latency import Latency
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import BaseChatModel, BaseLLM, LLM
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from random import Random
+from time import perf_counter
+from typing import Any, Optional
+
+import math
+
+
+class ReplayChatModel(BaseChatModel):
+    """Provide a LangChain chat model that replays the generations recorded in a cassette. When a delegate model is
+    set (record mode), generations are requested to it and recorded instead.
+    """
+
+    cassette: Cassette
+    latency: Latency
+    model_name: str
+    temperature: float = 0.0
+    delegate: Optional[BaseChatModel] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay-chat"
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        key: str = Cassette.fingerprint(
+            "chat", self.model_name, self.temperature, [(m.type, m.content) for m in messages], stop
+        )
+        record_fn = (lambda: self.delegate.invoke(messages, stop=stop, **kwargs).content) if self.delegate else None
+        content: str = self.cassette.serve("chat", key, self.latency, record_fn)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+
+class ReplayLLM(LLM):
+    """Provide a LangChain LLM model that replays the completions recorded in a cassette. When a delegate model is
+    set (record mode), completions are requested to it and recorded instead.
+    """
+
+    cassette: Cassette
+    latency: Latency
+    model_name: str
+    temperature: float = 0.0
+    top_p: float = 0.0
+    delegate: Optional[BaseLLM] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay-llm"
+
+    def _call(
+        self,
+        prompt: str,
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> str:
+        key: str = Cassette.fingerprint("llm", self.model_name, self.temperature, self.top_p, prompt, stop)
+        record_fn = (lambda: self.delegate.invoke(prompt, stop=stop, **kwargs)) if self.delegate else None
+        return self.cassette.serve("llm", key, self.latency, record_fn)
+
+
+class ReplayEmbeddings(Embeddings):
+    """Provide a LangChain embeddings model that replays the embeddings recorded in a cassette. Texts that were not
+    recorded get a deterministic pseudo-random unit vector (seeded by the text), so indexing still works offline.
+    When a delegate model is set (record mode), embeddings are requested to it and recorded instead.
+    """
+
+    # Dimensions of the unrecorded text vectors (same as the default OpenAI embeddings model).
+    DIMENSIONS: int = 1536
+
+    def __init__(self, cassette: Cassette, latency: Latency, model: str, delegate: Optional[Embeddings] = None):
+        self._cassette: Cassette = cassette
+        self._latency: Latency = latency
+        self._model: str = model
+        self._delegate: Optional[Embeddings] = delegate
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed the texts.
+        :param texts: The texts to embed.
+        :return: The embedding vector of each text.
+        """
+        if self._delegate is None:
+            return [self._replay(text) for text in texts]
+        started: float = perf_counter()
+        vectors: list[list[float]] = self._delegate.embed_documents(texts)
+        elapsed: float = (perf_counter() - started) / max(1, len(texts))
+        for text, vector in zip(texts, vectors):
+            self._cassette.record("embed", self._key(text), vector, elapsed)
+        return vectors
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed the query text.
+        :param text: The text to embed.
+        :return: The embedding vector of the text.
+        """
+        if self._delegate is None:
+            return self._replay(text)
+        return self._cassette.serve("embed", self._key(text), self._latency, lambda: self._delegate.embed_query(text))
+
+    def _key(self, text: str) -> str:
+        """Return the cassette key of the text embedding.
+        :param text: The embedded text.
+        :return: The request key.
+        """
+        return Cassette.fingerprint("embed", self._model, text)
+
+    def _replay(self, text: str) -> list[float]:
+        """Replay the recorded embedding of the text, or make up one when it was not recorded.
+        :param text: The embedded text.
+        :return: The embedding vector of the text.
+        """
+        if (interaction := self._cassette.play("embed", self._key(text), fallback=False)) is not None:
+            self._latency.sleep(interaction["elapsed"])
+            return interaction["response"]
+        rnd = Random(self._key(text))
+        vector: list[float] = [rnd.gauss(0, 1) for _ in range(self.DIMENSIONS)]
+        norm: float = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
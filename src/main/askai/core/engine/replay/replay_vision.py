@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.engine.replay
+      @file: replay_vision.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.engine.ai_vision import AIVision
+from askai.core.engine.replay.cassette import Cassette
+from askai.core.engine.replay.latency import Latency
+from hspylib.core.metaclass.classpath import AnyPath
+from typing import Literal, Optional
+
+import os
+
+
+class ReplayVision:
+    """Provide the vision component of the replay engine: image captions are replayed from the cassette. When a
+    delegate vision is set (record mode), captions are requested to it and recorded instead. This class implements
+    the AIVision protocol.
+    """
+
+    def __init__(self, cassette: Cassette, latency: Latency, delegate: Optional[AIVision] = None):
+        self._cassette: Cassette = cassette
+        self._latency: Latency = latency
+        self._delegate: Optional[AIVision] = delegate
+
+    def caption(
+        self,
+        filename: AnyPath,
+        load_dir: AnyPath | None,
+        query: str | None = None,
+        image_type: Literal["photo", "screenshot"] = "photo",
+    ) -> str:
+        """Generate a caption for the provided image.
+        :param filename: File name of the image for which the caption is to be generated.
+        :param load_dir: Optional directory path for loading related resources.
+        :param query: Optional question about details of the image.
+        :param image_type: The type of the image to be captioned; one of 'photo' or 'screenshot'.
+        :return: A string containing the generated caption.
+        """
+        image_path: str = os.path.join(str(load_dir), str(filename)) if load_dir else str(filename)
+        key: str = Cassette.fingerprint("caption", image_path, query, image_type)
+        record_fn = (
+            (lambda: self._delegate.caption(filename, load_dir, query, image_type)) if self._delegate else None
+        )
+        return self._cassette.serve("caption", key, self._latency, record_fn)
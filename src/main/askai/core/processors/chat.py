@@ -15,16 +15,21 @@ Copyright 2024, HSPyLib team
 from askai.core.askai_events import events
 from askai.core.askai_messages import msg
 from askai.core.askai_prompt import prompt
+from askai.core.component.long_term_memory import long_term_memory
 from askai.core.engine.openai.temperature import Temperature
 from askai.core.model.ai_reply import AIReply
 from askai.core.support.langchain_support import lc_llm
 from askai.core.support.shared_instances import shared
 from askai.core.support.text_formatter import text_formatter as tf
+from askai.core.support.utilities import is_streaming, stream_text
 from askai.exception.exceptions import TerminatingQuery
 from clitt.core.term.cursor import cursor
+from contextlib import nullcontext
+from functools import partial
 from hspylib.core.config.path_object import PathObject
 from hspylib.core.metaclass.singleton import Singleton
 from hspylib.core.tools.dict_tools import get_or_default_by_key
+from langchain_core.messages import SystemMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder, PromptTemplate
 from langchain_core.runnables import RunnableWithMessageHistory
 from rich.live import Live
@@ -37,10 +42,11 @@ class ChatProcessor(metaclass=Singleton):
 
     INSTANCE: "ChatProcessor"
 
-    def template(self, prompt_str: str, *inputs: str, **kwargs) -> ChatPromptTemplate:
+    def template(self, prompt_str: str, *inputs: str, memories: Optional[str] = None, **kwargs) -> ChatPromptTemplate:
         """Retrieves a chat prompt template based on the provided prompt string and inputs.
         :param prompt_str: The string used as the base template for the prompt.
         :param inputs: Positional arguments representing input variables for the template.
+        :param memories: The optional long-term memories relevant to the question.
         :param kwargs: Keyword arguments to format the template.
         :return: A ChatPromptTemplate object built with the specified configuration.
         """
@@ -49,6 +55,7 @@ class ChatProcessor(metaclass=Singleton):
         # fmt: off
         return ChatPromptTemplate.from_messages([
             ("system", template.format(**kwargs)),
+            *([SystemMessage(memories)] if memories else []),
             MessagesPlaceholder("chat_history"),
             ("human", "{input}"),
         ])
@@ -67,7 +74,10 @@ class ChatProcessor(metaclass=Singleton):
             events.mode_changed.emit(mode="DEFAULT")
             return None
 
-        with Live(Spinner("dots", f"[green]{msg.wait()}[/green]", style="green"), console=tf.console):
+        # When the reply is streamed, the arriving text replaces the spinner.
+        streaming: bool = is_streaming()
+        spinner = Spinner("dots", f"[green]{msg.wait()}[/green]", style="green")
+        with Live(spinner, console=tf.console) if not streaming else nullcontext():
             response = None
             prompt_file: str = get_or_default_by_key(kwargs, "prompt_file", None)
             history_ctx: Any | None = get_or_default_by_key(kwargs, "history_ctx", "HISTORY")
@@ -79,18 +89,26 @@ class ChatProcessor(metaclass=Singleton):
             prompt_file: PathObject = PathObject.of(prompt_file or prompt.append_path(f"taius/taius-jarvis"))
             prompt_str: str = prompt.read_prompt(prompt_file.filename, prompt_file.abs_dir)
 
-            template = self.template(prompt_str, *inputs, **args)
+            memories: str | None = long_term_memory.recall(
+                question, shared.context.remaining_tokens(), shared.engine.ai_model_name()
+            )
+            template = self.template(prompt_str, *inputs, memories=memories, **args)
             runnable = template | lc_llm.create_chat_model(Temperature.COLDEST.temp)
             runnable = RunnableWithMessageHistory(
-                runnable, shared.context.flat, input_messages_key="input", history_messages_key="chat_history"
+                runnable,
+                partial(long_term_memory.window, shared.context),
+                input_messages_key="input",
+                history_messages_key="chat_history",
             )
 
-            if output := runnable.invoke(
-                input={"input": question}, config={"configurable": {"session_id": history_ctx or ""}}
-            ):
+            config: dict[str, Any] = {"configurable": {"session_id": history_ctx or ""}}
+            if streaming:
+                response = stream_text(runnable.stream(input={"input": question}, config=config))
+            elif output := runnable.invoke(input={"input": question}, config=config):
                 response = output.content
 
-        cursor.erase_line()
+        if not streaming:
+            cursor.erase_line()
 
         return response
 
@@ -18,9 +18,10 @@ from askai.core.component.cache_service import cache
 from askai.core.engine.openai.temperature import Temperature
 from askai.core.support.langchain_support import lc_llm
 from askai.core.support.text_formatter import text_formatter as tf
-from askai.core.support.utilities import find_file
+from askai.core.support.utilities import find_file, is_streaming, stream_text
 from askai.exception.exceptions import TerminatingQuery
 from clitt.core.term.cursor import cursor
+from contextlib import nullcontext
 from hspylib.core.config.path_object import PathObject
 from hspylib.core.metaclass.singleton import Singleton
 from langchain_core.prompts import PromptTemplate
@@ -50,7 +51,9 @@ class NonInteractive(metaclass=Singleton):
         if question.casefold() in ["exit", "leave", "quit", "q"]:
             return None
 
-        with Live(Spinner("dots", f"[green]{msg.wait()}[/green]", style="green"), console=tf.console):
+        streaming: bool = is_streaming()
+        spinner = Spinner("dots", f"[green]{msg.wait()}[/green]", style="green")
+        with Live(spinner, console=tf.console) if not streaming else nullcontext():
             output = None
             query_prompt: str | None = find_file(kwargs["query_prompt"]) if "query_prompt" in kwargs else None
             context: str | None = kwargs["context"] if "context" in kwargs else None
@@ -63,10 +66,15 @@ class NonInteractive(metaclass=Singleton):
             final_prompt: str = template.format(context=context or self.DEFAULT_CONTEXT, question=question)
             llm = lc_llm.create_chat_model(temperature or self.DEFAULT_TEMPERATURE)
 
-            if (response := llm.invoke(final_prompt)) and (output := response.content):
+            if streaming:
+                output = stream_text(llm.stream(final_prompt))
+            elif response := llm.invoke(final_prompt):
+                output = response.content
+            if output:
                 cache.save_input_history()
 
-        cursor.erase_line()
+        if not streaming:
+            cursor.erase_line()
 
         return output
 
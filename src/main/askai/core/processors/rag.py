@@ -22,6 +22,7 @@ from askai.core.engine.openai.temperature import Temperature
 from askai.core.model.ai_reply import AIReply
 from askai.core.support.langchain_support import lc_llm
 from askai.core.support.text_formatter import text_formatter as tf
+from askai.core.support.utilities import is_streaming, stream_text
 from askai.exception.exceptions import DocumentsNotFound, TerminatingQuery
 from clitt.core.term.cursor import cursor
 from functools import lru_cache
@@ -96,11 +97,14 @@ class Rag(metaclass=Singleton):
         # FIXME Include kwargs to specify rag dir and glob
         self.generate()
 
-        with Live(Spinner("dots", f"[green]{msg.wait()}[/green]", style="green"), console=tf.console):
-            if not (output := self._rag_chain.invoke(question)):
+        if is_streaming():
+            if not (output := stream_text(self._rag_chain.stream(question))):
                 output = msg.invalid_response(output)
-
-        cursor.erase_line()
+        else:
+            with Live(Spinner("dots", f"[green]{msg.wait()}[/green]", style="green"), console=tf.console):
+                if not (output := self._rag_chain.invoke(question)):
+                    output = msg.invalid_response(output)
+            cursor.erase_line()
 
         return output
 
@@ -16,9 +16,10 @@ from askai.core.askai_configs import configs
 from askai.core.askai_events import events
 from askai.core.askai_messages import msg
 from askai.core.askai_prompt import prompt
-from askai.core.component.cache_service import cache
 from askai.core.component.geo_location import geo_location
+from askai.core.component.long_term_memory import long_term_memory
 from askai.core.component.rag_provider import RAGProvider
+from askai.core.component.stage_cache import stage_cache
 from askai.core.engine.openai.temperature import Temperature
 from askai.core.enums.response_model import ResponseModel
 from askai.core.model.acc_response import AccResponse
@@ -31,8 +32,10 @@ from askai.core.router.tools.general import final_answer
 from askai.core.support.langchain_support import lc_llm
 from askai.core.support.shared_instances import shared
 from askai.core.support.text_formatter import text_formatter, TextFormatter
+from askai.core.support.utilities import is_streaming
+from functools import partial
 from hspylib.core.metaclass.singleton import Singleton
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder, PromptTemplate
 from langchain_core.runnables import Runnable, RunnableWithMessageHistory
 from pathlib import Path
@@ -47,6 +50,9 @@ class SplitterActions(metaclass=Singleton):
 
     INSTANCE: "SplitterActions"
 
+    # The runnable config to use the chat history as the message history.
+    HISTORY_CONFIG: dict = {"configurable": {"session_id": "HISTORY"}}
+
     @staticmethod
     def wrap_answer(question: str, answer: str, model_result: ModelResult = ModelResult.default()) -> Optional[str]:
         """Provide a final answer to the user by wrapping the AI response with additional context.
@@ -56,6 +62,7 @@ class SplitterActions(metaclass=Singleton):
         :return: An optional formatted string containing the wrapped answer.
         """
         output: str = answer
+        persona: str | None = None
         ctx: str = text_formatter.strip_format(answer)
         args = {"user": prompt.user.title(), "idiom": shared.idiom, "context": ctx, "question": question}
         prompt_args: list[str] = [k for k in args.keys()]
@@ -64,16 +71,23 @@ class SplitterActions(metaclass=Singleton):
 
         match model, configs.is_speak:
             case ResponseModel.TERMINAL_COMMAND, True:
-                output = final_answer("taius-tts", prompt_args, **args)
+                persona = "taius-tts"
             case ResponseModel.ASSISTIVE_TECH_HELPER, _:
-                output = final_answer("taius-tts", prompt_args, **args)
+                persona = "taius-tts"
             case ResponseModel.CHAT_MASTER, _:
-                output = final_answer("taius-jarvis", prompt_args, **args)
+                persona = "taius-jarvis"
             case _:
                 pass  # Default is to leave the last AI response as is
 
-        # Save the conversation to use with the task agent executor.
-        cache.save_memory(shared.memory.buffer_as_messages)
+        if persona:
+            output = stage_cache.memoize(
+                "wrap_answer",
+                prompt.version(persona, prompt.append_path("taius")),
+                [question, ctx, persona, shared.idiom, shared.engine.ai_model_name()],
+                lambda: final_answer(persona, prompt_args, stream=is_streaming(), **args),
+            )
+
+        # Save the conversation (the task agent memory is a window over it).
         shared.context.save()
 
         return output
@@ -86,7 +100,7 @@ class SplitterActions(metaclass=Singleton):
         :param acc_response: The final accuracy response, if available.
         """
         if acc_response and acc_response.reasoning:
-            ctx: str = text_formatter.strip_format(str(shared.context.flat("HISTORY")))
+            ctx: str = text_formatter.strip_format(shared.context.stringify("HISTORY"))
             args = {
                 "locale": configs.language.locale,
                 "user": prompt.user.title(),
@@ -107,23 +121,40 @@ class SplitterActions(metaclass=Singleton):
         :param action: Action to be executed, encapsulated in a SimpleNamespace.
         :return: Output resulted from the action execution as a string, or None if no output.
         """
+        return agent.invoke(SplitterActions._action_task(action))
+
+    @staticmethod
+    async def aprocess_action(action: SimpleNamespace) -> Optional[str]:
+        """Execute an action requested by the AI, without blocking the event loop.
+        :param action: Action to be executed, encapsulated in a SimpleNamespace.
+        :return: Output resulted from the action execution as a string, or None if no output.
+        """
+        return await agent.ainvoke(SplitterActions._action_task(action))
+
+    @staticmethod
+    def _action_task(action: SimpleNamespace) -> str:
+        """Build the agent task of an action requested by the AI.
+        :param action: Action to be executed, encapsulated in a SimpleNamespace.
+        :return: The agent task, including the action path, if any.
+        """
         path_str: str | None = (
             "Path: " + action.path
             if hasattr(action, "path") and action.path.upper() not in ["N/A", "NONE", ""]
             else None
         )
-        return agent.invoke(f"{action.task}  {path_str or ''}")
+        return f"{action.task}  {path_str or ''}"
 
     def __init__(self):
         self._rag: RAGProvider = RAGProvider("task-splitter.csv")
 
-    def splitter_template(self, query: str) -> ChatPromptTemplate:
+    def splitter_template(self, query: str, memories: Optional[str] = None) -> ChatPromptTemplate:
         """Retrieve the processor template based on the given query.
         :param query: The input query to process and retrieve the template for.
+        :param memories: The optional long-term memories relevant to the query.
         :return: A ChatPromptTemplate object that matches the query.
         """
 
-        evaluation: str = str(shared.context.flat("EVALUATION"))
+        evaluation: str = shared.context.stringify("EVALUATION")
         template = PromptTemplate(
             input_variables=["os_type", "shell", "datetime", "home", "rag"],
             template=prompt.read_prompt("task-splitter.txt"),
@@ -142,6 +173,7 @@ class SplitterActions(metaclass=Singleton):
                         rag=self._rag.get_rag_examples(query),
                     ),
                 ),
+                *([SystemMessage(memories)] if memories else []),
                 MessagesPlaceholder("chat_history"),
                 ("assistant", evaluation),
                 ("human", "Human Question: '{input}'"),
@@ -155,17 +187,81 @@ class SplitterActions(metaclass=Singleton):
         :return: An optional ActionPlan generated from the provided question.
         """
 
-        response: AIMessage
-        runnable: Runnable = self.splitter_template(question) | lc_llm.create_chat_model(Temperature.COLDEST.temp)
-        runnable: Runnable = RunnableWithMessageHistory(
-            runnable, shared.context.flat, input_messages_key="input", history_messages_key="chat_history"
+        def _invoke_splitter() -> Optional[str]:
+            runnable: Runnable = self._splitter_runnable(question, memories)
+            return self._plan_output(runnable.invoke({"input": question}, config=self.HISTORY_CONFIG))
+
+        memories, parts = self._split_inputs(question)
+        answer: str | None = stage_cache.memoize("split", prompt.version("task-splitter.txt"), parts, _invoke_splitter)
+        return self._action_plan(question, answer, model)
+
+    async def asplit(self, question: str, model: ModelResult = ModelResult.default()) -> Optional[ActionPlan]:
+        """Invoke the LLM to split the tasks and create an action plan, without blocking the event loop.
+        :param question: The input question to be processed.
+        :param model: The model used to generate the action plan, defaulting to ModelResult.default().
+        :return: An optional ActionPlan generated from the provided question.
+        """
+
+        async def _ainvoke_splitter() -> Optional[str]:
+            runnable: Runnable = self._splitter_runnable(question, memories)
+            return self._plan_output(await runnable.ainvoke({"input": question}, config=self.HISTORY_CONFIG))
+
+        memories, parts = self._split_inputs(question)
+        answer: str | None = await stage_cache.amemoize(
+            "split", prompt.version("task-splitter.txt"), parts, _ainvoke_splitter
         )
-        if response := runnable.invoke({"input": question}, config={"configurable": {"session_id": "HISTORY"}}):
-            answer: str = str(response.content)
+        return self._action_plan(question, answer, model)
+
+    @staticmethod
+    def _plan_output(response: Optional[AIMessage]) -> Optional[str]:
+        """Return the action plan text, out of the splitter runnable response.
+        :param response: The splitter runnable response.
+        :return: The action plan text, or None if there was no response.
+        """
+        return str(response.content) if response else None
+
+    @staticmethod
+    def _action_plan(question: str, answer: Optional[str], model: ModelResult) -> Optional[ActionPlan]:
+        """Create the action plan out of the splitter answer.
+        :param question: The input question processed.
+        :param answer: The splitter answer (the action plan text).
+        :param model: The model used to generate the action plan.
+        :return: An optional ActionPlan generated from the answer.
+        """
+        if answer:
             log.info("Router::[RESPONSE] Received from AI: \n%s.", answer)
             return ActionPlan.create(question, answer, model)
 
         return None
 
+    def _splitter_runnable(self, question: str, memories: Optional[str]) -> Runnable:
+        """Create the runnable that splits the question into an action plan.
+        :param question: The input question to be processed.
+        :param memories: The optional long-term memories relevant to the question.
+        :return: The splitter runnable, with the chat history as its message history.
+        """
+        template: ChatPromptTemplate = self.splitter_template(question, memories)
+        runnable: Runnable = template | lc_llm.create_chat_model(Temperature.COLDEST.temp)
+        return RunnableWithMessageHistory(
+            runnable,
+            partial(long_term_memory.window, shared.context),
+            input_messages_key="input",
+            history_messages_key="chat_history",
+        )
+
+    @staticmethod
+    def _split_inputs(question: str) -> tuple[Optional[str], list[str]]:
+        """Recall the long-term memories relevant to the question and collect the inputs of the split stage.
+        :param question: The input question to be processed.
+        :return: A tuple containing the recalled memories and the stage cache inputs.
+        """
+        # The plan depends on the conversation history, on the previous evaluations and on the recalled memories, so
+        # they are all part of the key.
+        history: str = shared.context.stringify("HISTORY")
+        evaluation: str = shared.context.stringify("EVALUATION")
+        memories: str | None = long_term_memory.recall(
+            question, shared.context.remaining_tokens(), shared.engine.ai_model_name()
+        )
+        return memories, [question, history, evaluation, memories or "", shared.engine.ai_model_name()]
 
 assert (actions := SplitterActions().INSTANCE) is not None
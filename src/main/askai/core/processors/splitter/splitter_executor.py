@@ -21,6 +21,7 @@ from askai.core.processors.splitter.splitter_states import States
 from askai.core.support.text_formatter import text_formatter as tf
 from askai.exception.exceptions import InaccurateResponse
 from clitt.core.term.cursor import cursor
+from contextvars import Context, copy_context
 from hspylib.core.tools.commons import is_debugging
 from hspylib.modules.eventbus.event import Event
 from rich.live import Live
@@ -48,6 +49,9 @@ class SplitterExecutor(Thread):
         super().__init__()
         self._pipeline = SplitterPipeline(query)
         self._interrupted = False
+        # Threads do not inherit context variables, so the pipeline runs within the context (e.g. the active chat
+        # session) of the thread that created the executor.
+        self._ctx: Context = copy_context()
         AskAiEvents.bus(ASKAI_BUS_NAME).subscribe(ABORT_EVENT, self.interrupt)
 
     @property
@@ -63,6 +67,10 @@ class SplitterExecutor(Thread):
             self._interrupted = True
 
     def run(self) -> None:
+        """Execute the splitter pipeline, within the context of the thread that created the executor."""
+        self._ctx.run(self._execute)
+
+    def _execute(self) -> None:
         """Execute the splitter pipeline."""
 
         with Live(Spinner("dots", f"[green]{self.pipeline.state}…[/green]", style="green"), console=tf.console) as live:
@@ -17,6 +17,7 @@ from askai.core.askai_events import events
 from askai.core.askai_messages import msg
 from askai.core.askai_prompt import prompt
 from askai.core.component.rag_provider import RAGProvider
+from askai.core.component.stage_cache import stage_cache
 from askai.core.engine.openai.temperature import Temperature
 from askai.core.model.acc_response import AccResponse
 from askai.core.model.ai_reply import AIReply
@@ -27,6 +28,7 @@ from langchain_core.messages import AIMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder, PromptTemplate
 from langchain_core.runnables.history import RunnableWithMessageHistory
 from textwrap import dedent
+from typing import Optional
 
 import logging as log
 
@@ -43,6 +45,45 @@ EVALUATION_GUIDE: str = dedent("""
 
 RAG: RAGProvider = RAGProvider("accuracy.csv")
 
+# The runnable config to use the chat history as the message history.
+HISTORY_CONFIG: dict = {"configurable": {"session_id": "HISTORY"}}
+
+
+def _evaluation_prompt(question: str, ai_response: str) -> str:
+    """Build the accuracy evaluation prompt of the AI's response to the question.
+    :param question: The user's question.
+    :param ai_response: The AI's response to be analyzed for accuracy.
+    :return: The final evaluation prompt.
+    """
+    eval_template = PromptTemplate(
+        input_variables=["rag", "input", "response"], template=prompt.read_prompt("evaluation")
+    )
+    log.info("Assert::[QUESTION] '%s'  context: '%s'", question, ai_response)
+    return eval_template.format(rag=RAG.get_rag_examples(question), input=question, response=ai_response)
+
+
+def _evaluation_stage(question: str, ai_response: str) -> Optional[tuple[str, str, list[str]]]:
+    """Return the stage cache arguments of the accuracy evaluation, or None if the AI's response can't be evaluated.
+    :param question: The user's question.
+    :param ai_response: The AI's response to be analyzed for accuracy.
+    :return: A tuple containing the stage name, the prompt version and the stage inputs.
+    """
+    if ai_response and ai_response not in msg.accurate_responses:
+        return "evaluation", prompt.version("evaluation"), [question, ai_response, shared.engine.ai_model_name()]
+    return None
+
+
+def _accuracy_of(ai_response: str, output: Optional[str]) -> AccResponse:
+    """Parse the accuracy evaluation output.
+    :param ai_response: The AI's response analyzed for accuracy.
+    :param output: The accuracy evaluation output.
+    :return: The accuracy classification of the AI's response as an AccResponse enum value.
+    """
+    if output:
+        return AccResponse.parse_response(output)
+
+    raise InaccurateResponse(f"Accuracy response was null: {ai_response}")
+
 
 def eval_response(question: str, ai_response: str) -> AccResponse:
     """Check whether the AI's response to the question meets the required accuracy.
@@ -50,26 +91,41 @@ def eval_response(question: str, ai_response: str) -> AccResponse:
     :param ai_response: The AI's response to be analyzed for accuracy.
     :return: The accuracy classification of the AI's response as an AccResponse enum value.
     """
-    if ai_response and ai_response not in msg.accurate_responses:
-        eval_template = PromptTemplate(
-            input_variables=["rag", "input", "response"], template=prompt.read_prompt("evaluation")
-        )
-        final_prompt = eval_template.format(rag=RAG.get_rag_examples(question), input=question, response=ai_response)
-        log.info("Assert::[QUESTION] '%s'  context: '%s'", question, ai_response)
+
+    def _invoke_evaluation() -> str | None:
         llm = lc_llm.create_chat_model(Temperature.COLDEST.temp)
-        response: AIMessage = llm.invoke(final_prompt)
+        response: AIMessage = llm.invoke(_evaluation_prompt(question, ai_response))
+        return response.content if response else None
 
-        if response and (output := response.content):
-            return AccResponse.parse_response(output)
+    output: str | None = None
+    if stage := _evaluation_stage(question, ai_response):
+        output = stage_cache.memoize(*stage, _invoke_evaluation)
 
-    raise InaccurateResponse(f"Accuracy response was null: {ai_response}")
+    return _accuracy_of(ai_response, output)
 
 
-def resolve_x_refs(ref_name: str, context: str | None = None) -> str:
-    """Replace all cross-references with their actual values.
-    :param ref_name: The name of the cross-reference or variable to resolve.
-    :param context: The context in which to analyze and resolve the references (optional).
-    :return: The string with all cross-references replaced by their corresponding values.
+async def aeval_response(question: str, ai_response: str) -> AccResponse:
+    """Check whether the AI's response to the question meets the required accuracy, without blocking the event loop.
+    :param question: The user's question.
+    :param ai_response: The AI's response to be analyzed for accuracy.
+    :return: The accuracy classification of the AI's response as an AccResponse enum value.
+    """
+
+    async def _ainvoke_evaluation() -> str | None:
+        llm = lc_llm.create_chat_model(Temperature.COLDEST.temp)
+        response: AIMessage = await llm.ainvoke(_evaluation_prompt(question, ai_response))
+        return response.content if response else None
+
+    output: str | None = None
+    if stage := _evaluation_stage(question, ai_response):
+        output = await stage_cache.amemoize(*stage, _ainvoke_evaluation)
+
+    return _accuracy_of(ai_response, output)
+
+
+def _x_refs_runnable() -> RunnableWithMessageHistory:
+    """Create the runnable that resolves the cross-references, given the context.
+    :return: The cross-references runnable, with the context as its message history.
     """
     template = ChatPromptTemplate.from_messages(
         [
@@ -78,16 +134,57 @@ def resolve_x_refs(ref_name: str, context: str | None = None) -> str:
             ("human", "{pathname}"),
         ]
     )
-    output = ref_name
-    if context or (context := str(shared.context.flat("HISTORY"))):
-        runnable = template | lc_llm.create_chat_model(Temperature.CODE_GENERATION.temp)
-        runnable = RunnableWithMessageHistory(
-            runnable, shared.context.flat, input_messages_key="pathname", history_messages_key="context"
-        )
+    runnable = template | lc_llm.create_chat_model(Temperature.CODE_GENERATION.temp)
+    return RunnableWithMessageHistory(
+        runnable, shared.context.flat, input_messages_key="pathname", history_messages_key="context"
+    )
+
+
+def _x_refs_query(ref_name: str, context: str | None) -> Optional[RunnableWithMessageHistory]:
+    """Return the runnable that resolves the cross-references, or None if there is no context to resolve them.
+    :param ref_name: The name of the cross-reference or variable to resolve.
+    :param context: The context in which to analyze and resolve the references (optional).
+    :return: The cross-references runnable, or None.
+    """
+    if context or (context := shared.context.stringify("HISTORY")):
         log.info("Analysis::[QUERY] '%s'  context=%s", ref_name, context)
         events.reply.emit(reply=AIReply.debug(msg.x_reference(ref_name)))
-        response = runnable.invoke({"pathname": ref_name}, config={"configurable": {"session_id": "HISTORY"}})
-        if response and (output := response.content) and shared.UNCERTAIN_ID != output:
-            output = response.content
+        return _x_refs_runnable()
+    return None
+
+
+def _x_refs_output(ref_name: str, response: Optional[AIMessage]) -> str:
+    """Return the resolved cross-references, out of the runnable response.
+    :param ref_name: The name of the cross-reference or variable to resolve.
+    :param response: The cross-references runnable response.
+    :return: The string with all cross-references replaced by their corresponding values.
+    """
+    output = ref_name
+    if response and (output := response.content) and shared.UNCERTAIN_ID != output:
+        output = response.content
 
     return output
+
+
+def resolve_x_refs(ref_name: str, context: str | None = None) -> str:
+    """Replace all cross-references with their actual values.
+    :param ref_name: The name of the cross-reference or variable to resolve.
+    :param context: The context in which to analyze and resolve the references (optional).
+    :return: The string with all cross-references replaced by their corresponding values.
+    """
+    if runnable := _x_refs_query(ref_name, context):
+        return _x_refs_output(ref_name, runnable.invoke({"pathname": ref_name}, config=HISTORY_CONFIG))
+
+    return ref_name
+
+
+async def aresolve_x_refs(ref_name: str, context: str | None = None) -> str:
+    """Replace all cross-references with their actual values, without blocking the event loop.
+    :param ref_name: The name of the cross-reference or variable to resolve.
+    :param context: The context in which to analyze and resolve the references (optional).
+    :return: The string with all cross-references replaced by their corresponding values.
+    """
+    if runnable := _x_refs_query(ref_name, context):
+        return _x_refs_output(ref_name, await runnable.ainvoke({"pathname": ref_name}, config=HISTORY_CONFIG))
+
+    return ref_name
@@ -42,6 +42,9 @@ class TaskAgent(metaclass=Singleton):
 
     INSTANCE: "TaskAgent"
 
+    # Errors reported as the task output, instead of failing the task.
+    TASK_ERRORS: tuple[type[Exception], ...] = (openai.APIError, ValueError, ValidationError)
+
     @property
     def agent_template(self) -> ChatPromptTemplate:
         """Retrieve the Structured Agent Template for use in the chat agent. This template is used to structure the
@@ -65,10 +68,34 @@ class TaskAgent(metaclass=Singleton):
         :param task: The AI task that outlines the steps to generate the response.
         :return: The agent's response as a string.
         """
-        output: str | None = None
+        return self._task_output(self._exec_task(self._start_task(task)))
+
+    async def ainvoke(self, task: str) -> Optional[str]:
+        """Invoke the agent to respond to the given query using the specified action plan, without blocking the event
+        loop. The tools still run synchronously, on the loop's default executor.
+        :param task: The AI task that outlines the steps to generate the response.
+        :return: The agent's response as a string.
+        """
+        return self._task_output(await self._aexec_task(self._start_task(task)))
+
+    @staticmethod
+    def _start_task(task: str) -> str:
+        """Announce the task and add it to the chat history.
+        :param task: The AI task that outlines the steps to generate the response.
+        :return: The task.
+        """
         events.reply.emit(reply=AIReply.debug(msg.task(task)))
         shared.context.push("HISTORY", task, "assistant")
-        if (response := self._exec_task(task)) and (output := response["output"]):
+        return task
+
+    @staticmethod
+    def _task_output(response: Optional[dict[str, str]]) -> Optional[str]:
+        """Add the agent's output of the task to the chat history.
+        :param response: The agent's response to the task.
+        :return: The agent's output, or None if the task produced no output.
+        """
+        output: str | None = None
+        if response and (output := response["output"]):
             log.info("Router::[RESPONSE] Received from AI: \n%s.", output)
             shared.context.push("HISTORY", output, "assistant")
 
@@ -103,15 +130,30 @@ class TaskAgent(metaclass=Singleton):
         :return: An instance of Output containing the result of the task, or None if the task fails or produces
         no output.
         """
-        output: dict[str, str] | None = None
         try:
-            lc_agent: Runnable = self._create_lc_agent()
-            output: dict[str, str] = lc_agent.invoke({"input": task})
-        except (openai.APIError, ValueError, ValidationError) as err:
-            log.error(str(err))
-            output: dict[str, str] = {"output": str(err)}
+            return self._create_lc_agent().invoke({"input": task})
+        except self.TASK_ERRORS as err:
+            return self._task_failed(err)
 
-        return output
+    async def _aexec_task(self, task: AnyStr) -> Optional[dict[str, str]]:
+        """Execute the specified agent task, without blocking the event loop.
+        :param task: The task to be executed by the agent.
+        :return: An instance of Output containing the result of the task, or None if the task fails or produces
+        no output.
+        """
+        try:
+            return await self._create_lc_agent().ainvoke({"input": task})
+        except self.TASK_ERRORS as err:
+            return self._task_failed(err)
+
+    @staticmethod
+    def _task_failed(err: Exception) -> dict[str, str]:
+        """Report the failure of the agent task as its output.
+        :param err: The error raised by the agent.
+        :return: An instance of Output containing the error message.
+        """
+        log.error(str(err))
+        return {"output": str(err)}
 
 
 assert (agent := TaskAgent().INSTANCE) is not None
@@ -39,7 +39,7 @@ def query_output(query: str, context: str = None) -> str:
             ("human", "{input}"),
         ]
     )
-    if context or (context := str(shared.context.flat("HISTORY"))):
+    if context or (context := shared.context.stringify("HISTORY")):
         runnable = template | lc_llm.create_chat_model(Temperature.DATA_ANALYSIS.temp)
         runnable = RunnableWithMessageHistory(
             runnable, shared.context.flat, input_messages_key="input", history_messages_key="chat_history"
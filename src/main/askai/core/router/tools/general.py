@@ -16,8 +16,8 @@ from askai.core.askai_prompt import prompt
 from askai.core.engine.openai.temperature import Temperature
 from askai.core.support.langchain_support import lc_llm
 from askai.core.support.shared_instances import shared
+from askai.core.support.utilities import stream_text
 from hspylib.core.config.path_object import PathObject
-from langchain_core.messages import AIMessage
 from langchain_core.prompts import PromptTemplate
 
 import os
@@ -32,10 +32,13 @@ def display_tool(*texts: str) -> str:
     return output or "Sorry, there is nothing to display"
 
 
-def final_answer(persona_prompt: str | None = None, input_variables: list[str] | None = None, **prompt_args) -> str:
+def final_answer(
+    persona_prompt: str | None = None, input_variables: list[str] | None = None, stream: bool = False, **prompt_args
+) -> str:
     """Provide the final response to the user.
     :param persona_prompt: The persona prompt to be used.
     :param input_variables: The prompt input variables.
+    :param stream: Whether to stream the response to the user, as it's generated.
     :param prompt_args: The prompt input arguments.
     """
     prompt_file: PathObject = PathObject.of(prompt.append_path(f"taius/{persona_prompt}"))
@@ -47,10 +50,9 @@ def final_answer(persona_prompt: str | None = None, input_variables: list[str] |
     # fmt: on
     final_prompt = template.format(**prompt_args)
     llm = lc_llm.create_chat_model(temperature=Temperature.COLDEST.temp)
-    response: AIMessage = llm.invoke(final_prompt)
-    output: str | None = None
+    output: str | None = stream_text(llm.stream(final_prompt)) if stream else llm.invoke(final_prompt).content
 
-    if not response or not (output := response.content) or shared.UNCERTAIN_ID in response.content:
+    if not output or shared.UNCERTAIN_ID in output:
         output = "Sorry, I was not able to provide a helpful response."
 
     return output or "Sorry, the query produced no response!"
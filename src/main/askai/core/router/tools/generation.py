@@ -15,7 +15,7 @@
 
 from askai.core.askai_messages import msg
 from askai.core.askai_prompt import prompt
-from askai.core.component.cache_service import GEN_AI_DIR
+from askai.core.component.cache_service import ensure_dir, GEN_AI_DIR
 from askai.core.engine.openai.temperature import Temperature
 from askai.core.support.langchain_support import lc_llm
 from askai.core.support.shared_instances import shared
@@ -48,7 +48,7 @@ def generate_content(instructions: str, mime_type: str, filepath: AnyPath | None
     llm = lc_llm.create_chat_model(temperature=Temperature.CODE_GENERATION.temp)
     response: AIMessage = llm.invoke(final_prompt)
     timestamp: int = now_ms()
-    final_path: str = str(filepath or f"{GEN_AI_DIR}/gen-ai-{timestamp}")
+    final_path: str = str(filepath or f"{ensure_dir(GEN_AI_DIR)}/gen-ai-{timestamp}")
 
     if response and (output := response.content):
         shared.context.set("GENERATED", output)
@@ -67,7 +67,7 @@ def save_content(filepath: AnyPath, content: AnyStr | None = None) -> str:
     if filepath:
         path_obj = PathObject.of(filepath)
         base_dir = path_obj.abs_dir
-        if Path(base_dir).exists and (output := str(content or shared.context.flat("GENERATED"))):
+        if Path(base_dir).exists and (output := str(content or shared.context.stringify("GENERATED"))):
             filename: str = path_obj.join()
             with open(filename, "w") as f_path_name:
                 lang, content = extract_codeblock(output)
@@ -67,7 +67,7 @@ def open_command(file_path: str) -> str:
     posix_path: PathObject | None = PathObject.of(file_path)
     if posix_path and not posix_path.exists:
         # Attempt to resolve cross-references
-        if history := str(shared.context.flat("HISTORY") or ""):
+        if history := shared.context.stringify("HISTORY"):
             if (x_referenced := resolve_x_refs(file_path, history)) and x_referenced != shared.UNCERTAIN_ID:
                 x_ref_path: PathObject | None = PathObject.of(x_referenced)
                 posix_path = x_ref_path if x_ref_path and x_ref_path.exists else posix_path
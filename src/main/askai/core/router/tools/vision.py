@@ -1,6 +1,6 @@
 from askai.core.askai_events import events
 from askai.core.askai_messages import msg
-from askai.core.component.cache_service import PICTURE_DIR, SCREENSHOTS_DIR
+from askai.core.component.cache_service import ensure_dir, PICTURE_DIR, SCREENSHOTS_DIR
 from askai.core.component.multimedia.audio_player import player
 from askai.core.engine.ai_vision import AIVision
 from askai.core.model.ai_reply import AIReply
@@ -61,7 +61,7 @@ def offline_captioner(path_name: AnyPath) -> str:
     posix_path: PathObject = PathObject.of(path_name)
     if not posix_path.exists:
         # Attempt to resolve cross-references
-        if history := str(shared.context.flat("HISTORY") or ""):
+        if history := shared.context.stringify("HISTORY"):
             if (x_referenced := resolve_x_refs(path_name, history)) and x_referenced != shared.UNCERTAIN_ID:
                 x_ref_path: PathObject = PathObject.of(x_referenced)
                 posix_path: PathObject = x_ref_path if x_ref_path.exists else posix_path
@@ -105,7 +105,7 @@ def image_captioner(
 
     if not posix_path.exists:
         # Attempt to resolve cross-references
-        if history := str(shared.context.flat("HISTORY") or ""):
+        if history := shared.context.stringify("HISTORY"):
             if (x_referenced := resolve_x_refs(path_name, history)) and x_referenced != shared.UNCERTAIN_ID:
                 x_ref_path: PathObject = PathObject.of(x_referenced)
                 posix_path: PathObject = x_ref_path if x_ref_path.exists else posix_path
@@ -208,7 +208,7 @@ def capture_screenshot(
     _, ext = os.path.splitext(posix_path.filename)
     if ext.casefold().endswith((".jpg", ".jpeg")):
         screenshot = screenshot.convert("RGB")
-    final_path: str = os.path.join(save_dir or SCREENSHOTS_DIR, posix_path.filename)
+    final_path: str = os.path.join(save_dir or ensure_dir(SCREENSHOTS_DIR), posix_path.filename)
     screenshot.save(final_path)
     events.reply.emit(reply=AIReply.full(msg.screenshot_saved(final_path)))
     desktop_caption = parse_screenshot_caption(image_captioner(final_path, save_dir, query, "screenshot"))
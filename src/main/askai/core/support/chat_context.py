@@ -13,15 +13,19 @@
    Copyright (c) 2024, AskAI
 """
 
-from askai.core.component.cache_service import cache
+from askai.core.component.context_journal import ContextJournal, JournalRecord
+from askai.core.support.tokenizer import count_tokens, count_tokens_batch
 from askai.exception.exceptions import TokenLengthExceeded
 from collections import defaultdict, deque, namedtuple
-from functools import partial, reduce
+from functools import partial
 from hspylib.core.preconditions import check_argument
+from hspylib.core.tools.text_tools import hash_text
 from langchain_community.chat_message_histories.in_memory import ChatMessageHistory
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-from typing import Any, AnyStr, get_args, Literal, Optional, TypeAlias
+from langchain_core.messages import AIMessage, BaseMessage, get_buffer_string, HumanMessage, SystemMessage
+from threading import RLock
+from typing import Any, AnyStr, Callable, get_args, Iterable, Iterator, Literal, Optional, TypeAlias
 
+import logging as log
 import os
 
 ChatRoles: TypeAlias = Literal["system", "human", "assistant"]
@@ -30,39 +34,59 @@ ContextRaw: TypeAlias = list[dict[str, str]]
 
 LangChainContext: TypeAlias = list[tuple[str, str]]
 
-ContextEntry = namedtuple("ContextEntry", ["role", "content"])
+ContextEntry = namedtuple("ContextEntry", ["role", "content", "tokens"], defaults=[0])
 
 
 class ChatContext:
-    """Provide a chat context helper for AI engines."""
+    """Provide a chat context helper for AI engines. The chat context is shared by the pipeline, the agent, the TUI
+    workers and the scheduler jobs, so all of its operations are serialized by a (reentrant) lock, and everything it
+    hands out is a snapshot that can be read while other threads change the context.
+    """
 
     LANGCHAIN_ROLE_MAP: dict = {"human": HumanMessage, "system": SystemMessage, "assistant": AIMessage}
 
-    def __init__(self, token_limit: int, max_context_size: int):
+    def __init__(self, token_limit: int, max_context_size: int, model_name: str = "gpt-4o-mini"):
         self._store: dict[AnyStr, deque] = defaultdict(partial(deque, maxlen=max_context_size))
-        self._token_limit: int = token_limit * 1024  # The limit is given in KB
+        self._lengths: dict[AnyStr, int] = defaultdict(int)
+        self._tokens: dict[AnyStr, int] = defaultdict(int)
+        self._entries: dict[AnyStr, set[tuple[str, str]]] = defaultdict(set)
+        self._version: int = 0
+        self._versions: dict[AnyStr, int] = defaultdict(int)
+        self._views: dict[tuple[str, ...], tuple[tuple[int, ...], list[BaseMessage], Optional[str]]] = {}
+        self._token_limit: int = token_limit
         self._max_context_size: int = max_context_size
+        self._model_name: str = model_name
+        self._summarizer: Optional[Callable[[str, list[ContextEntry]], None]] = None
+        self._high_water: int = token_limit
+        self._compacting: set[str] = set()
+        self._compactions: dict[AnyStr, tuple[list[ContextEntry], str]] = {}
+        self._journal: Optional[ContextJournal] = None
+        self._lock = RLock()
 
     def __str__(self):
         ln: str = os.linesep
         return ln.join(f"'{k}': '{v}'" + ln for k, v in self.store.items())
 
-    def __getitem__(self, key) -> deque[ContextEntry]:
-        return self.store[key]
+    def __getitem__(self, key) -> tuple[ContextEntry, ...]:
+        with self._lock:
+            return tuple(self._store.get(key, ()))
 
     def __iter__(self):
-        return zip(self.store.keys().__iter__(), self.store.values().__iter__())
+        return iter(self.store.items())
 
     def __len__(self):
-        return self.store.__len__()
+        return self._store.__len__()
 
     @property
     def keys(self) -> list[AnyStr]:
-        return [str(k) for k in self.store.keys()]
+        with self._lock:
+            return [str(k) for k in self._store.keys()]
 
     @property
-    def store(self) -> dict[Any, deque]:
-        return self._store
+    def store(self) -> dict[Any, tuple[ContextEntry, ...]]:
+        """Return a snapshot of the contexts."""
+        with self._lock:
+            return {k: tuple(v) for k, v in self._store.items()}
 
     @property
     def max_context_size(self) -> int:
@@ -72,20 +96,39 @@ class ChatContext:
     def token_limit(self) -> int:
         return self._token_limit
 
-    def push(self, key: str, content: Any, role: ChatRoles = "human") -> ContextRaw:
-        """Push a context message to the chat with the specified role.
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    def push(self, key: str, content: Any, role: ChatRoles = "human") -> bool:
+        """Push a context message to the chat with the specified role. The context size and the duplicate check are
+        kept by running counters, so pushing does not depend on the number of entries in the context. The message
+        tokens are counted once, here, using the model encoding.
         :param key: The identifier for the context message.
         :param content: The content of the message to push.
         :param role: The role associated with the message (default is "human").
-        :return: The updated chat context.
+        :return: True if the message was appended; False if it was already in the context.
         """
         check_argument(role in get_args(ChatRoles), f"Invalid ChatRole: '{role}'")
-        if (token_length := (self.length(key)) + len(content)) > self._token_limit:
-            raise TokenLengthExceeded(f"Required token length={token_length}  limit={self._token_limit}")
-        if (entry := ContextEntry(role, str(content).strip())) not in (ctx := self.store[key]):
-            ctx.append(entry)
-
-        return self.get(key)
+        text: str = str(content).strip()
+        # Tokens are counted before taking the lock, so other threads are not held by the encoding.
+        entry = ContextEntry(role, text, count_tokens(text, self._model_name))
+        with self._lock:
+            self._apply_compaction(key)
+            if (role, text) in self._entries[key]:
+                return False
+            if (token_length := self.tokens(key) + entry.tokens) > self._token_limit:
+                if self._summarizer is None or entry.tokens > self._token_limit:
+                    raise TokenLengthExceeded(f"Required token length={token_length}  limit={self._token_limit}")
+                self._shrink(key, self._token_limit - entry.tokens)
+            self._append(key, entry)
+            self._record(key, "push", role=role, content=text)
+            if self._summarizer and self.tokens(key) >= self._high_water and key not in self._compacting:
+                if oldest := self.oldest(key, self.tokens(key) // 2):
+                    self._compacting.add(key)
+                    self._summarizer(key, oldest)
+
+        return True
 
     def get(self, key: str) -> ContextRaw:
         """Retrieve a context message identified by the specified key.
@@ -93,17 +136,18 @@ class ChatContext:
         :return: The context message associated with the key.
         """
 
-        return [{"role": ctx.role, "content": ctx.content} for ctx in self.store[key]] or []
+        return [{"role": ctx.role, "content": ctx.content} for ctx in self[key]]
 
-    def set(self, key: str, content: Any, role: ChatRoles = "human") -> ContextRaw:
+    def set(self, key: str, content: Any, role: ChatRoles = "human") -> bool:
         """Set the context message in the chat with the specified role.
         :param key: The identifier for the context message.
         :param content: The content of the message to set.
         :param role: The role associated with the message (default is "human").
-        :return: The updated chat context.
+        :return: True if the message was set.
         """
-        self.clear(key)
-        return self.push(key, content, role)
+        with self._lock:
+            self.clear(key)
+            return self.push(key, content, role)
 
     def remove(self, key: str, index: int) -> Optional[str]:
         """Remove a context message from the chat at the specified index.
@@ -112,19 +156,122 @@ class ChatContext:
         :return: The removed message if successful, otherwise None.
         """
         val = None
-        if ctx := self.store[key]:
-            if index < len(ctx):
+        with self._lock:
+            if (ctx := self._store.get(key)) and index < len(ctx):
                 val = ctx[index]
                 del ctx[index]
+                self._discard(key, val)
+                self._record(key, "remove", index=index)
         return val
 
+    def compact_with(self, summarizer: Callable[[str, list[ContextEntry]], None], high_water: float) -> None:
+        """Enable the compaction mode. Once a context reaches the high-water mark, its oldest entries are handed to the
+        summarizer, which is expected to call compact with their summary (possibly from another thread). Meanwhile, a
+        push that would exceed the token limit drops the oldest entries instead of raising TokenLengthExceeded.
+        :param summarizer: The callback that summarizes the oldest entries of the context identified by the key.
+        :param high_water: The fraction of the token limit that triggers the compaction.
+        """
+        check_argument(0.0 < high_water <= 1.0, f"Invalid high-water mark: {high_water}")
+        with self._lock:
+            self._summarizer = summarizer
+            self._high_water = int(self._token_limit * high_water)
+
+    def oldest(self, key: str, max_tokens: int) -> list[ContextEntry]:
+        """Return the oldest entries of the context, up to the given number of tokens. The newest entry is never
+        included.
+        :param key: The identifier for the context.
+        :param max_tokens: The maximum number of tokens of the returned entries.
+        :return: The oldest entries, in the context order.
+        """
+        oldest, total = [], 0
+        for entry in self[key][:-1]:
+            if (total := total + entry.tokens) > max_tokens:
+                break
+            oldest.append(entry)
+        return oldest
+
+    def compact(self, key: str, entries: list[ContextEntry], summary: Optional[str]) -> None:
+        """Replace the given (oldest) entries of the context by their summary. The replacement is deferred to the next
+        push or view of the context, so it's safe to call this from the summarizer thread.
+        :param key: The identifier for the context.
+        :param entries: The entries handed to the summarizer.
+        :param summary: The summary of the entries, or None if it could not be generated.
+        """
+        with self._lock:
+            if summary and key in self._compacting:
+                self._compactions[key] = entries, summary
+            else:
+                self._compacting.discard(key)
+
+    def _apply_compaction(self, key: str) -> None:
+        """Apply a pending compaction of the context, replacing its summarized entries by a single system entry.
+        :param key: The identifier for the context.
+        """
+        if (compaction := self._compactions.pop(key, None)) is None:
+            return
+        entries, summary = compaction
+        summarized: set[int] = set(map(id, entries))
+        ctx: deque = self._store[key]
+        count: int = 0
+        while count < len(ctx) and id(ctx[count]) in summarized:
+            count += 1
+        self._summarize_oldest(key, count, summary)
+        self._compacting.discard(key)
+        self._record(key, "compact", count=count, summary=summary)
+        log.info("ChatContext::[COMPACTED] '%s' %d entries summarized, tokens=%d", key, len(entries), self.tokens(key))
+
+    def _shrink(self, key: str, max_tokens: int) -> None:
+        """Drop the oldest entries of the context until it fits the given number of tokens.
+        :param key: The identifier for the context.
+        :param max_tokens: The number of tokens the context must fit into.
+        """
+        ctx: deque = self._store[key]
+        count: int = 0
+        while ctx and self.tokens(key) > max_tokens:
+            self._discard(key, ctx.popleft())
+            count += 1
+        self._record(key, "drop", count=count)
+        log.warning("ChatContext::[SHRUNK] '%s' %d oldest entries dropped before being summarized", key, count)
+
+    def _summarize_oldest(self, key: str, count: int, summary: str) -> None:
+        """Replace the oldest entries of the context by a single system entry holding their summary.
+        :param key: The identifier for the context.
+        :param count: The number of oldest entries to replace.
+        :param summary: The summary of the replaced entries.
+        """
+        ctx: deque = self._store[key]
+        for _ in range(min(count, len(ctx))):
+            self._discard(key, ctx.popleft())
+        if len(ctx) == ctx.maxlen:
+            self._discard(key, ctx.popleft())
+        entry = ContextEntry("system", summary, count_tokens(summary, self._model_name))
+        ctx.appendleft(entry)
+        self._entries[key].add((entry.role, entry.content))
+        self._lengths[key] += len(entry.content)
+        self._tokens[key] += entry.tokens
+        self._touch(key)
+
     def length(self, key: str):
         """Return the length of the context identified by the specified key.
         :param key: The identifier for the context.
         :return: The length of the context (e.g., number of content entries).
         """
-        ctx = self.store[key]
-        return reduce(lambda total, e: total + len(e.content), ctx, 0) if len(ctx) > 0 else 0
+        return self._lengths.get(key, 0)
+
+    def tokens(self, key: str) -> int:
+        """Return the number of tokens of the context identified by the specified key.
+        :param key: The identifier for the context.
+        :return: The sum of the tokens of the context entries.
+        """
+        return self._tokens.get(key, 0)
+
+    def remaining_tokens(self, *keys: str) -> int:
+        """Return how many tokens are left, within the token limit, after the specified contexts.
+        :param keys: The identifiers for the contexts (all contexts if none is given).
+        :return: The number of tokens still available for building a prompt.
+        """
+        with self._lock:
+            return self._token_limit - sum(self.tokens(k) for k in (keys or list(self._store.keys())))
 
     def join(self, *keys: str) -> LangChainContext:
         """Join multiple contexts identified by the specified keys.
@@ -133,27 +280,51 @@ class ChatContext:
         """
         context: LangChainContext = []
         token_length = 0
-        for key in keys:
-            ctx: ContextRaw = self.get(key)
-            content: str = os.linesep.join([tk["content"] for tk in ctx])
-            token_length += len(content or "")
-            if token_length > self._token_limit:
-                raise TokenLengthExceeded(f"Required token length={token_length}k  limit={self._token_limit}k")
-            if content and ctx not in context:
-                list(map(context.append, [(t["role"], t["content"]) for t in ctx]))
+        with self._lock:
+            list(map(self._apply_compaction, keys))
+            for key in keys:
+                if not (ctx := self._store.get(key)):
+                    continue
+                token_length += self.tokens(key)
+                if token_length > self._token_limit:
+                    raise TokenLengthExceeded(f"Required token length={token_length}  limit={self._token_limit}")
+                context.extend((e.role, e.content) for e in ctx)
         return context
 
     def flat(self, *keys: str) -> ChatMessageHistory:
-        """Flatten multiple contexts identified by the specified keys into a single chat history.
+        """Flatten multiple contexts identified by the specified keys into a single chat history. The messages are
+        built once and reused until one of the contexts changes.
         :param keys: The identifiers for the contexts to flatten.
         :return: The flattened chat message history.
         """
-        history = ChatMessageHistory()
-        flatten: LangChainContext = self.join(*keys)
-        for ctx_entry in flatten:
-            mtype = self.LANGCHAIN_ROLE_MAP[ctx_entry[0]]
-            history.add_message(mtype(ctx_entry[1]))
-        return history
+        # RunnableWithMessageHistory appends the exchanged messages to the history it gets, so hand out a copy.
+        return ChatMessageHistory(messages=list(self._view(keys)[1]))
+
+    def stringify(self, *keys: str) -> str:
+        """Return the flattened contexts identified by the specified keys as text (same as str(flat(*keys))). The
+        text is built once and reused until one of the contexts changes.
+        :param keys: The identifiers for the contexts to stringify.
+        :return: The flattened chat history text.
+        """
+        with self._lock:
+            versions, messages, text = self._view(keys)
+            if text is None:
+                text = get_buffer_string(messages)
+                self._views[keys] = versions, messages, text
+        return text
+
+    def _view(self, keys: tuple[str, ...]) -> tuple[tuple[int, ...], list[BaseMessage], Optional[str]]:
+        """Return the cached flattened view of the contexts, rebuilding it if any of them changed since it was built.
+        :param keys: The identifiers for the contexts to flatten.
+        :return: A tuple containing the context versions, the flattened messages and their text (if already built).
+        """
+        with self._lock:
+            list(map(self._apply_compaction, keys))
+            versions: tuple[int, ...] = tuple(self._versions.get(k, 0) for k in keys)
+            if (view := self._views.get(keys)) is None or view[0] != versions:
+                messages = [self.LANGCHAIN_ROLE_MAP[role](content) for role, content in self.join(*keys)]
+                self._views[keys] = view = versions, messages, None
+        return view
 
     def clear(self, *keys: str) -> int:
         """Clear all chat contexts specified by the provided keys.
@@ -162,11 +333,19 @@ class ChatContext:
         """
 
         count = 0
-        contexts = list(keys or self.store.keys())
-        while contexts and (key := contexts.pop()):
-            if key in self.store:
-                del self.store[key]
-                count += 1
+        with self._lock:
+            contexts = list(keys or self._store.keys())
+            while contexts and (key := contexts.pop()):
+                if key in self._store:
+                    del self._store[key]
+                    self._lengths.pop(key, None)
+                    self._tokens.pop(key, None)
+                    self._entries.pop(key, None)
+                    self._compactions.pop(key, None)
+                    self._compacting.discard(key)
+                    self._touch(key)
+                    self._record(key, "clear")
+                    count += 1
         return count
 
     def forget(self, *keys: str) -> None:
@@ -181,10 +360,116 @@ class ChatContext:
         :return: The number of entries in the context.
         """
 
-        return len(self.store[key])
+        with self._lock:
+            return len(self._store.get(key, ()))
+
+    def digest(self, key: str, window: int) -> str:
+        """Return a digest of the last entries of the context identified by the specified key.
+        :param key: The identifier for the context.
+        :param window: The number of most recent entries to digest.
+        :return: The hash of the role and content of the last window entries.
+        """
+        entries: tuple[ContextEntry, ...] = self[key][-window:] if window > 0 else ()
+        return hash_text(chr(31).join(f"{e.role}:{e.content}" for e in entries))[:16]
+
+    def _append(self, key: str, entry: ContextEntry) -> None:
+        """Append the entry to the context, evicting the oldest one when the context window is full.
+        :param key: The identifier for the context.
+        :param entry: The entry to append.
+        """
+        if len(ctx := self._store[key]) == ctx.maxlen:
+            self._discard(key, ctx.popleft())
+        ctx.append(entry)
+        self._entries[key].add((entry.role, entry.content))
+        self._lengths[key] += len(entry.content)
+        self._tokens[key] += entry.tokens
+        self._touch(key)
+
+    def _discard(self, key: str, entry: ContextEntry) -> None:
+        """Update the running counters of the context after one of its entries was removed.
+        :param key: The identifier for the context.
+        :param entry: The removed entry.
+        """
+        self._lengths[key] -= len(entry.content)
+        self._tokens[key] -= entry.tokens
+        self._entries[key].discard((entry.role, entry.content))
+        self._touch(key)
+
+    def _touch(self, key: str) -> None:
+        """Mark the context as changed, so the cached views that include it are rebuilt.
+        :param key: The identifier for the changed context.
+        """
+        self._version += 1
+        self._versions[key] = self._version
+
+    def _record(self, key: str, op: str, **data: Any) -> None:
+        """Buffer a change of the context into the journal, if any.
+        :param key: The identifier for the changed context.
+        :param op: The change operation (push, remove, clear, compact or drop).
+        :param data: The operation data.
+        """
+        if self._journal:
+            self._journal.append({"key": key, "op": op, **data})
+
+    def records(self) -> list[JournalRecord]:
+        """Return the journal records that rebuild the current contexts.
+        :return: A list with one push record per context entry.
+        """
+        return [
+            {"key": key, "op": "push", "role": entry.role, "content": entry.content}
+            for key, ctx in self.store.items()
+            for entry in ctx
+        ]
+
+    def replay(self, records: Iterable[JournalRecord]) -> int:
+        """Rebuild the contexts from journal records (see ContextJournal.replay). Token limits are not enforced here;
+        contexts beyond the limit are shrunk at the end.
+        :param records: The journal records, in the order they were written.
+        :return: The number of replayed records.
+        """
+        count: int = 0
+        records = list(records)
+        # The pushed contents are counted up-front, in a single (parallel) batch.
+        tokens: Iterator[int] = iter(
+            count_tokens_batch([r["content"] for r in records if r["op"] == "push"], self._model_name)
+        )
+        with self._lock:
+            journal, self._journal = self._journal, None
+            try:
+                for count, record in enumerate(records, start=1):
+                    match record["op"], record["key"]:
+                        case "push", key:
+                            self._append(key, ContextEntry(record["role"], record["content"], next(tokens)))
+                        case "remove", key:
+                            self.remove(key, record["index"])
+                        case "clear", key:
+                            self.clear(key)
+                        case "compact", key:
+                            self._summarize_oldest(key, record["count"], record["summary"])
+                        case "drop", key:
+                            for _ in range(min(record["count"], len(ctx := self._store[key]))):
+                                self._discard(key, ctx.popleft())
+                for key in [k for k in self._store.keys() if self.tokens(k) > self._token_limit]:
+                    self._shrink(key, self._token_limit)
+            finally:
+                self._journal = journal
+        return count
+
+    def journal_to(self, journal: ContextJournal) -> None:
+        """Journal every change of the contexts from now on. The journal starts from a snapshot of the current
+        contexts, so it holds exactly what is in memory.
+        :param journal: The context journal.
+        """
+        with self._lock:
+            self._journal = journal
+            journal.compact(self.records())
 
     def save(self) -> None:
-        """Save the current context window to the cache."""
-        ctx: LangChainContext = self.join(*self.store.keys())
-        ctx_str: list[str] = [f"{role}: {msg}" for role, msg in ctx]
-        cache.save_context(ctx_str)
+        """Persist the changes made since the last save, in a single journal append. Once the journal grew enough, it
+        is compacted into a snapshot of the current contexts.
+        """
+        with self._lock:
+            if self._journal:
+                self._journal.flush()
+                if self._journal.needs_compaction:
+                    self._journal.compact(self.records())
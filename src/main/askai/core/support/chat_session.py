@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.support.chat_session
+      @file: chat_session.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.askai_configs import configs
+from askai.core.component.context_journal import ContextJournal
+from askai.core.engine.ai_engine import AIEngine
+from askai.core.support.chat_context import ChatContext
+from askai.core.support.context_memory import ContextMemory
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+
+class ChatSession:
+    """Hold the instances scoped to one conversation: the AI engine, the chat context (journaled under the session
+    ID), the agent memory and the routing mode. A session is activated for the current thread (or asyncio task) by
+    the activate context manager; while it's active, the shared instances resolve to it. Sessions are journaled apart
+    from the CLI conversation (see JOURNAL_NAME), so the CLI never restores a session conversation; throwaway sessions
+    are not journaled at all.
+    """
+
+    # Name of the session journals.
+    JOURNAL_NAME: str = "session"
+
+    def __init__(self, session_id: str, engine: AIEngine, mode: Any, journaled: bool = True):
+        self._session_id: str = session_id
+        self._engine: AIEngine = engine
+        self._mode: Any = mode
+        self._context: ChatContext = ChatContext(
+            engine.ai_token_limit(), configs.max_short_memory_size, engine.ai_model_name()
+        )
+        self._journal: ContextJournal | None = None
+        if journaled:
+            self._journal = ContextJournal(self.JOURNAL_NAME)
+            self._journal.open(session_id)
+            if configs.is_keep_context:
+                self._context.replay(self._journal.replay(session_id))
+            self._context.journal_to(self._journal)
+        self._memory: ContextMemory | None = None
+
+    def __str__(self):
+        return f"ChatSession(id={self._session_id}, engine={self._engine.ai_model_name()}, mode={self._mode})"
+
+    @property
+    def session_id(self) -> str:
+        return self._session_id
+
+    @property
+    def engine(self) -> AIEngine:
+        return self._engine
+
+    @property
+    def journal(self) -> Optional[ContextJournal]:
+        return self._journal
+
+    @property
+    def context(self) -> ChatContext:
+        return self._context
+
+    @property
+    def memory(self) -> ContextMemory:
+        if self._memory is None:
+            self._memory = ContextMemory.of(self._context)
+        return self._memory
+
+    @property
+    def mode(self) -> Any:
+        return self._mode
+
+    @mode.setter
+    def mode(self, value: Any) -> None:
+        self._mode = value
+
+    @contextmanager
+    def activate(self) -> Iterator["ChatSession"]:
+        """Make this the active session, until the context manager exits.
+        :return: A context manager yielding this session.
+        """
+        token = current_session.set(self)
+        try:
+            yield self
+        finally:
+            current_session.reset(token)
+
+
+# The active chat session of the current thread (or asyncio task), if any.
+current_session: ContextVar[Optional[ChatSession]] = ContextVar("current_session", default=None)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.support.context_memory
+      @file: context_memory.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from langchain.memory import ConversationBufferWindowMemory
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import BaseMessage, get_buffer_string
+from typing import Any, Sequence
+
+from askai.core.askai_configs import configs
+from askai.core.support.chat_context import ChatContext
+
+
+class ContextChatHistory(BaseChatMessageHistory):
+    """Provide the LangChain chat message history interface on top of a chat context key. Nothing is stored here;
+    messages are read from, and written to, the chat context.
+    """
+
+    # Chat context roles of the LangChain message types.
+    ROLE_MAP: dict[str, str] = {"human": "human", "ai": "assistant", "system": "system"}
+
+    def __init__(self, context: ChatContext, key: str = "HISTORY"):
+        self._context: ChatContext = context
+        self._key: str = key
+
+    @property
+    def messages(self) -> list[BaseMessage]:
+        return self._context.flat(self._key).messages
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """Push the messages into the chat context.
+        :param messages: The messages to add.
+        """
+        for message in messages:
+            self._context.push(self._key, message.content, self.ROLE_MAP.get(message.type, "human"))
+
+    def clear(self) -> None:
+        """Forget all messages of the chat context key."""
+        self._context.forget(self._key)
+
+
+class ContextMemory(ConversationBufferWindowMemory):
+    """Provide the LangChain conversation window memory on top of the chat context HISTORY, so the conversation is
+    kept (and persisted) only once.
+    """
+
+    @classmethod
+    def of(cls, context: ChatContext, memory_key: str = "chat_history") -> "ContextMemory":
+        """Create the conversation window memory over the chat context HISTORY.
+        :param context: The chat context.
+        :param memory_key: The key used to identify the memory (default is "chat_history").
+        :return: A ContextMemory instance.
+        """
+        return cls(
+            chat_memory=ContextChatHistory(context, "HISTORY"),
+            memory_key=memory_key,
+            k=configs.max_short_memory_size,
+            return_messages=True,
+        )
+
+    def load_memory_variables(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        """Return the conversation window. The TaskAgent pushes the task into the chat context before running it, so
+        it's the last entry of the conversation; it's left out of the window, as the agent gets it as its input.
+        :param inputs: The agent inputs.
+        :return: The memory variables (the conversation window, keyed by the memory key).
+        """
+        messages: list[BaseMessage] = self.chat_memory.messages
+        if messages and messages[-1].content == inputs.get(self.input_key or "input"):
+            messages = messages[:-1]
+        window: list[BaseMessage] = messages[-self.k * 2 :] if self.k > 0 else []
+        if not self.return_messages:
+            return {self.memory_key: get_buffer_string(window, self.human_prefix, self.ai_prefix)}
+        return {self.memory_key: window}
+
+    def save_context(self, inputs: dict[str, Any], outputs: dict[str, str]) -> None:
+        """Do nothing: the TaskAgent pushes the task (before running it, so the tools can see it) and its output into
+        the chat context itself; saving the exchange here would duplicate it.
+        :param inputs: The agent inputs.
+        :param outputs: The agent outputs.
+        """
@@ -12,49 +12,87 @@
 
    Copyright (c) 2024, AskAI
 """
+from askai.core.component.cache_metrics import CacheMetrics
 from hspylib.core.metaclass.singleton import Singleton
 from hspylib.core.preconditions import check_not_none
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import BaseChatModel, BaseLLM
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional
+from weakref import WeakKeyDictionary
+
+import asyncio
 
 from askai.core.support.shared_instances import shared
 
 
 class LangChainSupport(metaclass=Singleton):
-    """Helper class to support the use of langchain framework."""
+    """Helper class to support the use of langchain framework. Model instances are pooled per engine and settings, so
+    repeated calls reuse the same instance (and, through it, the engine's keep-alive HTTP client). Models created
+    within an event loop are pooled apart, per loop, as their async client (used by ainvoke/astream) is bound to it.
+    """
 
     INSTANCE: "LangChainSupport"
 
-    @staticmethod
-    def create_model(temperature: float = 0.0, top_p: float = 0.0) -> BaseLLM:
+    def __init__(self):
+        self._pool: dict[tuple[Hashable, ...], Any] = {}
+        self._loop_pools: WeakKeyDictionary[asyncio.AbstractEventLoop, dict] = WeakKeyDictionary()
+        self._lock = Lock()
+        self._metrics: CacheMetrics = CacheMetrics()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return self._metrics.as_dict(entries=len(self._pool) + sum(map(len, self._loop_pools.values())))
+
+    def _current_pool(self) -> dict[tuple[Hashable, ...], Any]:
+        """Return the model pool of the running event loop, or the default pool when there is no running loop."""
+        try:
+            return self._loop_pools.setdefault(asyncio.get_running_loop(), {})
+        except RuntimeError:
+            return self._pool
+
+    def _pooled(self, key: tuple[Hashable, ...], create_fn: Callable[[], Any]) -> Any:
+        """Return the pooled model instance of the key, creating it on the first call.
+        :param key: The model key (kind, engine and settings).
+        :param create_fn: The function that creates the model instance.
+        :return: The model instance.
+        """
+        check_not_none(shared.engine, "AI Engine was not created yet!")
+        with self._lock:
+            pool: dict[tuple[Hashable, ...], Any] = self._current_pool()
+            if not self._metrics.record((model := pool.get(key)) is not None):
+                pool[key] = model = create_fn()
+        return model
+
+    def create_model(self, temperature: float = 0.0, top_p: float = 0.0) -> BaseLLM:
         """Create a LangChain LLM model instance using the current AI engine.
         :param temperature: The temperature setting for the LLM model, which controls the randomness of the output.
         :param top_p: The top-p setting for the LLM model, which controls the diversity of the output by limiting the
                       cumulative probability of token selection.
         :return: An instance of the LLM model.
         """
-        check_not_none(shared.engine, "AI Engine was not created yet!")
-        return shared.engine.lc_model(temperature, top_p)
+        engine = shared.engine
+        return self._pooled(("llm", engine, temperature, top_p), lambda: engine.lc_model(temperature, top_p))
 
-    @staticmethod
-    def create_chat_model(temperature: float = 0.0) -> BaseChatModel:
+    def create_chat_model(self, temperature: float = 0.0, model_name: Optional[str] = None) -> BaseChatModel:
         """Create a LangChain LLM chat model instance using the current AI engine.
         :param temperature: The temperature setting for the LLM chat model, which controls the randomness of the
                             responses.
+        :param model_name: The model to use instead of the engine's one, e.g. a cheaper model for background tasks.
         :return: An instance of the LLM chat model.
         """
+        engine = shared.engine
+        return self._pooled(
+            ("chat", engine, model_name, temperature), lambda: engine.lc_chat_model(temperature, model_name)
+        )
 
-        check_not_none(shared.engine, "AI Engine was not created yet!")
-        return shared.engine.lc_chat_model(temperature)
-
-    @staticmethod
-    def create_embeddings(model: str = "text-embedding-3-small") -> Embeddings:
+    def create_embeddings(self, model: str = "text-embedding-3-small") -> Embeddings:
         """Create a LangChain LLM embeddings model instance using the current AI engine.
         :param model: The name of the embeddings model to use (default is "text-embedding-3-small").
         :return: An instance of the embeddings model.
         """
-        check_not_none(shared.engine, "AI Engine was not created yet!")
-        return shared.engine.lc_embeddings(model)
+        engine = shared.engine
+        return self._pooled(("embeddings", engine, model), lambda: engine.lc_embeddings(model))
 
 
 assert (lc_llm := LangChainSupport().INSTANCE) is not None
@@ -19,11 +19,14 @@ from askai.core.askai_configs import configs
 from askai.core.askai_messages import msg
 from askai.core.askai_prompt import prompt
 from askai.core.component.cache_service import cache
+from askai.core.component.context_journal import context_journal
 from askai.core.component.geo_location import geo_location
 from askai.core.component.multimedia.recorder import recorder
 from askai.core.engine.ai_engine import AIEngine
 from askai.core.engine.engine_factory import EngineFactory
-from askai.core.support.chat_context import ChatContext, ContextEntry
+from askai.core.support.chat_context import ChatContext
+from askai.core.support.chat_session import ChatSession, current_session
+from askai.core.support.context_memory import ContextMemory
 from askai.core.support.utilities import display_text
 from clitt.core.term.terminal import terminal
 from clitt.core.tui.line_input.line_input import line_input
@@ -40,7 +43,10 @@ import os
 
 
 class SharedInstances(metaclass=Singleton):
-    """Provides access to shared instances."""
+    """Provides access to shared instances. The context, memory, engine and mode resolve to the active chat session
+    (see ChatSession.activate) when there is one, so one process can serve many conversations; otherwise, they resolve
+    to the process-wide instances.
+    """
 
     INSTANCE: "SharedInstances"
 
@@ -55,8 +61,14 @@ class SharedInstances(metaclass=Singleton):
         self._idiom: str = configs.language.idiom
         self._max_iteractions: int = configs.max_iteractions
 
+    @property
+    def session(self) -> Optional[ChatSession]:
+        return current_session.get()
+
     @property
     def context(self) -> Optional[ChatContext]:
+        if session := self.session:
+            return session.context
         return self._context
 
     @context.setter
@@ -66,6 +78,8 @@ class SharedInstances(metaclass=Singleton):
 
     @property
     def engine(self) -> Optional[AIEngine]:
+        if session := self.session:
+            return session.engine
         return self._engine
 
     @engine.setter
@@ -75,14 +89,19 @@ class SharedInstances(metaclass=Singleton):
 
     @property
     def mode(self) -> Any:
+        if session := self.session:
+            return session.mode
         return self._mode
 
     @mode.setter
     def mode(self, value: Any) -> None:
-        self._mode = value
+        if session := self.session:
+            session.mode = value
+        else:
+            self._mode = value
 
     def mode_icon(self) -> str:
-        return self._mode.icon
+        return self.mode.icon
 
     @property
     def nickname(self) -> str:
@@ -106,6 +125,8 @@ class SharedInstances(metaclass=Singleton):
 
     @property
     def memory(self) -> ConversationBufferWindowMemory:
+        if session := self.session:
+            return session.memory
         return self.create_memory()
 
     @property
@@ -160,33 +181,29 @@ class SharedInstances(metaclass=Singleton):
             self._mode = mode
         return self._engine
 
-    def create_context(self, token_limit: int) -> ChatContext:
+    def create_context(self, token_limit: int, model_name: str) -> ChatContext:
         """Create or retrieve a chat context with the specified token limit.
         :param token_limit: The maximum number of tokens allowed in the chat context.
+        :param model_name: The name of the model whose encoding is used to count the context tokens.
         :return: An instance of the ChatContext configured with the specified token limit.
         """
         if self._context is None:
-            self._context = ChatContext(token_limit, configs.max_short_memory_size)
-            if configs.is_keep_context:
-                entries: list[str] = cache.read_context()
-                for role, content in zip(entries[::2], entries[1::2]):
-                    ctx = self._context.store["HISTORY"]
-                    ctx.append(ContextEntry(role, content))
+            self._context = ChatContext(token_limit, configs.max_short_memory_size, model_name)
+            if configs.is_keep_context and not self._context.replay(context_journal.replay()):
+                for role, content in cache.read_context():
+                    self._context.push("HISTORY", content, role)
+            self._context.journal_to(context_journal)
         return self._context
 
     def create_memory(self, memory_key: str = "chat_history") -> ConversationBufferWindowMemory:
-        """Create or retrieve the conversation window memory.
+        """Create or retrieve the conversation window memory. The memory is a window over the chat context HISTORY, so
+        the conversation is kept, and persisted, only once.
         :param memory_key: The key used to identify the memory (default is "chat_history").
         :return: An instance of BaseChatMemory associated with the specified memory key.
         """
         if self._memory is None:
-            self._memory = ConversationBufferWindowMemory(
-                memory_key=memory_key, k=configs.max_short_memory_size, return_messages=True
-            )
-            if configs.is_keep_context:
-                entries: list[str] = cache.read_memory()
-                for role, content in zip(entries[::2], entries[1::2]):
-                    self._memory.chat_memory.add_message(self.context.LANGCHAIN_ROLE_MAP[role](content))
+            check_state(self._context is not None, "Chat context was not created yet!")
+            self._memory = ContextMemory.of(self._context, memory_key)
         return self._memory
 
     def input_text(self, input_prompt: str, placeholder: str | None = None) -> Optional[str]:
@@ -157,13 +157,21 @@ class TextFormatter(metaclass=Singleton):
 
         return text
 
+    def markdown(self, text: AnyStr, theme: str = RICH_THEMES['ansi_dark']) -> Markdown:
+        """Create the renderable of a markdown-formatted text.
+        :param text: The markdown-formatted text to be rendered.
+        :param theme: The rich theme to be used for rendering (default is 'ansi_dark').
+        :return: The rich Markdown renderable.
+        """
+        colorized: str = VtColor.colorize(VtCode.decode(self.beautify(text)))
+        return Markdown(colorized, code_theme=theme)
+
     def display_markdown(self, text: AnyStr, theme: str = RICH_THEMES['ansi_dark']) -> None:
         """Display a markdown-formatted text.
         :param text: The markdown-formatted text to be displayed.
         :param theme: The rich theme to be used for rendering (default is 'ansi_dark').
         """
-        colorized: str = VtColor.colorize(VtCode.decode(self.beautify(text)))
-        self.console.print(Markdown(colorized, code_theme=theme))
+        self.console.print(self.markdown(text, theme))
 
     def display_text(self, text: AnyStr) -> None:
         """Display a VT100 formatted text.
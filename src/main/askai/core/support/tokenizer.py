@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.core.support.tokenizer
+      @file: tokenizer.py
+   @created: Sat, 17 Oct 2026
+    @author: <B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: https://github.com/yorevs/askai
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from functools import lru_cache
+from math import ceil
+from typing import Optional, Sequence
+
+import logging as log
+import tiktoken
+
+# Encoding used for models unknown to tiktoken.
+DEFAULT_ENCODING: str = "o200k_base"
+
+# Average number of characters per token, used when no encoding can be loaded.
+CHARS_PER_TOKEN: int = 4
+
+# Number of threads used to encode a batch of texts.
+BATCH_THREADS: int = 8
+
+
+@lru_cache(maxsize=None)
+def encoding_for(model_name: str) -> Optional[tiktoken.Encoding]:
+    """Return the tiktoken encoding of the model. Encodings are loaded once per model and then reused.
+    :param model_name: The model name.
+    :return: The model encoding, or None if it could not be loaded (e.g. the BPE files can't be downloaded).
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as err:
+        log.warning("Unable to load the token encoding for '%s'; tokens will be estimated: %s", model_name, err)
+        return None
+
+
+def count_tokens(text: str, model_name: str) -> int:
+    """Count the number of tokens of the text, as seen by the model.
+    :param text: The text to count.
+    :param model_name: The model name.
+    :return: The number of tokens, or an estimate of it when the model encoding is not available.
+    """
+    if not text:
+        return 0
+    if encoding := encoding_for(model_name):
+        return len(encoding.encode(text, disallowed_special=()))
+    return ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def count_tokens_batch(texts: Sequence[str], model_name: str, num_threads: int = BATCH_THREADS) -> list[int]:
+    """Count the number of tokens of each text, as seen by the model. The texts are encoded in parallel (tiktoken
+    releases the GIL while encoding).
+    :param texts: The texts to count.
+    :param model_name: The model name.
+    :param num_threads: The number of encoding threads.
+    :return: The number of tokens of each text (in order), or an estimate of them when the model encoding is not
+    available.
+    """
+    if not texts:
+        return []
+    if encoding := encoding_for(model_name):
+        return list(map(len, encoding.encode_batch(list(texts), num_threads=num_threads, disallowed_special=())))
+    return [ceil(len(text) / CHARS_PER_TOKEN) for text in texts]
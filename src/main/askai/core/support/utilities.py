@@ -13,8 +13,12 @@
 Copyright (c) 2024, AskAI
 """
 
+from askai.core.askai_configs import configs
+from askai.core.askai_events import events
 from askai.core.support.text_formatter import text_formatter
+from askai.language.language import Language
 from clitt.core.term.cursor import cursor
+from contextlib import contextmanager
 from hspylib.core.config.path_object import PathObject
 from hspylib.core.enums.charset import Charset
 from hspylib.core.metaclass.classpath import AnyPath
@@ -24,7 +28,8 @@ from hspylib.core.tools.text_tools import ensure_endswith, strip_escapes
 from hspylib.core.zoned_datetime import now_ms
 from os.path import basename, dirname
 from pathlib import Path
-from typing import AnyStr, Optional, TypeAlias
+from threading import Event
+from typing import Any, AnyStr, Iterable, Iterator, Optional, TypeAlias
 
 import base64
 import mimetypes
@@ -36,6 +41,9 @@ import sys
 
 QueryString: TypeAlias = None | str | list[str]
 
+# Set while a reply is computed in background (e.g. by the cache warm-up), as it's not shown to the user.
+_BACKGROUND: Event = Event()
+
 
 def read_stdin() -> Optional[str]:
     """Read input from the standard input (stdin).
@@ -61,6 +69,42 @@ def display_text(text: AnyStr, prefix: AnyStr = "", markdown: bool = True, erase
         text_formatter.display_text(f"{str(prefix)}{text}")
 
 
+@contextmanager
+def in_background() -> Iterator[None]:
+    """Mark the replies computed within the context as background ones, which are not streamed. Background replies
+    must not run along with the user's questions (see CacheWarmup.cancel).
+    """
+    _BACKGROUND.set()
+    try:
+        yield
+    finally:
+        _BACKGROUND.clear()
+
+
+def is_streaming() -> bool:
+    """Whether the AI replies are streamed to the user as they are generated. Replies that will be spoken or translated
+    are only usable once complete, so they are never streamed; neither are the replies computed in background.
+    :return: True if the replies are streamed, otherwise False.
+    """
+    if _BACKGROUND.is_set():
+        return False
+    return configs.is_stream_reply and not configs.is_speak and configs.language == Language.EN_US
+
+
+def stream_text(chunks: Iterable[Any]) -> str:
+    """Emit the chunks of a reply, as they arrive, to be displayed while the reply is generated.
+    :param chunks: The reply chunks (text or LangChain message chunks).
+    :return: The whole reply text, once the stream completes.
+    """
+    parts: list[str] = []
+    for chunk in chunks:
+        if text := str(getattr(chunk, "content", chunk) or ""):
+            parts.append(text)
+            events.stream.emit(text=text)
+    events.stream.emit(text=(output := "".join(parts)), done=True)
+    return output
+
+
 def find_file(filename: AnyPath) -> Optional[Path]:
     """Find the specified file by name in the most common locations.
     :param filename: The name or path of the file to find.
@@ -20,6 +20,10 @@ class NoSuchEngineError(HSBaseException):
     """Raised when the provided engine does not exist"""
 
 
+class CassetteMissError(HSBaseException):
+    """Raised when a replayed AI request was not recorded in the cassette."""
+
+
 class InvalidRecognitionApiError(HSBaseException):
     """Raised when an invalid recognition API callback is provided."""
 
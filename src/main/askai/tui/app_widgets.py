@@ -191,7 +191,7 @@ class InputActions(Static):
     @work(thread=True)
     def read_aloud(self) -> None:
         """Read the last reply aloud using hte default voice."""
-        if (ctx := str(shared.context.flat("LAST_REPLY"))) and (
+        if (ctx := shared.context.stringify("LAST_REPLY")) and (
             last_reply := re.sub(
                 r"^((system|human|AI|assistant):\s*)", "", ctx, flags=re.MULTILINE | re.DOTALL | re.IGNORECASE
             )
@@ -84,6 +84,10 @@ class AskAiApp(App[None]):
         self._askai: AskAi = AskAi(speak, debug, cacheable, tempo, engine_name, model_name, mode)
         self._re_render: bool = True
         self._display_buffer: list[str] = list()
+        self._stream_text: str | None = None
+        self._stream_shown: str | None = None
+        self._stream_offset: int | None = None
+        self._streamed: str | None = None
         self._startup()
 
     def __str__(self) -> str:
@@ -235,6 +239,7 @@ class AskAiApp(App[None]):
         :param overwrite: Whether to overwrite the existing content in the console (default is True).
         """
         is_new: bool = not file_is_not_empty(str(self.console_path)) or overwrite
+        self._stream_offset = self._stream_shown = None
         with open(self.console_path, "w" if overwrite else "a", encoding=Charset.UTF_8.val) as f_console:
             f_console.write(
                 f"{'---' + os.linesep * 2 if not is_new else ''}"
@@ -295,6 +300,9 @@ class AskAiApp(App[None]):
         """
         if len(self._display_buffer) > 0:
             with open(self.console_path, "a", encoding=Charset.UTF_8.val) as f_console:
+                if self._stream_offset is not None:  # Erase the partial reply; it's written again after the buffer.
+                    f_console.truncate(self._stream_offset)
+                    self._stream_offset = self._stream_shown = None
                 prev_text: str | None = None
                 while len(self._display_buffer) > 0:
                     if (text := self._display_buffer.pop(0)) == prev_text:
@@ -305,6 +313,18 @@ class AskAiApp(App[None]):
                     f_console.flush()
                 self._re_render = True
 
+    async def _write_stream(self) -> None:
+        """Write the reply being streamed to the markdown file, replacing the partial text previously written."""
+        if (text := self._stream_text) and text != self._stream_shown:
+            with open(self.console_path, "a", encoding=Charset.UTF_8.val) as f_console:
+                if self._stream_offset is None:
+                    self._stream_offset = f_console.tell()
+                f_console.truncate(self._stream_offset)
+                f_console.write(text_formatter.beautify(f"{shared.nickname_md} {text}"))
+                f_console.flush()
+            self._stream_shown = text
+            self._re_render = True
+
     async def _cb_refresh_console(self) -> None:
         """Callback to handle markdown console updates.
         This method is responsible for refreshing or updating the console display in markdown format.
@@ -312,6 +332,7 @@ class AskAiApp(App[None]):
         if not self.console_path.exists():
             self.action_clear()
         await self._write_markdown()
+        await self._write_stream()
         if self._re_render:
             self._re_render = False
             await self.md_console.go(self.console_path)
@@ -322,7 +343,9 @@ class AskAiApp(App[None]):
         :param reply: The reply message to send as a reply to the user.
         """
         prev_msg: str = self._display_buffer[-1] if self._display_buffer else ""
-        if reply and prev_msg != reply.message:
+        if reply and self._streamed and reply.message == self._streamed:
+            self._streamed = None  # The reply was already displayed, as it was streamed.
+        elif reply and prev_msg != reply.message:
             log.debug(reply.message)
             self.display_text(f"{shared.nickname_md} {reply.message}")
             if configs.is_speak and reply.is_speakable:
@@ -357,6 +380,17 @@ class AskAiApp(App[None]):
                 if ev.args.reply.match(configs.verbosity, configs.is_debug):
                     self._reply(reply)
 
+    def _cb_stream_event(self, ev: Event) -> None:
+        """Callback to handle reply stream events. The partial reply is rendered by the console refresh; once the
+        stream completes, the whole reply is displayed as any other reply.
+        :param ev: The event object representing the stream event.
+        """
+        if ev.args.done:
+            self._stream_text, self._streamed = None, ev.args.text
+            self.display_text(f"{shared.nickname_md} {ev.args.text}")
+        else:
+            self._stream_text = (self._stream_text or "") + ev.args.text
+
     def _cb_mode_changed_event(self, ev: Event) -> None:
         """Callback to handle mode change events.
         :param ev: The event object representing the mode change.
@@ -400,6 +434,7 @@ class AskAiApp(App[None]):
         os.chdir(Path.home())
         askai_bus = AskAiEvents.bus(ASKAI_BUS_NAME)
         askai_bus.subscribe(REPLY_EVENT, self._cb_reply_event)
+        askai_bus.subscribe(STREAM_EVENT, self._cb_stream_event)
         nltk.download("averaged_perceptron_tagger", quiet=True, download_dir=CACHE_DIR)
         recorder.setup()
         scheduler.start()
@@ -6,7 +6,11 @@
 """Package initialization."""
 
 __all__ = [
+    'component', 
+    'engine', 
     'model', 
+    'processors', 
+    'router', 
     'support'
 ]
 __version__ = '1.2.15'
@@ -0,0 +1,21 @@
+# _*_ coding: utf-8 _*_
+#
+# hspylib-askai v1.2.15
+#
+# Package: test.core.component
+"""Package initialization."""
+
+__all__ = [
+    'test_audio_cache',
+    'test_cache_metrics',
+    'test_cache_service',
+    'test_cache_warmup',
+    'test_context_journal',
+    'test_http_client',
+    'test_long_term_memory',
+    'test_reply_store',
+    'test_semantic_cache',
+    'test_single_flight',
+    'test_stage_cache'
+]
+__version__ = '1.2.15'
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.component
+      @file: test_audio_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.audio_cache import AudioCache
+from pathlib import Path
+
+import os
+import sys
+import tempfile
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    # Setup tests
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.audio_cache = AudioCache(self.tmp_dir.name, 1)
+        self.audio_cache.max_bytes = 3000
+
+    # Teardown tests
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _generate(self, text: str, age: int) -> Path:
+        audio_path, exists = self.audio_cache.lookup(text, "onyx", "mp3")
+        self.assertFalse(exists)
+        Path(audio_path).write_bytes(b"0" * 1000)
+        os.utime(audio_path, (age, age))
+        self.audio_cache.commit(audio_path)
+        return Path(audio_path)
+
+    # TEST CASES ----------
+
+    def test_should_count_hits_and_misses(self):
+        self._generate("hello", 100)
+        _, exists = self.audio_cache.lookup("Hello ", "onyx", "mp3")
+        self.assertTrue(exists)
+        _, exists = self.audio_cache.lookup("hello", "nova", "mp3")
+        self.assertFalse(exists)
+        self.assertEqual(1, self.audio_cache.hits)
+        self.assertEqual(2, self.audio_cache.misses)
+
+    def test_should_evict_least_recently_used_files(self):
+        oldest = self._generate("one", 100)
+        older = self._generate("two", 200)
+        self._generate("three", 300)
+        self.audio_cache.lookup("one", "onyx", "mp3")  # Refreshes the access time of 'one'.
+        self._generate("four", 400)
+        self.assertTrue(oldest.exists())
+        self.assertFalse(older.exists())
+        self.assertEqual(1, self.audio_cache.evictions)
+        self.assertEqual(3000, self.audio_cache.size_bytes)
+
+    def test_should_never_evict_pinned_files(self):
+        pinned = self.audio_cache.pin("goodbye", "onyx", "mp3")
+        self._generate("goodbye", 100)
+        self._generate("two", 200)
+        self._generate("three", 300)
+        self._generate("four", 400)
+        self.assertTrue(pinned.exists())
+        self.assertIn(pinned.name, AudioCache(self.tmp_dir.name, 1).pinned)
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.component
+      @file: test_cache_metrics.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.cache_metrics import CacheMetrics, lru_metrics
+from functools import lru_cache
+
+import sys
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    # TEST CASES ----------
+
+    def test_should_count_lookups_and_latency(self):
+        metrics = CacheMetrics()
+        self.assertTrue(metrics.record(True, 0.002))
+        self.assertFalse(metrics.record(False, 0.004))
+        metrics.record(True, 0.006)
+        metrics.record_evictions(2)
+        stats = metrics.as_dict(bytes=1024)
+        self.assertEqual(2, stats["hits"])
+        self.assertEqual(1, stats["misses"])
+        self.assertEqual(0.6667, stats["hit_rate"])
+        self.assertEqual(2, stats["evictions"])
+        self.assertEqual(4.0, stats["avg_lookup_ms"])
+        self.assertEqual(6.0, stats["max_lookup_ms"])
+        self.assertEqual(1024, stats["bytes"])
+
+    def test_should_report_lru_cache_metrics(self):
+        @lru_cache(maxsize=8)
+        def square(x: int) -> int:
+            return x * x
+
+        list(map(square, [1, 2, 1, 1]))
+        stats = lru_metrics(square)
+        self.assertEqual(2, stats["hits"])
+        self.assertEqual(2, stats["misses"])
+        self.assertEqual(2, stats["entries"])
+        self.assertEqual(8, stats["max_entries"])
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.component
+      @file: test_cache_service.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.cache_service import cache, CacheService
+from askai.core.component.reply_store import ReplyStore
+from hspylib.modules.cache.ttl_keyring_be import TTLKeyringBE
+from keyring.backend import KeyringBackend
+from keyring.backends.chainer import ChainerBackend
+from pathlib import Path
+from time import time
+from unittest import mock
+
+import keyring
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+
+class MemoryKeyring(KeyringBackend):
+    """In-memory keyring, so the legacy TTLCache entries are not written into the user's keyring."""
+
+    priority = 1
+
+    def __init__(self):
+        super().__init__()
+        self.passwords: dict[tuple[str, str], str] = {}
+
+    def get_password(self, service: str, username: str):
+        return self.passwords.get((service, username))
+
+    def set_password(self, service: str, username: str, password: str) -> None:
+        self.passwords[(service, username)] = password
+
+    def delete_password(self, service: str, username: str) -> None:
+        self.passwords.pop((service, username), None)
+
+
+class TestClass(unittest.TestCase):
+
+    # Setup tests
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / "replies.db"
+        self.keyring = keyring.get_keyring()
+        self.backends = mock.patch.object(ChainerBackend, "backends", [MemoryKeyring()])
+        self.backends.start()
+        self.reply_store, cache._reply_store = cache._reply_store, ReplyStore(self.db_path)
+        self.cache_files: list[str] = []
+
+    # Teardown tests
+    def tearDown(self):
+        cache._reply_store.close()
+        cache._reply_store = self.reply_store
+        self.backends.stop()
+        keyring.set_keyring(self.keyring)
+        for cache_file in self.cache_files:
+            os.remove(cache_file)
+        self.tmp_dir.cleanup()
+
+    # TEST CASES ----------
+
+    def test_should_migrate_ttl_cache_keeping_keys_and_ttls(self):
+        replies: dict[str, tuple[str, int]] = {"list my downloads": ("reply-1", 5), "what is my ip": ("reply-2", 30)}
+        for key, (reply, ttl_minutes) in replies.items():
+            keyring.set_keyring(TTLKeyringBE(ttl_minutes))
+            self.cache_files.append(CacheService._TTL_CACHE.save(key, reply))
+        self.cache_files.append(CacheService._TTL_CACHE.save(CacheService.ASKAI_CACHE_KEYS, ",".join(replies)))
+
+        self.assertEqual(2, cache.migrate_ttl_cache())
+        self.assertEqual(sorted(replies), cache.keys)
+        with sqlite3.connect(self.db_path) as conn:
+            expires: dict[str, float] = dict(conn.execute("SELECT key, expires FROM replies").fetchall())
+        for key, (reply, ttl_minutes) in replies.items():
+            self.assertEqual(reply, cache._reply_store.get(key))
+            self.assertAlmostEqual(time() + ttl_minutes * 60, expires[key], delta=5)
+            self.assertIsNone(CacheService._TTL_CACHE.read(key))
+        self.assertEqual(0, cache.migrate_ttl_cache())
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.component
+      @file: test_cache_warmup.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.cache_service import cache
+from askai.core.component.cache_warmup import CacheWarmup, warmup
+from askai.core.component.scheduler import scheduler
+from askai.core.component.semantic_cache import semantic_cache
+from askai.core.support.chat_session import ChatSession
+from askai.core.support.shared_instances import shared
+from collections import Counter
+from contextvars import copy_context
+from pathlib import Path
+from threading import Event, Thread
+from unittest import mock
+
+import atexit
+import json
+import sys
+import tempfile
+import unittest
+
+
+class FakeEngine:
+    """Stand-in for the AI engine of the sessions: only the model limits are used by the session."""
+
+    def ai_token_limit(self) -> int:
+        return 1000
+
+    def ai_model_name(self) -> str:
+        return "gpt-4o-mini"
+
+
+class TestClass(unittest.TestCase):
+
+    # Setup tests
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.counts_file = Path(self.tmp_dir.name) / "askai-question-counts.json"
+        self.processor = mock.Mock()
+        self.patches = [
+            mock.patch("askai.core.component.cache_warmup.CACHE_DIR", Path(self.tmp_dir.name)),
+            mock.patch("askai.core.component.cache_warmup.ASKAI_QUESTION_COUNTS_FILE", self.counts_file),
+            mock.patch("askai.core.component.cache_warmup.pause"),
+            mock.patch.object(warmup, "_counts", None),
+            mock.patch.object(warmup, "_pending", 0),
+            mock.patch.object(warmup, "_cancelled", False),
+            mock.patch.object(warmup, "_warmed", []),
+            mock.patch.object(type(scheduler), "alive", new_callable=mock.PropertyMock, return_value=True),
+            mock.patch.object(semantic_cache, "save_reply"),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self.conversation = ChatSession("conversation", FakeEngine(), "DEFAULT", journaled=False)
+        self.conversation.context.push("HISTORY", "Hello, my name is Taius.")
+
+    # Teardown tests
+    def tearDown(self):
+        atexit.unregister(warmup.flush)
+        for patch in reversed(self.patches):
+            patch.stop()
+        self.tmp_dir.cleanup()
+
+    # TEST CASES ----------
+
+    def test_should_skip_volatile_questions(self):
+        volatile = [
+            "What is the date today?",
+            "Where am I?",
+            "What's the weather like?",
+            "List the files in the downloads folder.",
+            "Summarize ~/notes.txt",
+            "Show the contents of /etc/hosts",
+        ]
+        for question in volatile:
+            with self.subTest(question=question):
+                self.assertTrue(CacheWarmup.is_volatile(question))
+        for question in ["What is the capital of France?", "Explain python decorators.", "Who wrote Dom Casmurro?"]:
+            with self.subTest(question=question):
+                self.assertFalse(CacheWarmup.is_volatile(question))
+
+    def test_should_select_the_warmup_candidates(self):
+        counts = Counter(
+            {"what is python?": 5, "/cache stats": 4, "who wrote dom casmurro?": 3, "what is the date today?": 2}
+        )
+        history = ["Explain decorators.", "What is Python?", "Who painted the Mona Lisa?"]
+        with (
+            mock.patch.object(warmup, "_counts", counts),
+            mock.patch.object(cache, "read_input_history", return_value=history),
+            mock.patch.object(cache, "has_reply", side_effect=lambda q, _: q == "who wrote dom casmurro?") as has_reply,
+        ):
+            self.assertEqual(
+                ["what is python?", "who painted the mona lisa?", "explain decorators."],
+                warmup.candidates(10, "scope"),
+            )
+            self.assertEqual(["what is python?", "who painted the mona lisa?"], warmup.candidates(2, "scope"))
+        has_reply.assert_any_call("who wrote dom casmurro?", "scope")
+
+    def test_should_save_the_question_counts_in_batches(self):
+        with mock.patch.object(CacheWarmup, "FLUSH_EVERY", 3):
+            for question in ["What is Python?", "/help", " what is python? "]:
+                warmup.record(question)
+                self.assertFalse(self.counts_file.exists())
+            warmup.record("Who wrote Dom Casmurro?")
+        self.assertEqual({"what is python?": 2, "who wrote dom casmurro?": 1}, json.loads(self.counts_file.read_text()))
+
+    def test_should_keep_only_the_most_frequent_counts(self):
+        with mock.patch.object(CacheWarmup, "MAX_COUNTS", 2):
+            for question in ["a", "b", "b", "c", "c", "c"]:
+                warmup.record(question)
+            warmup.flush()
+        self.assertEqual({"c": 3, "b": 2}, json.loads(self.counts_file.read_text()))
+        self.assertEqual(Counter({"c": 3, "b": 2}), warmup.counts)
+
+    def test_should_warm_up_apart_from_the_conversation(self):
+        def _process(question: str) -> str:
+            shared.context.push("HISTORY", f"Task for: {question}", "assistant")
+            return f"Answer to: {question}"
+
+        self.processor.process.side_effect = _process
+        with (
+            mock.patch.object(warmup, "candidates", return_value=["what is python?"]) as candidates,
+            self.conversation.activate(),
+        ):
+            scope: str = shared.context.digest("HISTORY", 2)
+            self.assertEqual(1, warmup.warm_up(self.processor, lambda: shared.context.digest("HISTORY", 2)))
+            self.assertEqual(scope, shared.context.digest("HISTORY", 2))
+        candidates.assert_called_once_with(mock.ANY, scope)
+        semantic_cache.save_reply.assert_called_once_with("what is python?", "Answer to: what is python?", scope)
+        self.assertEqual(1, len(self.conversation.context["HISTORY"]))
+
+    def test_should_stop_warming_up_when_cancelled(self):
+        started, release = Event(), Event()
+
+        def _process(question: str) -> str:
+            started.set()
+            release.wait(5)
+            return f"Answer to: {question}"
+
+        self.processor.process.side_effect = _process
+        count: list[int] = []
+        with (
+            mock.patch.object(warmup, "candidates", return_value=["q1", "q2", "q3"]),
+            self.conversation.activate(),
+        ):
+            # Threads do not inherit context variables, so the warm-up runs within the conversation context.
+            warm_up = Thread(
+                target=copy_context().run, args=(lambda: count.append(warmup.warm_up(self.processor, lambda: None)),)
+            )
+            warm_up.start()
+            self.assertTrue(started.wait(5))
+            cancel = Thread(target=warmup.cancel)
+            cancel.start()
+            cancel.join(0.2)
+            self.assertTrue(cancel.is_alive(), "cancel must wait for the reply being computed")
+            release.set()
+            cancel.join(5)
+            warm_up.join(5)
+        self.assertEqual([1], count)
+        self.processor.process.assert_called_once_with("q1")
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.component
+      @file: test_context_journal.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.cache_service import CacheService
+from askai.core.component.context_journal import ContextJournal, JOURNAL_VERSION
+from askai.core.support.chat_context import ChatContext
+from pathlib import Path
+from textwrap import dedent
+from unittest import mock
+
+import json
+import sys
+import tempfile
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    # Setup tests
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.journal_dir = mock.patch("askai.core.component.context_journal.JOURNAL_DIR", Path(self.tmp_dir.name))
+        self.journal_dir.start()
+        self.journal = ContextJournal("test", compact_every=6)
+        self.journal.open("test-session")
+
+    # Teardown tests
+    def tearDown(self):
+        self.journal_dir.stop()
+        self.tmp_dir.cleanup()
+
+    # TEST CASES ----------
+
+    def test_should_replay_snapshot_and_journal_tail(self):
+        ctx = ChatContext(token_limit=1000, max_context_size=3)
+        ctx.push("HISTORY", "hello")
+        ctx.journal_to(self.journal)
+        for content in ["one", "two", "three"]:
+            ctx.push("HISTORY", content, "assistant")
+        ctx.remove("HISTORY", 0)
+        ctx.push("EVALUATION", "be concise", "system")
+        ctx.save()
+        self.assertFalse(self.journal.needs_compaction)
+        lines: list[str] = self.journal.journal_file().read_text().splitlines()
+        self.assertEqual(6, len(lines))
+        self.assertEqual(JOURNAL_VERSION, json.loads(lines[0])["version"])
+        restored = ChatContext(token_limit=1000, max_context_size=3)
+        self.assertEqual(6, restored.replay(self.journal.replay("test-session")))
+        self.assertEqual(ctx.join("HISTORY", "EVALUATION"), restored.join("HISTORY", "EVALUATION"))
+        self.assertEqual(ctx.tokens("HISTORY"), restored.tokens("HISTORY"))
+
+    def test_should_compact_journal_into_snapshot(self):
+        ctx = ChatContext(token_limit=1000, max_context_size=3)
+        ctx.journal_to(self.journal)
+        for i in range(6):
+            ctx.push("HISTORY", f"message {i}")
+        ctx.save()
+        self.assertFalse(self.journal.journal_file().exists())
+        self.assertEqual(4, len(self.journal.snapshot_file().read_text().splitlines()))
+        restored = ChatContext(token_limit=1000, max_context_size=3)
+        restored.replay(self.journal.replay("test-session"))
+        self.assertEqual(ctx.join("HISTORY"), restored.join("HISTORY"))
+
+    def test_should_skip_torn_records(self):
+        self.journal.append({"key": "HISTORY", "op": "push", "role": "human", "content": "hello"})
+        self.journal.flush()
+        with open(self.journal.journal_file(), "a") as f_journal:
+            f_journal.write('{"key": "HISTORY", "op": "pu')
+        self.assertEqual(1, len(list(self.journal.replay("test-session"))))
+
+    def test_should_skip_files_from_newer_versions(self):
+        self.journal.append({"key": "HISTORY", "op": "push", "role": "human", "content": "hello"})
+        self.journal.flush()
+        text: str = self.journal.journal_file().read_text()
+        self.journal.journal_file().write_text(text.replace(f'"version": {JOURNAL_VERSION}', '"version": 99'))
+        self.assertEqual([], list(self.journal.replay("test-session")))
+
+    def test_should_import_legacy_history_without_splitting_quoted_roles(self):
+        history_file = Path(self.tmp_dir.name, "askai-context-history.txt")
+        history_file.write_text(
+            dedent(
+                """\
+                human: How do I print the prompt roles?
+                assistant: Use the format "system: <text>" and human: for the user.
+                It works with multiple lines too.
+                Human: thanks
+                """
+            )
+        )
+        self.assertEqual(
+            [
+                ("human", "How do I print the prompt roles?"),
+                (
+                    "assistant",
+                    'Use the format "system: <text>" and human: for the user.\nIt works with multiple lines too.',
+                ),
+                ("human", "thanks"),
+            ],
+            list(CacheService._read_history(history_file)),
+        )
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.component
+      @file: test_http_client.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.http_client import http_client
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+import asyncio
+import sys
+import unittest
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestClass(unittest.TestCase):
+
+    # Setup tests
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+
+    # Teardown tests
+    def tearDown(self):
+        http_client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    # TEST CASES ----------
+
+    def test_should_reuse_pooled_connections(self):
+        before: dict = http_client.stats
+        for _ in range(5):
+            self.assertEqual("ok", http_client.client.get(f"http://127.0.0.1:{self.server.server_port}/").text)
+        after: dict = http_client.stats
+        self.assertEqual(5, after["requests"] - before["requests"])
+        self.assertEqual(1, after["misses"] - before["misses"])
+        self.assertEqual(4, after["hits"] - before["hits"])
+
+    def test_should_reuse_pooled_connections_of_the_event_loop(self):
+        async def _get_all() -> list[str]:
+            self.assertIs(http_client.async_client, http_client.async_client)
+            try:
+                url: str = f"http://127.0.0.1:{self.server.server_port}/"
+                return [(await http_client.async_client.get(url)).text for _ in range(5)]
+            finally:
+                await http_client.aclose()
+
+        self.assertIsNone(http_client.async_client)
+        before: dict = http_client.stats
+        self.assertEqual(["ok"] * 5, asyncio.run(_get_all()))
+        after: dict = http_client.stats
+        self.assertEqual(1, after["misses"] - before["misses"])
+        self.assertEqual(4, after["hits"] - before["hits"])
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.component
+      @file: test_long_term_memory.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.askai_configs import configs
+from askai.core.component.long_term_memory import long_term_memory, LongTermMemory
+from askai.core.support.chat_context import ChatContext
+from askai.core.support.tokenizer import count_tokens
+from collections import deque
+from unittest import mock
+
+import sys
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    # TEST CASES ----------
+
+    def test_should_fit_memories_in_relevance_order(self):
+        memories: list[str] = ["human: short\nassistant: one", "long " * 200, "human: tiny\nassistant: two"]
+        budget: int = count_tokens(memories[0], "gpt-4o-mini") + count_tokens(memories[2], "gpt-4o-mini")
+        self.assertEqual([memories[0], memories[2]], LongTermMemory.fit(memories, budget, "gpt-4o-mini"))
+        self.assertEqual([], LongTermMemory.fit(memories, 0, "gpt-4o-mini"))
+        self.assertEqual([], LongTermMemory.fit([], budget, "gpt-4o-mini"))
+
+    def test_should_send_only_the_recent_window_when_enabled(self):
+        ctx = ChatContext(token_limit=10000, max_context_size=50)
+        for i in range(20):
+            ctx.push("HISTORY", f"question {i}")
+            ctx.push("HISTORY", f"answer {i}", "assistant")
+        ctx.push("HISTORY", "pending question")
+        with mock.patch.object(LongTermMemory, "is_enabled", False):
+            self.assertEqual(41, len(long_term_memory.window(ctx, "HISTORY").messages))
+        with mock.patch.object(LongTermMemory, "is_enabled", True):
+            window = long_term_memory.window(ctx, "HISTORY").messages
+        turns: int = configs.long_term_memory_window
+        self.assertEqual(2 * turns + 1, len(window))
+        self.assertEqual(f"question {20 - turns}", window[0].content)
+        self.assertEqual("pending question", window[-1].content)
+
+    def test_should_window_whole_turns_with_agent_entries(self):
+        ctx = ChatContext(token_limit=10000, max_context_size=100)
+        for i in range(10):
+            ctx.push("HISTORY", f"question {i}")
+            ctx.push("HISTORY", f"task {i}", "assistant")
+            ctx.push("HISTORY", f"task output {i}", "assistant")
+            ctx.push("HISTORY", f"answer {i}", "assistant")
+        ctx.push("HISTORY", "pending question")
+        with mock.patch.object(LongTermMemory, "is_enabled", True):
+            window = long_term_memory.window(ctx, "HISTORY").messages
+        turns: int = configs.long_term_memory_window
+        self.assertEqual(4 * turns + 1, len(window))
+        self.assertEqual(f"question {10 - turns}", window[0].content)
+        self.assertEqual(turns + 1, sum(1 for m in window if m.type == "human"))
+        self.assertIn("answer 9", [m.content for m in window])
+
+    def test_should_recall_only_the_turns_out_of_the_window(self):
+        turns: int = configs.long_term_memory_window
+        collection = mock.Mock(**{"count.return_value": 1, "query.return_value": {"documents": [[]]}})
+        with (
+            mock.patch.object(LongTermMemory, "is_enabled", True),
+            mock.patch.object(LongTermMemory, "collection", collection),
+            mock.patch.object(long_term_memory, "_window", deque(maxlen=turns)),
+            mock.patch.object(long_term_memory, "_executor"),
+            mock.patch("askai.core.component.long_term_memory.lc_llm"),
+            mock.patch("askai.core.component.long_term_memory.time", side_effect=range(1, turns + 3)),
+        ):
+            for i in range(turns + 2):
+                long_term_memory.remember(f"question {i}", f"answer {i}")
+            self.assertIsNone(long_term_memory.recall("question", 1000, "gpt-4o-mini"))
+        # The turns 2..N+1 are in the window, so only the turns remembered before the third one are recalled.
+        where: dict = collection.query.call_args.kwargs["where"]
+        self.assertEqual({"$and": [{"owner": ""}, {"timestamp": {"$lt": 3}}]}, where)
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
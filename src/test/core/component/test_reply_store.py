@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.component
+      @file: test_reply_store.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.cache_codec import HEADER
+from askai.core.component.reply_store import ReplyStore
+from pathlib import Path
+
+import sys
+import tempfile
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    # Setup tests
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = ReplyStore(Path(self.tmp_dir.name) / "replies.db")
+
+    # Teardown tests
+    def tearDown(self):
+        self.store.close()
+        self.tmp_dir.cleanup()
+
+    # TEST CASES ----------
+
+    def test_should_put_get_and_delete_replies(self):
+        self.store.put("list my downloads", "reply-1", 10)
+        self.store.put("hello, world", "reply-2", 10)
+        self.assertEqual("reply-1", self.store.get("list my downloads"))
+        self.assertEqual("reply-2", self.store.get("hello, world"))
+        self.assertEqual(2, len(self.store))
+        self.assertTrue(self.store.delete("hello, world"))
+        self.assertFalse(self.store.delete("hello, world"))
+        self.assertIsNone(self.store.get("hello, world"))
+
+    def test_should_not_return_expired_replies(self):
+        self.store.put("expired", "reply", 0)
+        self.assertIsNone(self.store.get("expired"))
+        self.assertNotIn("expired", self.store.keys())
+        self.assertEqual(1, self.store.purge())
+
+    def test_should_list_keys_by_prefix(self):
+        for key in ["list my downloads", "list my documents", "hello", "list"]:
+            self.store.put(key, f"reply for {key}", 10)
+        self.assertEqual(["list my documents", "list my downloads"], self.store.keys("list my"))
+        self.assertEqual(["hello", "list", "list my documents", "list my downloads"], self.store.keys())
+
+    def test_should_clear_all_replies(self):
+        for key in ["b", "a", "c"]:
+            self.store.put(key, key, 10)
+        self.assertEqual(["a", "b", "c"], self.store.clear())
+        self.assertEqual(0, self.store.count())
+
+    def test_should_compress_large_replies_and_read_legacy_ones(self):
+        store = ReplyStore(Path(self.tmp_dir.name) / "compressed.db", compress_threshold=64)
+        large, small = "ls -la output\n" * 100, "a short reply"
+        store.put("large", large, 10)
+        store.put("small", small, 10)
+        raw = dict(store._conn.execute("SELECT key, reply FROM replies").fetchall())
+        self.assertTrue(raw["large"].startswith(HEADER))
+        self.assertLess(len(raw["large"]), len(large))
+        self.assertEqual(small, raw["small"])
+        self.assertEqual(large, store.get("large"))
+        self.assertEqual(small, store.get("small"))
+        store.close()
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.component
+      @file: test_semantic_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.askai_configs import AskAiConfigs
+from askai.core.component.cache_metrics import CacheMetrics
+from askai.core.component.cache_service import cache
+from askai.core.component.reply_store import ReplyStore
+from askai.core.component.semantic_cache import semantic_cache, SemanticCache
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+
+import math
+import sys
+import tempfile
+import unittest
+
+
+class FakeCollection:
+    """In-memory stand-in for the vector index: exact cosine distances and equality 'where' filters."""
+
+    def __init__(self):
+        self.entries: dict[str, tuple[list[float], str, dict]] = {}
+
+    def count(self) -> int:
+        return len(self.entries)
+
+    def upsert(self, ids: list[str], embeddings: list[list[float]], documents: list[str], metadatas: list[dict]):
+        for entry in zip(ids, embeddings, documents, metadatas):
+            self.entries[entry[0]] = entry[1:]
+
+    def delete(self, ids: list[str]) -> None:
+        for doc_id in ids:
+            self.entries.pop(doc_id, None)
+
+    def query(self, query_embeddings: list[list[float]], n_results: int, where: Optional[dict] = None) -> dict:
+        matches = sorted(
+            (self._distance(query_embeddings[0], vector), doc_id, meta)
+            for doc_id, (vector, _, meta) in self.entries.items()
+            if all(meta.get(k) == v for k, v in (where or {}).items())
+        )[:n_results]
+        return {
+            "ids": [[doc_id for _, doc_id, _ in matches]],
+            "metadatas": [[meta for _, _, meta in matches]],
+            "distances": [[distance for distance, _, _ in matches]],
+        }
+
+    @staticmethod
+    def _distance(v1: list[float], v2: list[float]) -> float:
+        dot: float = sum(a * b for a, b in zip(v1, v2))
+        return 1.0 - dot / (math.sqrt(sum(a * a for a in v1)) * math.sqrt(sum(b * b for b in v2)))
+
+
+class TestClass(unittest.TestCase):
+
+    # Embeddings of the test questions: paraphrases are close, other questions are far.
+    EMBEDDINGS: dict[str, list[float]] = {
+        "what is the capital of france?": [1.0, 0.0, 0.0],
+        "which city is the capital of france?": [0.98, 0.2, 0.0],
+        "what is france famous for?": [0.7, 0.7, 0.1],
+        "who wrote dom casmurro?": [0.0, 0.0, 1.0],
+    }
+
+    # Setup tests
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = ReplyStore(Path(self.tmp_dir.name) / "replies.db")
+        self.collection = FakeCollection()
+        self.patches = [
+            mock.patch.object(cache, "_reply_store", self.store),
+            mock.patch.object(semantic_cache, "_collection", self.collection),
+            mock.patch.object(semantic_cache, "_metrics", CacheMetrics()),
+            mock.patch.object(SemanticCache, "_embed", side_effect=self.EMBEDDINGS.get),
+            mock.patch.object(AskAiConfigs, "is_cache", new_callable=mock.PropertyMock, return_value=True),
+            mock.patch.object(AskAiConfigs, "is_semantic_cache", new_callable=mock.PropertyMock, return_value=True),
+            mock.patch.object(
+                AskAiConfigs, "semantic_cache_threshold", new_callable=mock.PropertyMock, return_value=0.95
+            ),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    # Teardown tests
+    def tearDown(self):
+        for patch in reversed(self.patches):
+            patch.stop()
+        self.store.close()
+        self.tmp_dir.cleanup()
+
+    # TEST CASES ----------
+
+    def test_should_read_similar_questions_above_the_threshold(self):
+        semantic_cache.save_reply("What is the capital of France?", "Paris.")
+        self.assertEqual(1, self.collection.count())
+        self.assertEqual("Paris.", semantic_cache.read_reply("Which city is the capital of France?"))
+        self.assertIsNone(semantic_cache.read_reply("What is France famous for?"))
+        self.assertIsNone(semantic_cache.read_reply("Who wrote Dom Casmurro?"))
+
+    def test_should_match_similar_questions_only_within_the_scope(self):
+        semantic_cache.save_reply("What is the capital of France?", "Paris.", "DEFAULT:abc")
+        semantic_cache.save_reply("What is the capital of France?", "It's Paris!", "CHAT:def")
+        self.assertEqual(2, self.collection.count())
+        self.assertEqual("Paris.", semantic_cache.read_reply("Which city is the capital of France?", "DEFAULT:abc"))
+        self.assertEqual("It's Paris!", semantic_cache.read_reply("Which city is the capital of France?", "CHAT:def"))
+        self.assertIsNone(semantic_cache.read_reply("Which city is the capital of France?", "DEFAULT:xyz"))
+        self.assertIsNone(semantic_cache.read_reply("Which city is the capital of France?"))
+
+    def test_should_remove_stale_index_entries(self):
+        key: str = semantic_cache.save_reply("What is the capital of France?", "Paris.")
+        self.assertTrue(self.store.delete(key))
+        self.assertIsNone(semantic_cache.read_reply("Which city is the capital of France?"))
+        self.assertEqual(0, self.collection.count())
+        self.assertEqual(1, semantic_cache.stats["evictions"])
+        self.assertEqual(1, semantic_cache.stats["misses"])
+
+    def test_should_delete_replies_from_the_index(self):
+        semantic_cache.save_reply("What is the capital of France?", "Paris.", "DEFAULT:abc")
+        deleted: str = semantic_cache.del_reply("What is the capital of France?", "DEFAULT:abc")
+        self.assertEqual("What is the capital of France?", deleted)
+        self.assertEqual(0, self.collection.count())
+        self.assertIsNone(semantic_cache.read_reply("Which city is the capital of France?", "DEFAULT:abc"))
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.component
+      @file: test_single_flight.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.single_flight import single_flight
+from askai.core.engine.openai.openai_chat_model import OpenAIChatModel
+from concurrent.futures import ThreadPoolExecutor
+from langchain_core.messages import AIMessage
+from threading import Event
+from time import sleep
+
+import sys
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    # TEST CASES ----------
+
+    def test_should_coalesce_identical_concurrent_calls(self):
+        release, round_trips = Event(), []
+        key: str = single_flight.fingerprint("gpt-4o-mini", 0.0, [{"role": "user", "content": "hello"}])
+        coalesced: int = single_flight.coalesced
+
+        def _request() -> str:
+            round_trips.append(1)
+            release.wait(5)
+            return "reply"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(single_flight.do, key, _request) for _ in range(4)]
+            while single_flight.coalesced - coalesced < 3:
+                sleep(0.01)
+            release.set()
+        self.assertEqual(["reply"] * 4, [f.result() for f in futures])
+        self.assertEqual(1, len(round_trips))
+        self.assertGreater(single_flight.ratio, 0.0)
+
+    def test_should_share_errors_and_not_keep_results(self):
+        def _fail() -> str:
+            raise ValueError("boom")
+
+        key: str = single_flight.fingerprint("gpt-4o-mini", 0.5, "fail")
+        self.assertRaises(ValueError, single_flight.do, key, _fail)
+        self.assertEqual("ok", single_flight.do(key, lambda: "ok"))
+
+    def test_should_fingerprint_by_model_temperature_and_messages(self):
+        messages = [{"role": "user", "content": "hello"}]
+        key: str = single_flight.fingerprint("m", 0.0, messages)
+        self.assertEqual(key, single_flight.fingerprint("m", 0.0, messages))
+        self.assertNotEqual(key, single_flight.fingerprint("m", 0.7, messages))
+
+    def test_should_fingerprint_chat_messages_by_tool_calls(self):
+        model = OpenAIChatModel(api_key="sk-test", model="gpt-4o-mini", temperature=0.0)
+        call = AIMessage(content="", tool_calls=[{"name": "terminal", "args": {"cmd": "ls"}, "id": "call-1"}])
+        other = AIMessage(content="", tool_calls=[{"name": "terminal", "args": {"cmd": "pwd"}, "id": "call-1"}])
+        self.assertEqual(model.fingerprint([call]), model.fingerprint([call.model_copy(update={"id": "run-1"})]))
+        self.assertNotEqual(model.fingerprint([call]), model.fingerprint([other]))
+
+    def test_should_give_each_coalesced_caller_its_own_copy(self):
+        release = Event()
+        key: str = single_flight.fingerprint("gpt-4o-mini", 0.0, "copy")
+        coalesced: int = single_flight.coalesced
+
+        def _request() -> dict:
+            release.wait(5)
+            return {"content": "reply"}
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(single_flight.do, key, _request) for _ in range(3)]
+            while single_flight.coalesced - coalesced < 2:
+                sleep(0.01)
+            release.set()
+            results: list[dict] = [f.result() for f in futures]
+        self.assertTrue(all(r == {"content": "reply"} for r in results))
+        self.assertEqual(3, len({id(r) for r in results}))
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
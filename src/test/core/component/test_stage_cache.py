@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.component
+      @file: test_stage_cache.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.reply_store import ReplyStore
+from askai.core.component.stage_cache import stage_cache, StageCache
+from pathlib import Path
+from unittest import mock
+
+import asyncio
+import sys
+import tempfile
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    # Setup tests
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = ReplyStore(Path(self.tmp_dir.name) / "stages.db")
+        self.patches = [
+            mock.patch.object(stage_cache, "_stage_store", self.store),
+            mock.patch.object(stage_cache, "_versions", {}),
+            mock.patch.object(StageCache, "is_enabled", new_callable=mock.PropertyMock, return_value=True),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    # Teardown tests
+    def tearDown(self):
+        for patch in reversed(self.patches):
+            patch.stop()
+        self.store.close()
+        self.tmp_dir.cleanup()
+
+    # TEST CASES ----------
+
+    def test_should_memoize_stage_artifacts(self):
+        fn = mock.Mock(return_value="plan")
+        self.assertEqual("plan", stage_cache.memoize("split", "v1", ["question"], fn))
+        self.assertEqual("plan", stage_cache.memoize("split", "v1", ["question"], fn))
+        fn.assert_called_once()
+        self.assertEqual("plan", stage_cache.memoize("split", "v2", ["question"], mock.Mock(return_value="plan")))
+        self.assertEqual(1, len(self.store.keys("split:")))
+
+    def test_should_await_stage_artifacts_once(self):
+        fn = mock.AsyncMock(return_value="evaluation")
+
+        async def _amemoize() -> list[str]:
+            return [await stage_cache.amemoize("evaluation", "v1", ["question", "answer"], fn) for _ in range(2)]
+
+        self.assertEqual(["evaluation", "evaluation"], asyncio.run(_amemoize()))
+        fn.assert_awaited_once()
+        fn = mock.Mock(return_value="other")
+        self.assertEqual("evaluation", stage_cache.memoize("evaluation", "v1", ["question", "answer"], fn))
+        fn.assert_not_called()
+
+    def test_should_not_cache_missing_artifacts(self):
+        fn = mock.AsyncMock(return_value=None)
+        for _ in range(2):
+            self.assertIsNone(asyncio.run(stage_cache.amemoize("split", "v1", ["question"], fn)))
+        self.assertEqual(2, fn.await_count)
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,12 @@
+# _*_ coding: utf-8 _*_
+#
+# hspylib-askai v1.2.15
+#
+# Package: test.core.engine
+"""Package initialization."""
+
+__all__ = [
+    'test_cassette', 
+    'test_openai_engine'
+]
+__version__ = '1.2.15'
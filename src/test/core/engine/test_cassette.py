@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.engine
+      @file: test_cassette.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.engine.replay.cassette import Cassette
+from askai.core.engine.replay.latency import Latency
+from askai.core.engine.replay.replay_models import ReplayChatModel
+from askai.exception.exceptions import CassetteMissError
+from langchain_core.language_models import FakeListChatModel
+from pathlib import Path
+
+import sys
+import tempfile
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    # Setup tests
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name, "test.cassette.jsonl")
+
+    # Teardown tests
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    # TEST CASES ----------
+
+    def test_should_replay_recorded_chat_generations(self):
+        recorder = ReplayChatModel(
+            cassette=Cassette("test", self.path),
+            latency=Latency(),
+            model_name="gpt-4o-mini",
+            delegate=FakeListChatModel(responses=["Paris", "Rome"]),
+        )
+        self.assertEqual("Paris", recorder.invoke("Capital of France?").content)
+        self.assertEqual("Rome", recorder.invoke("Capital of Italy?").content)
+
+        player = ReplayChatModel(cassette=Cassette("test", self.path), latency=Latency(), model_name="gpt-4o-mini")
+        self.assertEqual(2, len(player.cassette))
+        self.assertEqual("Rome", player.invoke("Capital of Italy?").content)
+        self.assertEqual("Paris", player.invoke("Capital of France?").content)
+
+    def test_should_fail_unmatched_requests_by_default(self):
+        cassette = Cassette("test", self.path)
+        cassette.record("ask", "key-0", "answer-0", 0.1)
+        cassette = Cassette("test", self.path)
+        self.assertRaises(CassetteMissError, cassette.serve, "ask", "unknown-a", Latency())
+        self.assertEqual("answer-0", cassette.serve("ask", "key-0", Latency()))
+        self.assertIsNone(cassette.play("chat", "key-0"))
+        stats = cassette.stats
+        self.assertEqual((1, 2, 0), (stats["hits"], stats["misses"], stats["fallbacks"]))
+
+    def test_should_serve_unmatched_requests_in_recorded_order(self):
+        cassette = Cassette("test", self.path)
+        for n in range(3):
+            cassette.record("ask", f"key-{n}", f"answer-{n}", 0.1)
+        cassette = Cassette("test", self.path, fallback=True)
+        self.assertEqual("answer-1", cassette.serve("ask", "key-1", Latency()))
+        self.assertEqual("answer-0", cassette.serve("ask", "unknown-a", Latency()))
+        self.assertEqual("answer-2", cassette.serve("ask", "unknown-b", Latency()))
+        self.assertRaises(CassetteMissError, cassette.serve, "ask", "unknown-c", Latency())
+        self.assertIsNone(cassette.play("chat", "key-0"))
+        stats = cassette.stats
+        self.assertEqual((1, 4, 2, 3), (stats["hits"], stats["misses"], stats["fallbacks"], stats["played"]))
+
+    def test_should_sample_deterministic_latencies(self):
+        self.assertEqual(0.25, Latency("recorded").delay(0.25))
+        self.assertEqual(0.1, Latency("fixed:100").delay(0.25))
+        samples: list[float] = [Latency("normal:800:200").delay() for _ in range(3)]
+        self.assertEqual(1, len(set(samples)))
+        self.assertTrue(all(0.05 <= Latency("uniform:50:150").delay() <= 0.15 for _ in range(10)))
+        self.assertRaises(ValueError, Latency, "gamma:1")
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
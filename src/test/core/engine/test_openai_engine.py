@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.engine
+      @file: test_openai_engine.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.engine.openai.openai_engine import OpenAIEngine
+from askai.core.model.ai_reply import AIReply
+from openai import APIError
+from types import SimpleNamespace
+from unittest import mock
+
+import asyncio
+import httpx
+import sys
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    # Setup tests
+    def setUp(self):
+        self.engine = OpenAIEngine()
+        self.create = mock.AsyncMock()
+        async_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=self.create)))
+        self.async_client = mock.patch.object(
+            OpenAIEngine, "async_client", new_callable=mock.PropertyMock, return_value=async_client
+        )
+        self.async_client.start()
+
+    # Teardown tests
+    def tearDown(self):
+        self.async_client.stop()
+
+    # TEST CASES ----------
+
+    def test_should_ask_async(self):
+        message = SimpleNamespace(content="Hello, I am the AI.")
+        self.create.return_value = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+        reply: AIReply = asyncio.run(self.engine.ask_async([{"role": "user", "content": "Hello"}]))
+        self.assertEqual(AIReply.info("Hello, I am the AI."), reply)
+        self.assertTrue(reply.is_success)
+        self.assertEqual([{"role": "user", "content": "Hello"}], self.create.await_args.kwargs["messages"])
+
+    def test_should_reply_errors_when_asking_async(self):
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        self.create.side_effect = APIError("Failed", request, body={"message": "Rate limit reached"})
+        reply: AIReply = asyncio.run(self.engine.ask_async([{"role": "user", "content": "Hello"}]))
+        self.assertFalse(reply.is_success)
+        self.assertEqual("%RED%APIError => Rate limit reached%NC%", reply.message)
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
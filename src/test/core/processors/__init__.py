@@ -0,0 +1,11 @@
+# _*_ coding: utf-8 _*_
+#
+# hspylib-askai v1.2.15
+#
+# Package: test.core.processors
+"""Package initialization."""
+
+__all__ = [
+    'test_splitter_actions'
+]
+__version__ = '1.2.15'
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.processors
+      @file: test_splitter_actions.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.stage_cache import StageCache
+from askai.core.model.action_plan import ActionPlan
+from askai.core.model.model_result import ModelResult
+from askai.core.processors.splitter.splitter_actions import actions, SplitterActions
+from askai.core.router.task_agent import agent
+from langchain_core.messages import AIMessage
+from types import SimpleNamespace
+from unittest import mock
+
+import asyncio
+import sys
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    PLAN: str = '{"questions": ["List my downloads"], "tasks": [{"id": "1", "task": "List the downloads folder"}]}'
+
+    # Setup tests
+    def setUp(self):
+        self.runnable = mock.Mock(
+            invoke=mock.Mock(return_value=AIMessage(content=self.PLAN)),
+            ainvoke=mock.AsyncMock(return_value=AIMessage(content=self.PLAN)),
+        )
+        self.plan = mock.Mock(spec=ActionPlan)
+        self.patches = [
+            mock.patch.object(SplitterActions, "_split_inputs", return_value=(None, ["List my downloads"])),
+            mock.patch.object(SplitterActions, "_splitter_runnable", return_value=self.runnable),
+            mock.patch.object(StageCache, "is_enabled", new_callable=mock.PropertyMock, return_value=False),
+            mock.patch.object(ActionPlan, "create", return_value=self.plan),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    # Teardown tests
+    def tearDown(self):
+        for patch in reversed(self.patches):
+            patch.stop()
+
+    # TEST CASES ----------
+
+    def test_should_split_questions_without_blocking(self):
+        model: ModelResult = ModelResult.default()
+        self.assertIs(self.plan, asyncio.run(actions.asplit("List my downloads", model)))
+        self.runnable.ainvoke.assert_awaited_once_with(
+            {"input": "List my downloads"}, config=SplitterActions.HISTORY_CONFIG
+        )
+        ActionPlan.create.assert_called_once_with("List my downloads", self.PLAN, model)
+        self.runnable.invoke.assert_not_called()
+
+    def test_should_split_questions_as_the_sync_version(self):
+        self.assertIs(actions.split("List my downloads"), asyncio.run(actions.asplit("List my downloads")))
+        self.assertEqual(ActionPlan.create.call_args_list[0], ActionPlan.create.call_args_list[1])
+
+    def test_should_not_create_a_plan_without_response(self):
+        self.runnable.ainvoke.return_value = None
+        self.assertIsNone(asyncio.run(actions.asplit("List my downloads")))
+        ActionPlan.create.assert_not_called()
+
+    def test_should_process_actions_without_blocking(self):
+        action = SimpleNamespace(task="List the downloads folder", path="~/Downloads")
+        with mock.patch.object(agent, "ainvoke", new_callable=mock.AsyncMock, return_value="3 files") as ainvoke:
+            self.assertEqual("3 files", asyncio.run(actions.aprocess_action(action)))
+        ainvoke.assert_awaited_once_with("List the downloads folder  Path: ~/Downloads")
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
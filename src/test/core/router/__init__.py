@@ -0,0 +1,12 @@
+# _*_ coding: utf-8 _*_
+#
+# hspylib-askai v1.2.15
+#
+# Package: test.core.router
+"""Package initialization."""
+
+__all__ = [
+    'test_evaluation', 
+    'test_task_agent'
+]
+__version__ = '1.2.15'
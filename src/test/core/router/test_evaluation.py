@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.router
+      @file: test_evaluation.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.stage_cache import StageCache
+from askai.core.model.acc_response import AccResponse
+from askai.core.router.evaluation import aeval_response, eval_response
+from askai.core.support.langchain_support import lc_llm
+from askai.core.support.shared_instances import SharedInstances
+from askai.exception.exceptions import InaccurateResponse
+from fixtures.acc_response_stubs import stub_response
+from langchain_core.messages import AIMessage
+from unittest import mock
+
+import asyncio
+import sys
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    EVALUATION: str = "@color: Blue\n@accuracy: 100%\n@reasoning: The AI answered.\n@tips: None"
+
+    # Setup tests
+    def setUp(self):
+        self.llm = mock.Mock(
+            invoke=mock.Mock(return_value=AIMessage(content=self.EVALUATION)),
+            ainvoke=mock.AsyncMock(return_value=AIMessage(content=self.EVALUATION)),
+        )
+        self.expected: AccResponse = stub_response(0)
+        self.patches = [
+            mock.patch("askai.core.router.evaluation._evaluation_prompt", return_value="Evaluate the response"),
+            mock.patch.object(lc_llm, "create_chat_model", return_value=self.llm),
+            mock.patch.object(StageCache, "is_enabled", new_callable=mock.PropertyMock, return_value=False),
+            mock.patch.object(AccResponse, "parse_response", return_value=self.expected),
+            mock.patch.object(SharedInstances, "engine", new_callable=mock.PropertyMock),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    # Teardown tests
+    def tearDown(self):
+        for patch in reversed(self.patches):
+            patch.stop()
+
+    # TEST CASES ----------
+
+    def test_should_evaluate_responses_without_blocking(self):
+        acc_response: AccResponse = asyncio.run(aeval_response("What is the time?", "It's 10 AM."))
+        self.assertEqual(self.expected, acc_response)
+        self.llm.ainvoke.assert_awaited_once_with("Evaluate the response")
+        AccResponse.parse_response.assert_called_once_with(self.EVALUATION)
+        self.llm.invoke.assert_not_called()
+
+    def test_should_evaluate_responses_as_the_sync_version(self):
+        self.assertEqual(
+            eval_response("What is the time?", "It's 10 AM."),
+            asyncio.run(aeval_response("What is the time?", "It's 10 AM.")),
+        )
+
+    def test_should_not_evaluate_empty_responses(self):
+        with self.assertRaises(InaccurateResponse):
+            asyncio.run(aeval_response("What is the time?", ""))
+        self.llm.ainvoke.assert_not_awaited()
+
+    def test_should_fail_when_the_evaluation_is_empty(self):
+        self.llm.ainvoke.return_value = AIMessage(content="")
+        with self.assertRaises(InaccurateResponse):
+            asyncio.run(aeval_response("What is the time?", "It's 10 AM."))
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
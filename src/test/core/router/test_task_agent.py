@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.router
+      @file: test_task_agent.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.askai_events import events
+from askai.core.router.task_agent import agent, TaskAgent
+from askai.core.support.chat_session import ChatSession
+from askai.core.support.shared_instances import shared
+from pathlib import Path
+from unittest import mock
+
+import asyncio
+import sys
+import tempfile
+import unittest
+
+
+class FakeEngine:
+    """Stand-in for the AI engine of the session: only the model limits are used by the session."""
+
+    def ai_token_limit(self) -> int:
+        return 1000
+
+    def ai_model_name(self) -> str:
+        return "gpt-4o-mini"
+
+
+class TestClass(unittest.TestCase):
+
+    # Setup tests
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.lc_agent = mock.Mock(ainvoke=mock.AsyncMock())
+        self.patches = [
+            mock.patch("askai.core.component.context_journal.JOURNAL_DIR", Path(self.tmp_dir.name)),
+            mock.patch.object(events.reply, "emit"),
+            mock.patch.object(TaskAgent, "_create_lc_agent", return_value=self.lc_agent),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self.session = ChatSession("task-agent", FakeEngine(), "DEFAULT")
+
+    # Teardown tests
+    def tearDown(self):
+        for patch in reversed(self.patches):
+            patch.stop()
+        self.tmp_dir.cleanup()
+
+    # TEST CASES ----------
+
+    def test_should_invoke_the_agent_without_blocking(self):
+        self.lc_agent.ainvoke.return_value = {"output": "There are 3 files in your downloads."}
+        with self.session.activate():
+            output: str = asyncio.run(agent.ainvoke("List my downloads"))
+            history: str = shared.context.stringify("HISTORY")
+        self.assertEqual("There are 3 files in your downloads.", output)
+        self.lc_agent.ainvoke.assert_awaited_once_with({"input": "List my downloads"})
+        self.assertIn("List my downloads", history)
+        self.assertIn("There are 3 files in your downloads.", history)
+
+    def test_should_reply_errors_as_the_task_output(self):
+        self.lc_agent.ainvoke.side_effect = ValueError("Could not parse the LLM output")
+        self.lc_agent.invoke.side_effect = ValueError("Could not parse the LLM output")
+        with self.session.activate():
+            self.assertEqual("Could not parse the LLM output", asyncio.run(agent.ainvoke("List my downloads")))
+            self.assertEqual("Could not parse the LLM output", agent.invoke("List my downloads"))
+
+    def test_should_not_record_empty_outputs(self):
+        self.lc_agent.ainvoke.return_value = {"output": ""}
+        with self.session.activate():
+            self.assertEqual("", asyncio.run(agent.ainvoke("List my downloads")))
+            self.assertEqual(1, len(shared.context["HISTORY"]))
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -6,6 +6,10 @@
 """Package initialization."""
 
 __all__ = [
+    'test_chat_context',
+    'test_chat_session',
+    'test_context_memory',
+    'test_tokenizer',
     'test_utilities'
 ]
 __version__ = '1.2.15'
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.support
+      @file: test_chat_context.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.support.chat_context import ChatContext
+from askai.core.support.tokenizer import count_tokens
+from askai.exception.exceptions import TokenLengthExceeded
+from concurrent.futures import ThreadPoolExecutor
+
+import sys
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    # TEST CASES ----------
+
+    def test_should_keep_running_length_on_push_evict_and_remove(self):
+        ctx = ChatContext(token_limit=1000, max_context_size=3)
+        for content in ["aa", "bbb", "cccc", "ddddd"]:
+            ctx.push("HISTORY", content)
+        self.assertEqual(3, ctx.size("HISTORY"))
+        self.assertEqual(12, ctx.length("HISTORY"))
+        self.assertEqual("bbb", ctx.remove("HISTORY", 0).content)
+        self.assertEqual(9, ctx.length("HISTORY"))
+        ctx.clear("HISTORY")
+        self.assertEqual(0, ctx.length("HISTORY"))
+
+    def test_should_skip_duplicates_until_evicted(self):
+        ctx = ChatContext(token_limit=1000, max_context_size=2)
+        self.assertTrue(ctx.push("HISTORY", "hello"))
+        self.assertFalse(ctx.push("HISTORY", " hello "))
+        self.assertTrue(ctx.push("HISTORY", "hello", "assistant"))
+        self.assertTrue(ctx.push("HISTORY", "bye"))
+        self.assertTrue(ctx.push("HISTORY", "hello"))
+        self.assertEqual([("human", "bye"), ("human", "hello")], ctx.join("HISTORY"))
+
+    def test_should_count_tokens_once_per_entry(self):
+        ctx = ChatContext(token_limit=1000, max_context_size=2)
+        messages: list[str] = ["What is the size of the Moon?", "About 3,474 km in diameter.", "And the Sun?"]
+        for message in messages:
+            ctx.push("HISTORY", message)
+        ctx.push("EVALUATION", "Be concise.", "system")
+        expected: int = sum(count_tokens(m, ctx.model_name) for m in messages[1:])
+        self.assertEqual(expected, ctx.tokens("HISTORY"))
+        self.assertEqual(expected, sum(e.tokens for e in ctx["HISTORY"]))
+        self.assertEqual(1000 - expected, ctx.remaining_tokens("HISTORY"))
+        self.assertEqual(1000 - expected - ctx.tokens("EVALUATION"), ctx.remaining_tokens())
+
+    def test_should_reuse_flattened_views_until_the_context_changes(self):
+        ctx = ChatContext(token_limit=1000, max_context_size=5)
+        ctx.push("HISTORY", "hello")
+        ctx.push("HISTORY", "hi there", "assistant")
+        text: str = ctx.stringify("HISTORY")
+        self.assertEqual("Human: hello\nAI: hi there", text)
+        self.assertIs(text, ctx.stringify("HISTORY"))
+        history = ctx.flat("HISTORY")
+        history.add_message(history.messages[0])
+        self.assertEqual(2, len(ctx.flat("HISTORY").messages))
+        ctx.push("HISTORY", "bye")
+        self.assertEqual("Human: hello\nAI: hi there\nHuman: bye", ctx.stringify("HISTORY"))
+        ctx.clear("HISTORY")
+        self.assertEqual("", ctx.stringify("HISTORY"))
+
+    def test_should_replace_oldest_entries_by_summary_past_high_water(self):
+        ctx = ChatContext(token_limit=200, max_context_size=20)
+        requests: list = []
+        ctx.compact_with(lambda key, entries: requests.append((key, entries)), 0.5)
+        for i in range(4):
+            ctx.push("HISTORY", f"message {i} " + "word " * 30)
+        self.assertEqual(1, len(requests))
+        key, entries = requests[0]
+        self.assertEqual(entries, list(ctx["HISTORY"])[: len(entries)])
+        ctx.compact(key, entries, "Summary of the first messages.")
+        self.assertEqual(("system", "Summary of the first messages."), ctx.join("HISTORY")[0])
+        self.assertEqual(sum(e.tokens for e in ctx["HISTORY"]), ctx.tokens("HISTORY"))
+        self.assertEqual(4 - len(entries) + 1, ctx.size("HISTORY"))
+
+    def test_should_drop_oldest_entries_instead_of_raising_when_compacting(self):
+        ctx = ChatContext(token_limit=100, max_context_size=20)
+        ctx.compact_with(lambda key, entries: None, 0.9)
+        for i in range(10):
+            ctx.push("HISTORY", f"message {i} " + "word " * 20)
+        self.assertLessEqual(ctx.tokens("HISTORY"), 100)
+        self.assertTrue(ctx.join("HISTORY")[-1][1].startswith("message 9"))
+
+    def test_should_raise_when_token_limit_is_exceeded(self):
+        ctx = ChatContext(token_limit=100, max_context_size=10)
+        ctx.push("HISTORY", "hello " * 60)
+        self.assertRaises(TokenLengthExceeded, ctx.push, "HISTORY", "world " * 60)
+        self.assertRaises(TokenLengthExceeded, ctx.join, "HISTORY", "HISTORY")
+
+    def test_should_keep_counters_consistent_under_concurrent_access(self):
+        ctx = ChatContext(token_limit=100_000, max_context_size=50)
+
+        def _writer(n: int) -> None:
+            for i in range(500):
+                ctx.push("HISTORY", f"writer {n} message {i}", "assistant" if i % 2 else "human")
+
+        def _reader() -> None:
+            for _ in range(500):
+                messages = ctx.flat("HISTORY").messages
+                self.assertLessEqual(len(messages), 50)
+                ctx.stringify("HISTORY")
+
+        # Switch threads as often as possible, so unsynchronized reads and writes would interleave.
+        interval: float = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [executor.submit(_writer, n) for n in range(4)] + [executor.submit(_reader) for _ in range(4)]
+                list(map(lambda f: f.result(), futures))
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(50, ctx.size("HISTORY"))
+        self.assertEqual(sum(e.tokens for e in ctx["HISTORY"]), ctx.tokens("HISTORY"))
+        self.assertEqual(sum(len(e.content) for e in ctx["HISTORY"]), ctx.length("HISTORY"))
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.support
+      @file: test_chat_session.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.component.context_compactor import compactor
+from askai.core.component.context_journal import ContextJournal
+from askai.core.component.long_term_memory import long_term_memory
+from askai.core.component.session_manager import sessions
+from askai.core.engine.engine_factory import EngineFactory
+from askai.core.support.chat_session import ChatSession
+from askai.core.support.shared_instances import shared
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import sys
+import tempfile
+import unittest
+
+
+class FakeEngine:
+    """Stand-in for the AI engine of a session: only the model limits are used by the session."""
+
+    def ai_token_limit(self) -> int:
+        return 1000
+
+    def ai_model_name(self) -> str:
+        return "gpt-4o-mini"
+
+
+class TestClass(unittest.TestCase):
+
+    # Setup tests
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.journal_dir = mock.patch("askai.core.component.context_journal.JOURNAL_DIR", Path(self.tmp_dir.name))
+        self.journal_dir.start()
+        self.new_engine = mock.patch.object(EngineFactory, "new_engine", side_effect=lambda *_: FakeEngine())
+        self.new_engine.start()
+
+    # Teardown tests
+    def tearDown(self):
+        for session_id in ["alice", "bob"]:
+            sessions.close(session_id)
+        self.new_engine.stop()
+        self.journal_dir.stop()
+        self.tmp_dir.cleanup()
+
+    # TEST CASES ----------
+
+    def test_should_create_sessions_without_replacing_the_active_engine(self):
+        active_engine = EngineFactory._ACTIVE_AI_ENGINE
+        with mock.patch.object(compactor, "attach") as attach:
+            session: ChatSession = sessions.create("alice", "openai", "gpt-4o-mini", "DEFAULT")
+        attach.assert_called_once_with(session.context)
+        self.assertIs(active_engine, EngineFactory._ACTIVE_AI_ENGINE)
+        self.assertIs(session, sessions.get("alice"))
+
+    def test_should_resolve_shared_instances_to_the_active_session(self):
+        alice: ChatSession = sessions.create("alice", "openai", "gpt-4o-mini", "DEFAULT")
+        bob: ChatSession = sessions.create("bob", "openai", "gpt-4o-mini", "DEFAULT")
+
+        def _serve(session: ChatSession, question: str) -> tuple[str, str]:
+            with session.activate():
+                shared.context.push("HISTORY", question)
+                return shared.context.stringify("HISTORY"), long_term_memory.owner
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            replies = list(executor.map(_serve, [alice, bob], ["hello from alice", "hello from bob"]))
+        self.assertIn("hello from alice", replies[0][0])
+        self.assertNotIn("hello from bob", replies[0][0])
+        self.assertEqual(["alice", "bob"], [owner for _, owner in replies])
+        self.assertIsNot(alice.context, shared.context)
+        self.assertEqual("", long_term_memory.owner)
+
+    def test_should_journal_sessions_apart_from_the_cli_conversation(self):
+        session: ChatSession = sessions.create("alice", "openai", "gpt-4o-mini", "DEFAULT")
+        session.context.push("HISTORY", "hello")
+        session.context.save()
+        self.assertEqual("alice", ContextJournal(ChatSession.JOURNAL_NAME).latest_session())
+        self.assertIsNone(ContextJournal("context").latest_session())
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.support
+      @file: test_context_memory.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.support.chat_context import ChatContext
+from askai.core.support.context_memory import ContextMemory
+
+import sys
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    # Setup tests
+    def setUp(self):
+        self.ctx = ChatContext(token_limit=1000, max_context_size=10)
+        self.ctx.push("HISTORY", "list my downloads")
+        self.ctx.push("HISTORY", "You have 3 files in ~/Downloads.", "assistant")
+        self.memory = ContextMemory.of(self.ctx)
+
+    # TEST CASES ----------
+
+    def test_should_leave_the_pending_task_out_of_the_window(self):
+        task: str = "Open the most recent file in ~/Downloads."
+        self.ctx.push("HISTORY", "open the newest one")
+        self.ctx.push("HISTORY", task, "assistant")
+        window = self.memory.load_memory_variables({"input": task})["chat_history"]
+        self.assertEqual(
+            ["list my downloads", "You have 3 files in ~/Downloads.", "open the newest one"],
+            [m.content for m in window],
+        )
+
+    def test_should_keep_the_last_entry_when_it_is_not_the_input(self):
+        window = self.memory.load_memory_variables({"input": "Summarize the conversation."})["chat_history"]
+        self.assertEqual(["list my downloads", "You have 3 files in ~/Downloads."], [m.content for m in window])
+
+    def test_should_not_save_the_agent_exchange(self):
+        self.memory.save_context({"input": "task"}, {"output": "done"})
+        self.assertEqual(2, self.ctx.size("HISTORY"))
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+   @project: HsPyLib-AskAI
+   @package: askai.test.core.support
+      @file: test_tokenizer.py
+   @created: Sat, 17 Oct 2026
+    @author: "<B>H</B>ugo <B>S</B>aporetti <B>J</B>unior
+      @site: "https://github.com/yorevs/hspylib")
+   @license: MIT - Please refer to <https://opensource.org/licenses/MIT>
+
+   Copyright (c) 2024, AskAI
+"""
+from askai.core.support.tokenizer import count_tokens, count_tokens_batch, encoding_for
+
+import sys
+import unittest
+
+
+class TestClass(unittest.TestCase):
+
+    # TEST CASES ----------
+
+    def test_should_reuse_the_model_encoding(self):
+        encoding_for("gpt-4o-mini")
+        hits: int = encoding_for.cache_info().hits
+        encoding_for("gpt-4o-mini")
+        self.assertEqual(hits + 1, encoding_for.cache_info().hits)
+
+    def test_should_count_batches_as_single_texts(self):
+        texts: list[str] = ["", "Hello", "The quick brown fox jumps over the lazy dog.", "<|endoftext|> " * 10]
+        self.assertEqual([count_tokens(t, "gpt-4o-mini") for t in texts], count_tokens_batch(texts, "gpt-4o-mini"))
+        self.assertEqual([], count_tokens_batch([], "gpt-4o-mini"))
+
+
+# Program entry point.
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestClass)
+    unittest.TextTestRunner(verbosity=2, failfast=True, stream=sys.stdout).run(suite)
@@ -12,9 +12,12 @@
 
    Copyright (c) 2024, AskAI
 """
-from askai.core.support.utilities import encode_image, extract_codeblock, extract_path, media_type_of
+from askai.core.askai_events import events
+from askai.core.support.utilities import encode_image, extract_codeblock, extract_path, media_type_of, stream_text
+from langchain_core.messages import AIMessageChunk
 from pathlib import Path
 from textwrap import dedent
+from unittest import mock
 
 import base64
 import os
@@ -147,6 +150,18 @@ class TestClass(unittest.TestCase):
         finally:
             os.unlink(tmp_file_name)
 
+    def test_stream_text(self):
+        chunks = [AIMessageChunk(content="Hello"), AIMessageChunk(content=""), ",", None, " world!"]
+        with mock.patch.object(events.stream, "emit") as emit:
+            self.assertEqual("Hello, world!", stream_text(chunks))
+        expected = [
+            mock.call(text="Hello"),
+            mock.call(text=","),
+            mock.call(text=" world!"),
+            mock.call(text="Hello, world!", done=True),
+        ]
+        self.assertEqual(expected, emit.call_args_list)
+
 
 # Program entry point.
 if __name__ == "__main__":